@@ -1,8 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
+from inira.setting.websocket.user_cache import invalidate_ws_user
+
 User = get_user_model()
 
 
@@ -64,3 +66,43 @@ def save_user_profile(sender, instance, **kwargs):
     """Guardar perfil cuando se guarda el usuario"""
     if hasattr(instance, "profile"):
         instance.profile.save()
+
+
+def _invalidate_on_commit(user_ids):
+    # 🔹 Tras el commit: invalidar antes dejaría que otra conexión vuelva a
+    # cachear el registro viejo mientras la transacción sigue abierta
+    user_ids = list(user_ids)
+
+    def invalidate():
+        for user_id in user_ids:
+            invalidate_ws_user(user_id)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_ws_user_on_change(sender, instance, **kwargs):
+    """Invalida el usuario cacheado de los WebSockets"""
+    _invalidate_on_commit([instance.pk])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_ws_user_on_groups_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        if action.startswith("post_"):
+            _invalidate_on_commit([instance.pk])
+        return
+
+    # Cambio desde el lado del grupo (group.user_set.add/remove/clear)
+    if action in ("post_add", "post_remove"):
+        user_ids = pk_set or []
+    elif action == "pre_clear":
+        # Se evalúa ya: tras el clear el grupo no tiene usuarios
+        user_ids = list(instance.user_set.values_list("id", flat=True))
+    else:
+        return
+
+    _invalidate_on_commit(user_ids)
@@ -69,23 +69,19 @@ class ComunidadCanalAdmin(admin.ModelAdmin):
     )
     list_filter = ('is_info', 'is_read_only', 'created_at')
     search_fields = ('name', 'description', 'comunidad__name')
-    readonly_fields = ('id', 'created_at')
+    readonly_fields = ('id', 'created_at', 'post_count')
     
     fieldsets = (
         ('Información básica', {
             'fields': ('id', 'comunidad', 'name', 'description')
         }),
         ('Configuración', {
-            'fields': ('is_info', 'is_read_only')
+            'fields': ('is_info', 'is_read_only', 'post_count')
         }),
         ('Fechas', {
             'fields': ('created_at',)
         }),
     )
-    
-    def post_count(self, obj):
-        return obj.posts.count()
-    post_count.short_description = 'Posts'
 
 
 @admin.register(ComunidadPost)
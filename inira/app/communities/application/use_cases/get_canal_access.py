@@ -0,0 +1,26 @@
+# inira/app/communities/application/use_cases/get_canal_access.py
+
+from inira.app.communities.domain.repositories.canal_repository import CanalRepository
+
+WRITE_ROLES = {"owner", "admin"}
+
+
+class GetCanalAccess:
+    def __init__(self, canal_repository: CanalRepository):
+        self.canal_repository = canal_repository
+
+    def execute(self, *, canal_id: str, user_id: int) -> dict:
+        """
+        Membresía y permiso de escritura del usuario en un canal.
+        Una consulta; el repositorio la cachea por (usuario, canal).
+        """
+        access = self.canal_repository.get_access(canal_id=canal_id, user_id=user_id)
+
+        is_member = bool(access and access["role"])
+
+        return {
+            "comunidad_id": str(access["comunidad_id"]) if access else None,
+            "is_member": is_member,
+            "can_write": is_member
+            and (not access["is_read_only"] or access["role"] in WRITE_ROLES),
+        }
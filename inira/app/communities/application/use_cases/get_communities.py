@@ -8,9 +8,18 @@ class GetCommunities:
     def __init__(self, comunidad_repository: ComunidadRepository):
         self.comunidad_repository = comunidad_repository
 
-    def execute(self, *, id: str = None, user_id: int, page: int = 1, page_size: int = 10, **filters):
+    def execute(self, *, id: str = None, user_id: int, page: int = 1, page_size: int = 10, cursor: str = None, **filters):
         if id:
             return self.comunidad_repository.find_by_id(id, user_id=user_id)  # ✅ Agregar user_id
+
+        # Paginación por cursor (opt-in), sin count
+        if cursor is not None:
+            return self.comunidad_repository.find_all_by_cursor(
+                cursor=cursor,
+                page_size=page_size,
+                user_id=user_id,
+                **filters
+            )
         
         return self.comunidad_repository.find_all(
             page=page,
@@ -4,6 +4,9 @@ from rest_framework.exceptions import ValidationError
 
 from inira.app.communities.domain.repositories.canal_repository import CanalRepository
 from inira.app.communities.domain.repositories.member_repository import MemberRepository
+from inira.app.communities.domain.repositories.read_marker_repository import (
+    ReadMarkerRepository,
+)
 
 
 class GetCommunityChannels:
@@ -11,14 +14,26 @@ class GetCommunityChannels:
     def __init__(
         self,
         canal_repository: CanalRepository,
-        member_repository: MemberRepository
+        member_repository: MemberRepository,
+        read_marker_repository: ReadMarkerRepository,
     ):
         self.canal_repository = canal_repository
         self.member_repository = member_repository
+        self.read_marker_repository = read_marker_repository
 
     def execute(self, *, comunidad_id: str, user_id: int):
         # Verificar que es miembro
         if not self.member_repository.exists(comunidad_id=comunidad_id, user_id=user_id):
             raise ValidationError("Debes ser miembro de la comunidad para ver sus canales")
 
-        return self.canal_repository.find_by_comunidad(comunidad_id)
\ No newline at end of file
+        canales = self.canal_repository.find_by_comunidad(comunidad_id)
+
+        unread = self.read_marker_repository.unread_counts(
+            comunidad_id=comunidad_id,
+            user_id=user_id,
+            post_counts={canal.id: canal.post_count for canal in canales},
+        )
+        for canal in canales:
+            canal.unread_count = unread[canal.id]
+
+        return canales
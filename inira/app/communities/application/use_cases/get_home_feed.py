@@ -0,0 +1,33 @@
+# inira/app/communities/application/use_cases/get_home_feed.py
+
+from typing import Optional
+
+from inira.app.communities.domain.repositories.feed_repository import FeedRepository
+from inira.app.communities.domain.repositories.post_repository import PostRepository
+
+
+class GetHomeFeed:
+    def __init__(
+        self,
+        feed_repository: FeedRepository,
+        post_repository: PostRepository,
+    ):
+        self.feed_repository = feed_repository
+        self.post_repository = post_repository
+
+    def execute(
+        self, *, user_id: int, cursor: Optional[str] = None, page_size: int = 20
+    ):
+        """
+        Últimos posts de todos los canales de las comunidades del usuario,
+        paginados por cursor. La estrategia (consulta mezclada o timeline
+        en Redis) la define COMMUNITY_FEED_STRATEGY.
+        """
+        ids, next_cursor = self.feed_repository.page_ids(
+            user_id=user_id, cursor=cursor, page_size=page_size
+        )
+
+        return {
+            "results": self.post_repository.find_by_ids(ids),
+            "next_cursor": next_cursor,
+        }
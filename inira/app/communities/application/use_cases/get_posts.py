@@ -19,13 +19,21 @@ class GetPosts:
         self.canal_repository = canal_repository
         self.member_repository = member_repository
 
-    def execute(self, *, canal_id: str, user_id: int, page: int = 1, page_size: int = 20):
+    def execute(self, *, canal_id: str, user_id: int, page: int = 1, page_size: int = 20, cursor: str = None):
         canal = self.canal_repository.find_by_id(canal_id)
 
         # Verificar que es miembro de la comunidad
         if not self.member_repository.exists(comunidad_id=canal.comunidad_id, user_id=user_id):
             raise ValidationError("Debes ser miembro de la comunidad para ver los posts")
 
+        # Paginación por cursor (opt-in), sin count
+        if cursor is not None:
+            return self.post_repository.find_by_canal_cursor(
+                canal_id=canal_id,
+                cursor=cursor,
+                page_size=page_size
+            )
+
         return self.post_repository.find_by_canal(
             canal_id=canal_id,
             page=page,
@@ -0,0 +1,22 @@
+# inira/app/communities/application/use_cases/get_posts_since.py
+
+from inira.app.communities.domain.repositories.post_repository import PostRepository
+
+
+class GetPostsSince:
+    """
+    Posts de un canal posteriores a un cursor, para reanudar un websocket.
+
+    Recorre el timeline por (canal_id, created_at, id) en páginas keyset;
+    la membresía la validó el consumer al conectar.
+    """
+
+    def __init__(self, post_repository: PostRepository):
+        self.post_repository = post_repository
+
+    def execute(self, *, canal_id: str, since: str, page_size: int = 100):
+        return self.post_repository.find_by_canal_cursor(
+            canal_id=canal_id,
+            cursor=since,
+            page_size=page_size,
+        )
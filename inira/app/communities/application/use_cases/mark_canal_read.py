@@ -0,0 +1,43 @@
+# inira/app/communities/application/use_cases/mark_canal_read.py
+
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied
+
+from inira.app.communities.application.use_cases.get_canal_access import (
+    GetCanalAccess,
+)
+from inira.app.communities.domain.repositories.read_marker_repository import (
+    ReadMarkerRepository,
+)
+from inira.app.shared.pagination import decode_cursor
+
+
+class MarkCanalRead:
+    def __init__(
+        self,
+        read_marker_repository: ReadMarkerRepository,
+        get_canal_access: GetCanalAccess,
+    ):
+        self.read_marker_repository = read_marker_repository
+        self.get_canal_access = get_canal_access
+
+    def execute(self, *, canal_id: str, user_id: int, cursor: str = None):
+        """
+        Marca el canal como leído hasta el post del `cursor` (o hasta ahora).
+        La membresía se valida con el acceso cacheado del canal.
+        """
+        access = self.get_canal_access.execute(canal_id=canal_id, user_id=user_id)
+        if not access["is_member"]:
+            raise PermissionDenied("Debes ser miembro de la comunidad")
+
+        read_at = decode_cursor(cursor)[0] if cursor else timezone.now()
+
+        changed = self.read_marker_repository.mark_read(
+            canal_id=canal_id, user_id=user_id, read_at=read_at
+        )
+
+        return {
+            "canal_id": str(canal_id),
+            "last_read_at": read_at,
+            "changed": changed,
+        }
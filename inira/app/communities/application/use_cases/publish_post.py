@@ -0,0 +1,44 @@
+# inira/app/communities/application/use_cases/publish_post.py
+
+from rest_framework.exceptions import ValidationError
+
+from inira.app.communities.domain.repositories.post_repository import PostRepository
+
+MAX_CONTENT_LENGTH = 5000
+
+
+class PublishPost:
+    """
+    Publica un post desde el websocket del canal.
+
+    La membresía y el permiso de escritura ya los resolvió el consumer
+    (GetCanalAccess, cacheado), así que aquí solo se valida el contenido.
+    """
+
+    def __init__(self, post_repository: PostRepository):
+        self.post_repository = post_repository
+
+    def execute(
+        self,
+        *,
+        comunidad_id: str,
+        canal_id: str,
+        author_id: int,
+        content: str,
+    ):
+        content = (content or "").strip()
+
+        if not content:
+            raise ValidationError("El contenido no puede estar vacío")
+
+        if len(content) > MAX_CONTENT_LENGTH:
+            raise ValidationError(
+                f"El contenido no puede superar {MAX_CONTENT_LENGTH} caracteres"
+            )
+
+        return self.post_repository.create(
+            comunidad_id=comunidad_id,
+            canal_id=canal_id,
+            author_id=author_id,
+            content=content,
+        )
@@ -30,6 +30,7 @@ class CanalEntity:
     is_read_only: bool
     created_at: datetime
     post_count: int
+    unread_count: int = 0
 
 
 @dataclass
@@ -1,7 +1,7 @@
 # inira/app/communities/domain/repositories/canal_repository.py
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from inira.app.communities.domain.entities import CanalEntity
 
@@ -30,4 +30,9 @@ class CanalRepository(ABC):
 
     @abstractmethod
     def exists(self, canal_id: str) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_access(self, *, canal_id: str, user_id: int) -> Optional[dict]:
+        """Canal + rol del usuario en su comunidad en una sola consulta (None si no existe)"""
+        pass
@@ -1,7 +1,7 @@
 # inira/app/communities/domain/repositories/comunidad_repository.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from inira.app.communities.domain.entities import ComunidadEntity
 
@@ -17,6 +17,13 @@ class ComunidadRepository(ABC):
         """Retorna {'results': List[ComunidadEntity], 'count': int}"""
         pass
 
+    @abstractmethod
+    def find_all_by_cursor(
+        self, *, cursor: Optional[str], page_size: int, user_id: int = None, **filters
+    ) -> Dict[str, any]:
+        """Retorna {'results': List[ComunidadEntity], 'next_cursor': str | None}"""
+        pass
+
     @abstractmethod
     def create(
         self,
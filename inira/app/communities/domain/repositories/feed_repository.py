@@ -0,0 +1,17 @@
+# inira/app/communities/domain/repositories/feed_repository.py
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+
+class FeedRepository(ABC):
+    @abstractmethod
+    def page_ids(
+        self, *, user_id: int, cursor: Optional[str], page_size: int
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        IDs de los posts más recientes de todas las comunidades del usuario,
+        en orden (created_at, id) descendente.
+        Retorna (ids de la página, cursor de la siguiente página o None)
+        """
+        pass
@@ -1,7 +1,7 @@
 # inira/app/communities/domain/repositories/post_repository.py
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List, Optional
 
 from inira.app.communities.domain.entities import PostEntity
 
@@ -13,6 +13,13 @@ class PostRepository(ABC):
         """Retorna {'results': List[PostEntity], 'count': int}"""
         pass
 
+    @abstractmethod
+    def find_by_canal_cursor(
+        self, *, canal_id: str, cursor: Optional[str], page_size: int
+    ) -> Dict[str, any]:
+        """Retorna {'results': List[PostEntity], 'next_cursor': str | None}"""
+        pass
+
     @abstractmethod
     def create(
         self,
@@ -22,4 +29,9 @@ class PostRepository(ABC):
         author_id: int,
         content: str,
     ) -> PostEntity:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def find_by_ids(self, ids: List[str]) -> List[PostEntity]:
+        """Posts en el mismo orden de `ids`"""
+        pass
@@ -0,0 +1,23 @@
+# inira/app/communities/domain/repositories/read_marker_repository.py
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict
+
+
+class ReadMarkerRepository(ABC):
+    @abstractmethod
+    def mark_read(self, *, canal_id: str, user_id: int, read_at: datetime) -> bool:
+        """Avanza el marcador de lectura (nunca retrocede). True si cambió."""
+        pass
+
+    @abstractmethod
+    def unread_counts(
+        self, *, comunidad_id: str, user_id: int, post_counts: Dict[str, int]
+    ) -> Dict[str, int]:
+        """
+        {canal_id: posts no leídos} de todos los canales de la comunidad.
+        `post_counts` es el post_count actual de cada canal; una implementación
+        cacheada lo usa para sumar los posts nuevos sin volver a contar.
+        """
+        pass
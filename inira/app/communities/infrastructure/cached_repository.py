@@ -0,0 +1,127 @@
+# inira/app/communities/infrastructure/cached_repository.py
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from django.db import transaction
+
+from inira.app.communities.domain.entities import CanalEntity
+from inira.app.communities.domain.repositories.canal_repository import CanalRepository
+from inira.app.communities.domain.repositories.read_marker_repository import (
+    ReadMarkerRepository,
+)
+from inira.app.communities.infrastructure.models import (
+    canal_access_namespace,
+    unread_namespace,
+)
+from inira.app.shared.cache import bump_namespace, get_or_set, make_key
+
+# 🔹 Corto: absorbe las reconexiones masivas (deploys) sin retrasar cambios de rol
+ACCESS_TIMEOUT = 60
+
+UNREAD_TIMEOUT = 300
+
+
+class CachedCanalRepository(CanalRepository):
+    """
+    Cache-aside (Redis) del acceso a canales sobre otro CanalRepository.
+
+    get_access se cachea por (usuario, canal); los cambios de membresía
+    incrementan el namespace del usuario (ver models.py).
+    """
+
+    def __init__(self, repository: CanalRepository):
+        self.repository = repository
+
+    def find_by_comunidad(self, comunidad_id: str) -> List[CanalEntity]:
+        return self.repository.find_by_comunidad(comunidad_id)
+
+    def find_by_id(self, canal_id: str) -> CanalEntity:
+        return self.repository.find_by_id(canal_id)
+
+    def create(
+        self,
+        *,
+        comunidad_id: str,
+        name: str,
+        description: str,
+        is_info: bool,
+        is_read_only: bool,
+    ) -> CanalEntity:
+        return self.repository.create(
+            comunidad_id=comunidad_id,
+            name=name,
+            description=description,
+            is_info=is_info,
+            is_read_only=is_read_only,
+        )
+
+    def exists(self, canal_id: str) -> bool:
+        return self.repository.exists(canal_id)
+
+    def get_access(self, *, canal_id: str, user_id: int) -> Optional[dict]:
+        namespace = canal_access_namespace(user_id)
+
+        return get_or_set(
+            make_key(namespace, "canal", canal_id=str(canal_id)),
+            lambda: self.repository.get_access(canal_id=canal_id, user_id=user_id),
+            namespace="canal_access",
+            timeout=ACCESS_TIMEOUT,
+        )
+
+
+class CachedReadMarkerRepository(ReadMarkerRepository):
+    """
+    Cache-aside (Redis) de los no leídos sobre otro ReadMarkerRepository.
+
+    El conteo agrupado se cachea junto con el post_count de cada canal en
+    ese momento; los posts nuevos se suman después con la diferencia del
+    contador. Los posts propios no rompen la cuenta porque publicar avanza
+    el marcador del autor (ver models.py), lo que invalida el namespace.
+    """
+
+    def __init__(self, repository: ReadMarkerRepository):
+        self.repository = repository
+
+    def mark_read(self, *, canal_id: str, user_id: int, read_at: datetime) -> bool:
+        changed = self.repository.mark_read(
+            canal_id=canal_id, user_id=user_id, read_at=read_at
+        )
+
+        if changed:
+            # Tras el commit: un snapshot recalculado antes vería el marcador viejo
+            transaction.on_commit(lambda: bump_namespace(unread_namespace(user_id)))
+
+        return changed
+
+    def unread_counts(
+        self, *, comunidad_id: str, user_id: int, post_counts: Dict[str, int]
+    ) -> Dict[str, int]:
+        namespace = unread_namespace(user_id)
+
+        snapshot = get_or_set(
+            make_key(namespace, "comunidad", comunidad_id=str(comunidad_id)),
+            lambda: {
+                "counts": self.repository.unread_counts(
+                    comunidad_id=comunidad_id,
+                    user_id=user_id,
+                    post_counts=post_counts,
+                ),
+                "post_counts": post_counts,
+            },
+            namespace="unread",
+            timeout=UNREAD_TIMEOUT,
+        )
+
+        if not post_counts.keys() <= snapshot["post_counts"].keys():
+            # Canal creado después del snapshot: no hay base para la diferencia
+            bump_namespace(namespace)
+            return self.repository.unread_counts(
+                comunidad_id=comunidad_id, user_id=user_id, post_counts=post_counts
+            )
+
+        return {
+            canal_id: snapshot["counts"].get(canal_id, 0)
+            + max(0, post_count - snapshot["post_counts"].get(canal_id, 0))
+            for canal_id, post_count in post_counts.items()
+        }
@@ -1,6 +1,7 @@
 # inira/app/communities/infrastructure/container.py
 
 from dependency_injector import containers, providers
+from django.conf import settings
 
 from inira.app.communities.infrastructure.repositories.comunidad_repository_impl import (
     ComunidadRepositoryImpl,
@@ -14,6 +15,17 @@ from inira.app.communities.infrastructure.repositories.canal_repository_impl imp
 from inira.app.communities.infrastructure.repositories.post_repository_impl import (
     PostRepositoryImpl,
 )
+from inira.app.communities.infrastructure.repositories.read_marker_repository_impl import (
+    ReadMarkerRepositoryImpl,
+)
+from inira.app.communities.infrastructure.cached_repository import (
+    CachedCanalRepository,
+    CachedReadMarkerRepository,
+)
+from inira.app.communities.infrastructure.repositories.feed_repository_impl import (
+    MergedFeedRepositoryImpl,
+    TimelineFeedRepositoryImpl,
+)
 
 from inira.app.communities.application.use_cases.get_communities import GetCommunities
 from inira.app.communities.application.use_cases.create_community import CreateCommunity
@@ -24,7 +36,18 @@ from inira.app.communities.application.use_cases.get_community_channels import (
 )
 from inira.app.communities.application.use_cases.create_channel import CreateChannel
 from inira.app.communities.application.use_cases.get_posts import GetPosts
+from inira.app.communities.application.use_cases.get_canal_access import (
+    GetCanalAccess,
+)
 from inira.app.communities.application.use_cases.create_post import CreatePost
+from inira.app.communities.application.use_cases.mark_canal_read import (
+    MarkCanalRead,
+)
+from inira.app.communities.application.use_cases.get_home_feed import GetHomeFeed
+from inira.app.communities.application.use_cases.publish_post import PublishPost
+from inira.app.communities.application.use_cases.get_posts_since import (
+    GetPostsSince,
+)
 from inira.app.communities.application.use_cases.get_community_members import (
     GetCommunityMembers,
 )
@@ -39,8 +62,26 @@ class CommunitiesContainer(containers.DeclarativeContainer):
     # Repositories
     comunidad_repository = providers.Factory(ComunidadRepositoryImpl)
     member_repository = providers.Factory(MemberRepositoryImpl)
-    canal_repository = providers.Factory(CanalRepositoryImpl)
+    canal_repository = providers.Factory(
+        CachedCanalRepository,
+        repository=providers.Factory(CanalRepositoryImpl),
+    )
     post_repository = providers.Factory(PostRepositoryImpl)
+    read_marker_repository = providers.Factory(
+        CachedReadMarkerRepository,
+        repository=providers.Factory(ReadMarkerRepositoryImpl),
+    )
+
+    # 🔹 COMMUNITY_FEED_STRATEGY = "merge" (consulta en lectura) | "timeline" (fan-out en Redis)
+    merged_feed_repository = providers.Factory(MergedFeedRepositoryImpl)
+    feed_repository = providers.Selector(
+        providers.Callable(lambda: settings.COMMUNITY_FEED_STRATEGY),
+        merge=merged_feed_repository,
+        timeline=providers.Factory(
+            TimelineFeedRepositoryImpl,
+            merged_feed_repository=merged_feed_repository,
+        ),
+    )
 
     # Use Cases - Comunidades
     get_communities = providers.Factory(
@@ -82,6 +123,7 @@ class CommunitiesContainer(containers.DeclarativeContainer):
         GetCommunityChannels,
         canal_repository=canal_repository,
         member_repository=member_repository,
+        read_marker_repository=read_marker_repository,
     )
 
     create_channel = providers.Factory(
@@ -104,3 +146,32 @@ class CommunitiesContainer(containers.DeclarativeContainer):
         canal_repository=canal_repository,
         member_repository=member_repository,
     )
+
+    # Use Cases - Websocket del canal
+    publish_post = providers.Factory(
+        PublishPost,
+        post_repository=post_repository,
+    )
+
+    get_posts_since = providers.Factory(
+        GetPostsSince,
+        post_repository=post_repository,
+    )
+
+    get_canal_access = providers.Factory(
+        GetCanalAccess,
+        canal_repository=canal_repository,
+    )
+
+    mark_canal_read = providers.Factory(
+        MarkCanalRead,
+        read_marker_repository=read_marker_repository,
+        get_canal_access=get_canal_access,
+    )
+
+    # Use Cases - Feed
+    get_home_feed = providers.Factory(
+        GetHomeFeed,
+        feed_repository=feed_repository,
+        post_repository=post_repository,
+    )
@@ -46,6 +46,16 @@ get_communities_docs = extend_schema(
             type=OpenApiTypes.INT,
             location=OpenApiParameter.QUERY,
         ),
+        OpenApiParameter(
+            name="cursor",
+            description=(
+                "Activa la paginación por cursor. Enviar vacío para la primera página "
+                "y luego el valor de `next_cursor`. En este modo no se retorna `count`."
+            ),
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
     ],
     responses={
         200: OpenApiTypes.OBJECT,
@@ -11,7 +11,11 @@ from drf_spectacular.types import OpenApiTypes
 get_community_channels_docs = extend_schema(
      tags=["Comunidades - Canales"],
     summary="Obtener canales de una comunidad",
-    description="Obtiene todos los canales de una comunidad específica.",
+    description=(
+        "Obtiene todos los canales de una comunidad específica.\n\n"
+        "`unread_count` cuenta los posts de otros miembros posteriores al "
+        "marcador de lectura del usuario (o a su ingreso a la comunidad)."
+    ),
     parameters=[
         OpenApiParameter(
             name="comunidad_id",
@@ -37,6 +41,7 @@ get_community_channels_docs = extend_schema(
                     "is_read_only": False,
                     "created_at": "2025-01-15T10:05:00Z",
                     "post_count": 15,
+                    "unread_count": 2,
                 },
                 {
                     "id": "d55e8400-e29b-41d4-a716-446655440444",
@@ -46,6 +51,7 @@ get_community_channels_docs = extend_schema(
                     "is_read_only": True,
                     "created_at": "2025-01-15T10:06:00Z",
                     "post_count": 3,
+                    "unread_count": 0,
                 }
             ],
             response_only=True,
@@ -0,0 +1,63 @@
+# inira/app/communities/infrastructure/docs/get_community_feed_docs.py
+
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiExample,
+)
+from drf_spectacular.types import OpenApiTypes
+
+
+get_community_feed_docs = extend_schema(
+    tags=["Comunidades - Posts"],
+    summary="Feed de inicio de mis comunidades",
+    description=(
+        "Últimos posts de todos los canales de las comunidades del usuario, "
+        "del más reciente al más antiguo, en una sola llamada.\n\n"
+        "Paginación por cursor: omitir `cursor` para la primera página y luego "
+        "enviar el valor de `next_cursor`."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="page_size",
+            description="Cantidad de resultados por página (default = 20, máximo = 50)",
+            required=False,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="cursor",
+            description="Valor de `next_cursor` de la página anterior",
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={
+        200: OpenApiTypes.OBJECT,
+        400: OpenApiTypes.OBJECT,
+    },
+    examples=[
+        OpenApiExample(
+            name="Feed de inicio",
+            value={
+                "page_size": 20,
+                "next_cursor": "WyIyMDI2LTEwLTE4VDA4OjIxOjM5LjYwMDA5MCswMDowMCIsImNjMzU3Nzc1Il0",
+                "results": [
+                    {
+                        "id": "f77e8400-e29b-41d4-a716-446655440555",
+                        "comunidad_id": "a12f8400-e29b-41d4-a716-446655440111",
+                        "canal_id": "c44e8400-e29b-41d4-a716-446655440333",
+                        "content": "¿Quién se apunta a la ruta del sábado?",
+                        "created_at": "2026-10-18T08:21:39Z",
+                        "author_name": "Ana Pérez",
+                        "author_image": None,
+                        "cursor": "WyIyMDI2LTEwLTE4VDA4OjIxOjM5WiIsImY3N2U4NDAwIl0",
+                    }
+                ],
+            },
+            response_only=True,
+            status_codes=["200"],
+        ),
+    ],
+)
@@ -42,6 +42,7 @@ post_community_channel_docs = extend_schema(
                 "is_read_only": False,
                 "created_at": "2025-01-24T10:00:00Z",
                 "post_count": 0,
+                "unread_count": 0,
             },
             response_only=True,
             status_codes=["201"],
@@ -0,0 +1,54 @@
+# inira/app/communities/infrastructure/docs/post_community_channel_read_docs.py
+
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiExample,
+)
+from drf_spectacular.types import OpenApiTypes
+
+
+post_community_channel_read_docs = extend_schema(
+    tags=["Comunidades - Canales"],
+    summary="Marcar un canal como leído",
+    description=(
+        "Avanza el marcador de lectura del usuario en el canal hasta el post "
+        "indicado por `cursor` (el campo `cursor` de cada post) o hasta ahora "
+        "si no se envía. El marcador nunca retrocede.\n\n"
+        "También se puede marcar por el websocket del canal con "
+        '`{"type": "read", "cursor": "..."}`.'
+    ),
+    request={
+        "application/json": {
+            "type": "object",
+            "properties": {
+                "canal_id": {
+                    "type": "string",
+                    "format": "uuid",
+                    "example": "c44e8400-e29b-41d4-a716-446655440333",
+                },
+                "cursor": {
+                    "type": "string",
+                    "example": "WyIyMDI2LTEwLTE4VDA4OjIxOjM5LjYwMDA5MCswMDowMCIsImNjMzU3Nzc1Il0",
+                },
+            },
+            "required": ["canal_id"],
+        }
+    },
+    responses={
+        200: OpenApiTypes.OBJECT,
+        400: OpenApiTypes.OBJECT,
+        403: OpenApiTypes.OBJECT,
+    },
+    examples=[
+        OpenApiExample(
+            name="Canal marcado como leído",
+            value={
+                "canal_id": "c44e8400-e29b-41d4-a716-446655440333",
+                "last_read_at": "2026-10-18T08:21:39.600090Z",
+                "changed": True,
+            },
+            response_only=True,
+            status_codes=["200"],
+        ),
+    ],
+)
@@ -1,8 +1,25 @@
 # inira/app/communities/models.py
 
+import logging
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from inira.app.shared.cache import bump_namespace
+
+logger = logging.getLogger(__name__)
+
+
+def canal_access_namespace(user_id) -> str:
+    """Namespace del cache de acceso a canales (membresía y rol) de un usuario."""
+    return f"canal_access:{user_id}"
+
+
+def unread_namespace(user_id) -> str:
+    """Namespace del cache de posts no leídos por canal de un usuario."""
+    return f"unread:{user_id}"
 
 
 class Comunidad(models.Model):
@@ -90,6 +107,11 @@ class ComunidadCanal(models.Model):
     is_info = models.BooleanField(default=False)  
     is_read_only = models.BooleanField(default=False)
 
+    # 🆕 Contador de posts (mantenido al crear/borrar posts, sin Count("posts"))
+    post_count = models.PositiveIntegerField(
+        default=0, help_text="Número de posts del canal"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -128,6 +150,137 @@ class ComunidadPost(models.Model):
     class Meta:
         db_table = "comunidad_posts"
         ordering = ["created_at"]
+        indexes = [
+            # Timeline del canal: paginación keyset y reanudación por `since`
+            models.Index(
+                fields=["canal", "created_at", "id"],
+                name="posts_canal_timeline_idx",
+            ),
+            # Últimos posts de una comunidad
+            models.Index(
+                fields=["comunidad", "created_at"],
+                name="posts_comunidad_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.author} - {self.content[:30]}"
+
+
+class ComunidadCanalRead(models.Model):
+    """
+    Marcador de lectura de un miembro en un canal: los posts posteriores a
+    `last_read_at` cuentan como no leídos.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="canal_reads"
+    )
+
+    canal = models.ForeignKey(
+        ComunidadCanal,
+        on_delete=models.CASCADE,
+        related_name="reads"
+    )
+
+    last_read_at = models.DateTimeField()
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "comunidad_canal_reads"
+        unique_together = ("user", "canal")
+
+    def __str__(self):
+        return f"{self.user} - {self.canal_id} ({self.last_read_at})"
+
+
+@receiver(post_save, sender=ComunidadMember)
+@receiver(post_delete, sender=ComunidadMember)
+def invalidate_canal_access_on_change(sender, instance, **kwargs):
+    user_id = instance.user_id
+    transaction.on_commit(lambda: bump_namespace(canal_access_namespace(user_id)))
+    # joined_at es la base de los no leídos sin marcador
+    transaction.on_commit(lambda: bump_namespace(unread_namespace(user_id)))
+
+    if settings.COMMUNITY_FEED_STRATEGY == "timeline":
+        transaction.on_commit(lambda: _invalidate_feed_timeline(user_id))
+
+
+def _feed_timeline():
+    from inira.app.communities.infrastructure.repositories.feed_repository_impl import (
+        MergedFeedRepositoryImpl,
+        TimelineFeedRepositoryImpl,
+    )
+
+    return TimelineFeedRepositoryImpl(MergedFeedRepositoryImpl())
+
+
+def _fan_out_post(post_id, created_at, comunidad_id):
+    try:
+        _feed_timeline().push(
+            post_id=post_id, created_at=created_at, comunidad_id=comunidad_id
+        )
+    except Exception:
+        # El timeline es derivable: se reconstruye desde la base de datos
+        logger.exception(f"[FEED] Error en fan-out del post {post_id}")
+
+
+def _invalidate_feed_timeline(user_id):
+    try:
+        _feed_timeline().invalidate(user_id)
+    except Exception:
+        logger.exception(f"[FEED] Error invalidando el timeline del usuario {user_id}")
+
+
+@receiver(post_save, sender=ComunidadPost)
+def fan_out_post_to_timelines(sender, instance, created, **kwargs):
+    if created and settings.COMMUNITY_FEED_STRATEGY == "timeline":
+        post_id, created_at = instance.id, instance.created_at
+        comunidad_id = instance.comunidad_id
+        transaction.on_commit(
+            lambda: _fan_out_post(post_id, created_at, comunidad_id)
+        )
+
+
+def _read_markers():
+    from inira.app.communities.infrastructure.cached_repository import (
+        CachedReadMarkerRepository,
+    )
+    from inira.app.communities.infrastructure.repositories.read_marker_repository_impl import (
+        ReadMarkerRepositoryImpl,
+    )
+
+    return CachedReadMarkerRepository(ReadMarkerRepositoryImpl())
+
+
+@receiver(post_save, sender=ComunidadPost)
+def advance_author_read_marker(sender, instance, created, **kwargs):
+    # Publicar marca el canal como leído para el autor: así sus propios posts
+    # no cuentan como no leídos ni en el conteo ni en la diferencia de post_count
+    if created:
+        _read_markers().mark_read(
+            canal_id=instance.canal_id,
+            user_id=instance.author_id,
+            read_at=instance.created_at,
+        )
+
+
+@receiver(post_save, sender=ComunidadPost)
+def increment_canal_post_count(sender, instance, created, **kwargs):
+    # UPDATE atómico con F(): sin carreras entre publicaciones simultáneas
+    if created:
+        ComunidadCanal.objects.filter(pk=instance.canal_id).update(
+            post_count=models.F("post_count") + 1
+        )
+
+
+@receiver(post_delete, sender=ComunidadPost)
+def decrement_canal_post_count(sender, instance, **kwargs):
+    ComunidadCanal.objects.filter(pk=instance.canal_id, post_count__gt=0).update(
+        post_count=models.F("post_count") - 1
+    )
@@ -11,3 +11,4 @@ class CanalOutputSerializer(serializers.Serializer):
     is_read_only = serializers.BooleanField()
     created_at = serializers.DateTimeField()
     post_count = serializers.IntegerField()
+    unread_count = serializers.IntegerField()
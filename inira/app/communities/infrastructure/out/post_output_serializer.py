@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from inira.app.shared.pagination import encode_cursor
+
 
 class PostOutputSerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -7,3 +9,13 @@ class PostOutputSerializer(serializers.Serializer):
     created_at = serializers.DateTimeField()
     author_name = serializers.CharField()
     author_image = serializers.CharField(allow_null=True)
+    # 🔹 Posición del post en el timeline: el cliente la envía como `since` al reconectar
+    cursor = serializers.SerializerMethodField()
+
+    def get_cursor(self, post) -> str:
+        return encode_cursor(post.created_at, post.id)
+
+
+class FeedPostOutputSerializer(PostOutputSerializer):
+    comunidad_id = serializers.UUIDField()
+    canal_id = serializers.UUIDField()
@@ -1,20 +1,20 @@
 # inira/app/communities/infrastructure/repositories/canal_repository_impl.py
 
 from django.db import IntegrityError
-from django.db.models import Count
+from django.db.models import OuterRef, Subquery
 from rest_framework.exceptions import NotFound
 
 from inira.app.communities.domain.entities import CanalEntity
 from inira.app.communities.domain.repositories.canal_repository import CanalRepository
-from inira.app.communities.infrastructure.models import ComunidadCanal
+from inira.app.communities.infrastructure.models import ComunidadCanal, ComunidadMember
 
 
 class CanalRepositoryImpl(CanalRepository):
 
     def find_by_comunidad(self, comunidad_id: str) -> list[CanalEntity]:
         canales = (
+            # 🔹 post_count es una columna mantenida: sin agregar sobre posts
             ComunidadCanal.objects.filter(comunidad_id=comunidad_id)
-            .annotate(post_count=Count("posts"))
             .order_by("created_at")
         )
 
@@ -22,9 +22,7 @@ class CanalRepositoryImpl(CanalRepository):
 
     def find_by_id(self, canal_id: str) -> CanalEntity:
         try:
-            canal = ComunidadCanal.objects.annotate(post_count=Count("posts")).get(
-                id=canal_id
-            )
+            canal = ComunidadCanal.objects.get(id=canal_id)
 
             return self._to_entity(canal)
         except ComunidadCanal.DoesNotExist:
@@ -59,12 +57,21 @@ class CanalRepositoryImpl(CanalRepository):
             # 🔥 protección en concurrencia
             raise NotFound("Ya existe un canal con ese nombre en la comunidad")
 
-        canal = ComunidadCanal.objects.annotate(post_count=Count("posts")).get(
-            id=canal.id
-        )
-
         return self._to_entity(canal)
 
+    def get_access(self, *, canal_id: str, user_id: int):
+        # 🔹 Sin Count("posts"): solo lo necesario para autorizar
+        role = ComunidadMember.objects.filter(
+            comunidad_id=OuterRef("comunidad_id"), user_id=user_id
+        ).values("role")[:1]
+
+        return (
+            ComunidadCanal.objects.filter(id=canal_id)
+            .annotate(role=Subquery(role))
+            .values("comunidad_id", "is_read_only", "role")
+            .first()
+        )
+
     def exists(self, canal_id: str) -> bool:
         return ComunidadCanal.objects.filter(id=canal_id).exists()
 
@@ -77,7 +84,7 @@ class CanalRepositoryImpl(CanalRepository):
             is_info=canal.is_info,
             is_read_only=canal.is_read_only,
             created_at=canal.created_at,
-            post_count=getattr(canal, "post_count", 0),
+            post_count=canal.post_count,
         )
 
     def exists_with_name(self, comunidad_id: str, name: str) -> bool:
@@ -6,6 +6,7 @@ from rest_framework.exceptions import NotFound
 from inira.app.communities.domain.entities import ComunidadEntity
 from inira.app.communities.domain.repositories.comunidad_repository import ComunidadRepository
 from inira.app.communities.infrastructure.models import Comunidad, ComunidadMember
+from inira.app.shared.pagination import keyset_page
 
 
 class ComunidadRepositoryImpl(ComunidadRepository):
@@ -34,6 +35,38 @@ class ComunidadRepositoryImpl(ComunidadRepository):
             raise NotFound("Comunidad no encontrada")
 
     def find_all(self, *, page: int, page_size: int, user_id: int = None, **filters):
+        queryset = self._list_queryset(user_id=user_id, **filters)
+
+        # Paginación
+        total = queryset.count()
+        start = (page - 1) * page_size
+        end = start + page_size
+        
+        comunidades = queryset[start:end]
+        
+        return {
+            'results': [self._to_entity(c, user_id=user_id) for c in comunidades],
+            'count': total,
+        }
+
+    def find_all_by_cursor(self, *, cursor, page_size: int, user_id: int = None, **filters):
+        queryset = self._list_queryset(user_id=user_id, **filters)
+
+        # Keyset sobre (created_at, id): sin OFFSET ni COUNT
+        comunidades, next_cursor = keyset_page(
+            queryset,
+            cursor=cursor,
+            page_size=page_size,
+            field='created_at',
+            descending=True,
+        )
+
+        return {
+            'results': [self._to_entity(c, user_id=user_id) for c in comunidades],
+            'next_cursor': next_cursor,
+        }
+
+    def _list_queryset(self, *, user_id: int = None, **filters):
         queryset = Comunidad.objects.annotate(
             member_count=Count('members')
         ).select_related('created_by')
@@ -53,17 +86,7 @@ class ComunidadRepositoryImpl(ComunidadRepository):
         if 'is_public' in filters:
             queryset = queryset.filter(is_public=filters['is_public'])
 
-        # Paginación
-        total = queryset.count()
-        start = (page - 1) * page_size
-        end = start + page_size
-        
-        comunidades = queryset[start:end]
-        
-        return {
-            'results': [self._to_entity(c, user_id=user_id) for c in comunidades],
-            'count': total,
-        }
+        return queryset
 
     def create(
         self,
@@ -0,0 +1,237 @@
+# inira/app/communities/infrastructure/repositories/feed_repository_impl.py
+
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+import redis
+from django.conf import settings
+from django.db.models import Q
+
+from inira.app.communities.domain.repositories.feed_repository import FeedRepository
+from inira.app.communities.infrastructure.models import ComunidadMember, ComunidadPost
+from inira.app.shared.pagination import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Timelines inactivos expiran y se reconstruyen al volver a leerlos
+TIMELINE_TTL = 60 * 60 * 24 * 7
+
+_client = None
+
+
+def _redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+
+# Miembros por llamada al script de fan-out
+FAN_OUT_CHUNK = 500
+
+
+def _timeline_key(user_id) -> str:
+    return f"feed:{user_id}"
+
+
+def _built_key(user_id) -> str:
+    """Marca un timeline completo; sin ella el ZSET no se usa ni se amplía."""
+    return f"feed:{user_id}:built"
+
+
+# 🔹 Fan-out atómico: solo se agrega a timelines con la marca de construido,
+# así un timeline que expira o se invalida no renace con una sola entrada
+FAN_OUT_SCRIPT = """
+local added = 0
+for i = 1, #KEYS, 2 do
+    if redis.call('exists', KEYS[i + 1]) == 1 then
+        redis.call('zadd', KEYS[i], ARGV[1], ARGV[2])
+        redis.call('zremrangebyrank', KEYS[i], 0, -tonumber(ARGV[3]) - 1)
+        redis.call('expire', KEYS[i], ARGV[4])
+        added = added + 1
+    end
+end
+return added
+"""
+
+
+class MergedFeedRepositoryImpl(FeedRepository):
+    """
+    Feed calculado en lectura: un UNION ALL con una rama por comunidad
+    (cada una un recorrido de posts_comunidad_created_idx limitado a la
+    página) y un ORDER BY final que mezcla las k ramas ya ordenadas.
+    """
+
+    def page_ids(self, *, user_id: int, cursor: Optional[str], page_size: int):
+        comunidad_ids = list(
+            ComunidadMember.objects.filter(user_id=user_id).values_list(
+                "comunidad_id", flat=True
+            )
+        )
+        if not comunidad_ids:
+            return [], None
+
+        rows = self._rows(comunidad_ids, cursor=cursor, limit=page_size + 1)
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_cursor(rows[-1][1], rows[-1][0])
+
+        return [str(pk) for pk, _ in rows], next_cursor
+
+    def latest(self, *, user_id: int, limit: int) -> List[Tuple[str, float]]:
+        """[(post_id, timestamp)] más recientes, para reconstruir un timeline"""
+        comunidad_ids = list(
+            ComunidadMember.objects.filter(user_id=user_id).values_list(
+                "comunidad_id", flat=True
+            )
+        )
+        if not comunidad_ids:
+            return []
+
+        return [
+            (str(pk), created_at.timestamp())
+            for pk, created_at in self._rows(comunidad_ids, cursor=None, limit=limit)
+        ]
+
+    def _rows(self, comunidad_ids, *, cursor, limit):
+        after = Q()
+        if cursor:
+            value, pk = decode_cursor(cursor, model=ComunidadPost)
+            after = Q(created_at__lt=value) | Q(created_at=value, pk__lt=pk)
+
+        branches = [
+            ComunidadPost.objects.filter(after, comunidad_id=comunidad_id)
+            .order_by("-created_at", "-id")
+            .values_list("id", "created_at")[:limit]
+            for comunidad_id in comunidad_ids
+        ]
+
+        if len(branches) == 1:
+            return list(branches[0])
+
+        # 🔹 k-way merge en una sola consulta: cada rama lee como mucho `limit` filas
+        merged = branches[0].union(*branches[1:], all=True)
+        return list(merged.order_by("-created_at", "-id")[:limit])
+
+
+class TimelineFeedRepositoryImpl(FeedRepository):
+    """
+    Feed con fan-out en escritura: cada post se agrega al ZSET
+    `feed:{user_id}` de los miembros de su comunidad (score = created_at).
+    La lectura es un ZREVRANGEBYSCORE; si falta la marca `feed:{user_id}:built`
+    el timeline se reconstruye con la consulta mezclada, y pasado su largo
+    máximo las páginas siguientes se leen de la base de datos.
+    """
+
+    def __init__(self, merged_feed_repository: MergedFeedRepositoryImpl):
+        self.merged_feed_repository = merged_feed_repository
+
+    def page_ids(self, *, user_id: int, cursor: Optional[str], page_size: int):
+        try:
+            entries = self._read(user_id, cursor=cursor, limit=page_size + 1)
+        except redis.RedisError as e:
+            logger.warning(f"[FEED] Timeline no disponible (user {user_id}): {e}")
+            return self.merged_feed_repository.page_ids(
+                user_id=user_id, cursor=cursor, page_size=page_size
+            )
+
+        if entries is None:
+            # El timeline se quedó corto (truncado): seguir desde la base de datos
+            return self.merged_feed_repository.page_ids(
+                user_id=user_id, cursor=cursor, page_size=page_size
+            )
+
+        next_cursor = None
+        if len(entries) > page_size:
+            entries = entries[:page_size]
+            pk, score = entries[-1]
+            next_cursor = encode_cursor(
+                datetime.fromtimestamp(score, tz=timezone.utc), pk
+            )
+
+        return [pk for pk, _ in entries], next_cursor
+
+    def push(self, *, post_id: str, created_at, comunidad_id: str) -> None:
+        """Fan-out de un post a los timelines existentes de los miembros."""
+        member_ids = list(
+            ComunidadMember.objects.filter(comunidad_id=comunidad_id).values_list(
+                "user_id", flat=True
+            )
+        )
+        if not member_ids:
+            return
+
+        fan_out = _redis().register_script(FAN_OUT_SCRIPT)
+        args = [
+            created_at.timestamp(),
+            str(post_id),
+            settings.COMMUNITY_FEED_TIMELINE_SIZE,
+            TIMELINE_TTL,
+        ]
+
+        for start in range(0, len(member_ids), FAN_OUT_CHUNK):
+            keys = []
+            for user_id in member_ids[start : start + FAN_OUT_CHUNK]:
+                keys += [_timeline_key(user_id), _built_key(user_id)]
+            fan_out(keys=keys, args=args)
+
+    def invalidate(self, user_id: int) -> None:
+        """Descarta el timeline (cambió la membresía); se reconstruye al leer."""
+        _redis().delete(_timeline_key(user_id), _built_key(user_id))
+
+    def _read(self, user_id, *, cursor, limit):
+        max_score, cursor_pk = "+inf", None
+        if cursor:
+            value, cursor_pk = decode_cursor(cursor)
+            max_score = value.timestamp()
+
+        built, raw, size = self._fetch(user_id, max_score, limit)
+        if not built:
+            self._rebuild(user_id)
+            built, raw, size = self._fetch(user_id, max_score, limit)
+
+        entries = [
+            (pk, score)
+            for pk, score in raw
+            if cursor_pk is None or score < max_score or pk < str(cursor_pk)
+        ][:limit]
+
+        if len(entries) < limit and size >= settings.COMMUNITY_FEED_TIMELINE_SIZE:
+            return None
+
+        return entries
+
+    def _fetch(self, user_id, max_score, limit):
+        key, built_key = _timeline_key(user_id), _built_key(user_id)
+
+        # Marca, página y tamaño en una transacción: una lectura consistente
+        with _redis().pipeline(transaction=True) as pipe:
+            pipe.exists(built_key)
+            # Filas extra por si hay empates en el score del cursor
+            pipe.zrevrangebyscore(
+                key, max_score, "-inf", start=0, num=limit + 10, withscores=True
+            )
+            pipe.zcard(key)
+            pipe.expire(key, TIMELINE_TTL)
+            pipe.expire(built_key, TIMELINE_TTL)
+            built, raw, size, *_ = pipe.execute()
+
+        return built, raw, size
+
+    def _rebuild(self, user_id):
+        latest = self.merged_feed_repository.latest(
+            user_id=user_id, limit=settings.COMMUNITY_FEED_TIMELINE_SIZE
+        )
+
+        key, built_key = _timeline_key(user_id), _built_key(user_id)
+        with _redis().pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if latest:
+                pipe.zadd(key, dict(latest))
+                pipe.expire(key, TIMELINE_TTL)
+            # Un feed vacío también queda construido (sin entradas centinela)
+            pipe.set(built_key, 1, ex=TIMELINE_TTL)
+            pipe.execute()
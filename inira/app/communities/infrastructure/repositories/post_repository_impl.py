@@ -1,23 +1,38 @@
 # inira/app/communities/infrastructure/repositories/post_repository_impl.py
 
+from django.db import transaction
 from django.db.models import F
 from rest_framework.exceptions import NotFound
 
 from inira.app.communities.domain.entities import PostEntity
 from inira.app.communities.domain.repositories.post_repository import PostRepository
-from inira.app.communities.infrastructure.models import ComunidadPost
+from inira.app.communities.infrastructure.models import ComunidadCanal, ComunidadPost
+from inira.app.shared.pagination import keyset_page
 
+# Solo las columnas que usa PostEntity (sin el resto de la fila del autor)
+TIMELINE_FIELDS = (
+    'id',
+    'comunidad',
+    'canal',
+    'author',
+    'content',
+    'created_at',
+    'author__first_name',
+    'author__last_name',
+)
 
 
 class PostRepositoryImpl(PostRepository):
 
     def find_by_canal(self, *, canal_id: str, page: int, page_size: int):
-        queryset = ComunidadPost.objects.filter(
-            canal_id=canal_id
-        ).select_related('author').order_by('created_at')
+        queryset = self._timeline(canal_id).order_by('created_at', 'id')
 
-        # Paginación
-        total = queryset.count()
+        # 🔹 Total desde el contador del canal, sin COUNT sobre posts
+        total = (
+            ComunidadCanal.objects.filter(id=canal_id)
+            .values_list('post_count', flat=True)
+            .first()
+        ) or 0
         start = (page - 1) * page_size
         end = start + page_size
         
@@ -28,6 +43,23 @@ class PostRepositoryImpl(PostRepository):
             'count': total,
         }
 
+    def find_by_canal_cursor(self, *, canal_id: str, cursor, page_size: int):
+        queryset = self._timeline(canal_id)
+
+        # Keyset sobre (created_at, id): sin OFFSET ni COUNT
+        posts, next_cursor = keyset_page(
+            queryset,
+            cursor=cursor,
+            page_size=page_size,
+            field='created_at',
+            descending=False,
+        )
+
+        return {
+            'results': [self._to_entity(post) for post in posts],
+            'next_cursor': next_cursor,
+        }
+
     def create(
         self,
         *,
@@ -36,17 +68,37 @@ class PostRepositoryImpl(PostRepository):
         author_id: int,
         content: str,
     ) -> PostEntity:
-        post = ComunidadPost.objects.create(
-            comunidad_id=comunidad_id,
-            canal_id=canal_id,
-            author_id=author_id,
-            content=content,
-        )
+        # INSERT y contador del canal (señal post_save) en una transacción
+        with transaction.atomic():
+            post = ComunidadPost.objects.create(
+                comunidad_id=comunidad_id,
+                canal_id=canal_id,
+                author_id=author_id,
+                content=content,
+            )
         
         post = ComunidadPost.objects.select_related('author').get(id=post.id)
         
         return self._to_entity(post)
 
+    def find_by_ids(self, ids):
+        posts = {
+            str(post.id): post
+            for post in ComunidadPost.objects.filter(id__in=ids)
+            .select_related('author')
+            .only(*TIMELINE_FIELDS)
+        }
+
+        return [self._to_entity(posts[pk]) for pk in ids if pk in posts]
+
+    def _timeline(self, canal_id: str):
+        # Recorre posts_canal_timeline_idx (canal_id, created_at, id)
+        return (
+            ComunidadPost.objects.filter(canal_id=canal_id)
+            .select_related('author')
+            .only(*TIMELINE_FIELDS)
+        )
+
     def _to_entity(self, post: ComunidadPost) -> PostEntity:
         return PostEntity(
             id=str(post.id),
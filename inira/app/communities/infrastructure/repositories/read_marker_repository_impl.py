@@ -0,0 +1,71 @@
+# inira/app/communities/infrastructure/repositories/read_marker_repository_impl.py
+
+from datetime import datetime
+from typing import Dict
+
+from django.db.models import Count, Q
+
+from inira.app.communities.domain.repositories.read_marker_repository import (
+    ReadMarkerRepository,
+)
+from inira.app.communities.infrastructure.models import (
+    ComunidadCanalRead,
+    ComunidadMember,
+    ComunidadPost,
+)
+
+
+class ReadMarkerRepositoryImpl(ReadMarkerRepository):
+    def mark_read(self, *, canal_id: str, user_id: int, read_at: datetime) -> bool:
+        # 🔹 UPDATE condicional: un marcador viejo que llega tarde no retrocede
+        updated = ComunidadCanalRead.objects.filter(
+            canal_id=canal_id, user_id=user_id, last_read_at__lt=read_at
+        ).update(last_read_at=read_at)
+
+        if updated:
+            return True
+
+        _, created = ComunidadCanalRead.objects.get_or_create(
+            canal_id=canal_id,
+            user_id=user_id,
+            defaults={"last_read_at": read_at},
+        )
+        return created
+
+    def unread_counts(
+        self, *, comunidad_id: str, user_id: int, post_counts: Dict[str, int]
+    ) -> Dict[str, int]:
+        joined_at = (
+            ComunidadMember.objects.filter(comunidad_id=comunidad_id, user_id=user_id)
+            .values_list("joined_at", flat=True)
+            .first()
+        )
+        if joined_at is None:
+            return {}
+
+        markers = dict(
+            ComunidadCanalRead.objects.filter(
+                user_id=user_id, canal__comunidad_id=comunidad_id
+            ).values_list("canal_id", "last_read_at")
+        )
+
+        # Canales sin marcador: no leído = publicado después de unirse
+        # (posts_comunidad_created_idx); con marcador: rango sobre el
+        # timeline del canal (posts_canal_timeline_idx)
+        condition = Q(comunidad_id=comunidad_id, created_at__gt=joined_at) & ~Q(
+            canal_id__in=list(markers)
+        )
+        for canal_id, last_read_at in markers.items():
+            condition |= Q(canal_id=canal_id, created_at__gt=last_read_at)
+
+        # 🔹 Una sola consulta agrupada para todos los canales
+        rows = (
+            ComunidadPost.objects.filter(condition)
+            .exclude(author_id=user_id)
+            .values("canal_id")
+            .annotate(unread=Count("id"))
+            .order_by()
+        )
+
+        unread = {str(row["canal_id"]): row["unread"] for row in rows}
+        return {canal_id: unread.get(canal_id, 0) for canal_id in post_counts}
@@ -5,7 +5,9 @@ from .views import (
     ComunidadAPIView,
     ComunidadMemberAPIView,
     ComunidadCanalAPIView,
+    ComunidadCanalReadAPIView,
     ComunidadPostAPIView,
+    ComunidadFeedAPIView,
 )
 
 urlpatterns = [
@@ -17,7 +19,11 @@ urlpatterns = [
     
     # Canales
     path("comunidad-canal/", ComunidadCanalAPIView.as_view(), name="ComunidadCanalAPIView"),
+    path("comunidad-canal/leido/", ComunidadCanalReadAPIView.as_view(), name="ComunidadCanalReadAPIView"),
     
     # Posts
     path("comunidad-post/", ComunidadPostAPIView.as_view(), name="ComunidadPostAPIView"),
+
+    # Feed de inicio (todas mis comunidades)
+    path("comunidad-feed/", ComunidadFeedAPIView.as_view(), name="ComunidadFeedAPIView"),
 ]
\ No newline at end of file
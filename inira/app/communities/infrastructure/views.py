@@ -4,7 +4,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import PermissionDenied, ValidationError
 
 from inira.app.communities.infrastructure.docs.post_community_post_docs import (
     post_community_post_docs,
@@ -18,6 +18,12 @@ from inira.app.communities.infrastructure.docs.post_community_channel_docs impor
 from inira.app.communities.infrastructure.docs.get_community_channels_docs import (
     get_community_channels_docs,
 )
+from inira.app.communities.infrastructure.docs.post_community_channel_read_docs import (
+    post_community_channel_read_docs,
+)
+from inira.app.communities.infrastructure.docs.get_community_feed_docs import (
+    get_community_feed_docs,
+)
 from inira.app.communities.infrastructure.docs.delete_community_member_docs import (
     delete_community_member_docs,
 )
@@ -56,6 +62,7 @@ class ComunidadAPIView(APIView):
         - is_public: bool (opcional)
         - page: int (opcional, default=1)
         - page_size: int (opcional, default=10)
+        - cursor: str (opcional, activa la paginación por cursor)
         """
         comunidad_id = request.query_params.get("id")
         is_public = request.query_params.get("is_public")
@@ -84,14 +91,30 @@ class ComunidadAPIView(APIView):
             filters["is_public"] = is_public.lower() == "true"
 
         result = use_case.execute(
-            user_id=request.user.id, page=page, page_size=page_size, **filters
+            user_id=request.user.id,
+            page=page,
+            page_size=page_size,
+            cursor=request.query_params.get("cursor"),
+            **filters,
         )
 
         comunidades = result["results"]
-        total = result["count"]
 
         serializer = ComunidadOutputSerializer(comunidades, many=True)
 
+        # Modo cursor (opt-in): sin count ni número de página
+        if "next_cursor" in result:
+            return Response(
+                {
+                    "page_size": page_size,
+                    "next_cursor": result["next_cursor"],
+                    "results": serializer.data,
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        total = result["count"]
+
         return Response(
             {
                 "count": total,
@@ -345,6 +368,45 @@ class ComunidadCanalAPIView(APIView):
             )
 
 
+class ComunidadCanalReadAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @post_community_channel_read_docs
+    def post(self, request):
+        """
+        Body params:
+        - canal_id: UUID (requerido)
+        - cursor: str (opcional, cursor del último post leído)
+        """
+        canal_id = request.data.get("canal_id")
+
+        if not canal_id:
+            return Response(
+                {"detail": "canal_id es requerido"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        use_case = container.communities().mark_canal_read()
+
+        try:
+            result = use_case.execute(
+                canal_id=canal_id,
+                user_id=request.user.id,
+                cursor=request.data.get("cursor"),
+            )
+            return Response(result, status=status.HTTP_200_OK)
+        except PermissionDenied as e:
+            return Response(
+                {"detail": str(e.detail)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        except Exception as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 class ComunidadPostAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -355,6 +417,7 @@ class ComunidadPostAPIView(APIView):
         - canal_id: UUID (requerido)
         - page: int (opcional, default=1)
         - page_size: int (opcional, default=20)
+        - cursor: str (opcional, activa la paginación por cursor)
         """
         canal_id = request.query_params.get("canal_id")
         page = request.query_params.get("page", 1)
@@ -384,10 +447,10 @@ class ComunidadPostAPIView(APIView):
                 user_id=request.user.id,
                 page=page,
                 page_size=page_size,
+                cursor=request.query_params.get("cursor"),
             )
 
             posts = result["results"]
-            total = result["count"]
 
             from inira.app.communities.infrastructure.out.post_output_serializer import (
                 PostOutputSerializer,
@@ -395,6 +458,19 @@ class ComunidadPostAPIView(APIView):
 
             serializer = PostOutputSerializer(posts, many=True)
 
+            # Modo cursor (opt-in): sin count ni número de página
+            if "next_cursor" in result:
+                return Response(
+                    {
+                        "page_size": page_size,
+                        "next_cursor": result["next_cursor"],
+                        "results": serializer.data,
+                    },
+                    status=status.HTTP_200_OK,
+                )
+
+            total = result["count"]
+
             return Response(
                 {
                     "count": total,
@@ -445,3 +521,54 @@ class ComunidadPostAPIView(APIView):
                 {"detail": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+
+class ComunidadFeedAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    MAX_PAGE_SIZE = 50
+
+    @get_community_feed_docs
+    def get(self, request, *args, **kwargs):
+        """
+        Query params:
+        - page_size: int (opcional, default=20, máximo=50)
+        - cursor: str (opcional, valor de next_cursor)
+        """
+        try:
+            page_size = int(request.query_params.get("page_size", 20))
+            if page_size <= 0:
+                raise ValueError
+        except ValueError:
+            raise ValidationError({"detail": "page_size debe ser un entero positivo"})
+
+        page_size = min(page_size, self.MAX_PAGE_SIZE)
+
+        use_case = container.communities().get_home_feed()
+
+        try:
+            result = use_case.execute(
+                user_id=request.user.id,
+                cursor=request.query_params.get("cursor"),
+                page_size=page_size,
+            )
+
+            from inira.app.communities.infrastructure.out.post_output_serializer import (
+                FeedPostOutputSerializer,
+            )
+
+            serializer = FeedPostOutputSerializer(result["results"], many=True)
+
+            return Response(
+                {
+                    "page_size": page_size,
+                    "next_cursor": result["next_cursor"],
+                    "results": serializer.data,
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
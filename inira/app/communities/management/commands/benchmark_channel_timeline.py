@@ -0,0 +1,120 @@
+# inira/app/communities/management/commands/benchmark_channel_timeline.py
+
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from inira.app.communities.infrastructure.models import (
+    Comunidad,
+    ComunidadCanal,
+    ComunidadPost,
+)
+from inira.app.communities.infrastructure.repositories.post_repository_impl import (
+    PostRepositoryImpl,
+)
+from inira.app.shared.benchmark import (
+    analyze,
+    captured_sql,
+    explain,
+    measure,
+    rolled_back,
+    summary,
+)
+
+TIMELINE_INDEXES = ("posts_canal_timeline_idx", "posts_comunidad_created_idx")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el timeline de un canal con y sin los índices de timeline "
+        "(EXPLAIN antes/después) y el total por COUNT(*) frente a post_count, "
+        "sobre datos sintéticos; todo se revierte al terminar. El DROP INDEX "
+        "bloquea comunidad_posts hasta el final: no ejecutar en producción."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--channels", type=int, default=20)
+        parser.add_argument("--posts", type=int, default=5000, help="Posts por canal")
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--deep-page", type=int, default=100)
+        parser.add_argument("--iterations", type=int, default=20)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            canal = self._seed(options["channels"], options["posts"])
+            analyze("comunidad_posts", "comunidad_canales")
+
+            self._report("después (con índices)", canal, options)
+
+            with connection.cursor() as cursor:
+                for index in TIMELINE_INDEXES:
+                    cursor.execute(f"DROP INDEX {connection.ops.quote_name(index)}")
+            analyze("comunidad_posts")
+
+            self._report("antes (sin índices)", canal, options)
+
+    def _seed(self, channels, posts):
+        tag = uuid.uuid4().hex[:8]
+        user = get_user_model().objects.create(username=f"timeline_bench_{tag}")
+        comunidad = Comunidad.objects.create(
+            name=f"bench {tag}", description="", image="", created_by=user
+        )
+        canales = ComunidadCanal.objects.bulk_create(
+            ComunidadCanal(comunidad=comunidad, name=f"canal {i}")
+            for i in range(channels)
+        )
+        # bulk_create no emite señales: el contador se ajusta al final
+        ComunidadPost.objects.bulk_create(
+            (
+                ComunidadPost(
+                    comunidad=comunidad, canal=canal, author=user, content=f"post {n}"
+                )
+                for canal in canales
+                for n in range(posts)
+            ),
+            batch_size=1000,
+        )
+        ComunidadCanal.objects.filter(comunidad=comunidad).update(post_count=posts)
+        return canales[0]
+
+    def _report(self, label, canal, options):
+        repository = PostRepositoryImpl()
+        page_size = options["page_size"]
+        deep_page = options["deep_page"]
+
+        def first_page():
+            return repository.find_by_canal_cursor(
+                canal_id=canal.id, cursor="", page_size=page_size
+            )
+
+        cases = (
+            ("cursor página 1", first_page),
+            (
+                f"offset página {deep_page}",
+                lambda: repository.find_by_canal(
+                    canal_id=canal.id, page=deep_page, page_size=page_size
+                ),
+            ),
+            (
+                "total COUNT(*)",
+                lambda: ComunidadPost.objects.filter(canal_id=canal.id).count(),
+            ),
+            (
+                "total post_count",
+                lambda: ComunidadCanal.objects.filter(id=canal.id)
+                .values_list("post_count", flat=True)
+                .first(),
+            ),
+        )
+
+        for name, fn in cases:
+            timings, queries = measure(fn, iterations=options["iterations"])
+            self.stdout.write(
+                f"[TIMELINE_BENCH] {label} {name}: {summary(timings, queries)}"
+            )
+
+        for sql in captured_sql(first_page):
+            self.stdout.write(f"[TIMELINE_BENCH] {label} EXPLAIN cursor página 1")
+            self.stdout.write(explain(sql))
@@ -0,0 +1,122 @@
+# inira/app/communities/management/commands/benchmark_home_feed.py
+
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from inira.app.communities.infrastructure.models import (
+    Comunidad,
+    ComunidadCanal,
+    ComunidadMember,
+    ComunidadPost,
+)
+from inira.app.communities.infrastructure.repositories.feed_repository_impl import (
+    MergedFeedRepositoryImpl,
+    TimelineFeedRepositoryImpl,
+)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el feed mezclado en lectura (merge) con el timeline en Redis "
+        "(timeline) sobre datos sintéticos; todo se revierte al terminar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--communities", type=int, default=50)
+        parser.add_argument(
+            "--posts", type=int, default=200, help="Posts por comunidad"
+        )
+        parser.add_argument("--pages", type=int, default=5)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--iterations", type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                user = self._seed(options["communities"], options["posts"])
+                merged = MergedFeedRepositoryImpl()
+                timeline = TimelineFeedRepositoryImpl(merged_feed_repository=merged)
+
+                try:
+                    self._report("merge", merged, user.id, options)
+
+                    timeline.invalidate(user.id)
+                    self._report(
+                        "timeline (frío)", timeline, user.id, options, iterations=1
+                    )
+                    self._report("timeline", timeline, user.id, options)
+                finally:
+                    timeline.invalidate(user.id)
+
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, communities, posts):
+        tag = uuid.uuid4().hex[:8]
+        user = get_user_model().objects.create(username=f"feed_bench_{tag}")
+
+        comunidades = Comunidad.objects.bulk_create(
+            Comunidad(
+                name=f"bench {tag} {i}",
+                description="",
+                image="",
+                created_by=user,
+            )
+            for i in range(communities)
+        )
+        ComunidadMember.objects.bulk_create(
+            ComunidadMember(comunidad=comunidad, user=user) for comunidad in comunidades
+        )
+        canales = ComunidadCanal.objects.bulk_create(
+            ComunidadCanal(comunidad=comunidad, name="general")
+            for comunidad in comunidades
+        )
+        # bulk_create no emite señales: no hay fan-out durante la carga
+        ComunidadPost.objects.bulk_create(
+            (
+                ComunidadPost(
+                    comunidad_id=canal.comunidad_id,
+                    canal=canal,
+                    author=user,
+                    content=f"post {n}",
+                )
+                for canal in canales
+                for n in range(posts)
+            ),
+            batch_size=1000,
+        )
+        return user
+
+    def _report(self, label, repository, user_id, options, iterations=None):
+        iterations = iterations or options["iterations"]
+        timings, queries = [], 0
+
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                cursor = None
+                for _ in range(options["pages"]):
+                    _, cursor = repository.page_ids(
+                        user_id=user_id, cursor=cursor, page_size=options["page_size"]
+                    )
+                    if cursor is None:
+                        break
+                timings.append((time.perf_counter() - started) * 1000)
+            queries += len(captured)
+
+        self.stdout.write(
+            f"[FEED_BENCH] {label}: {options['pages']} páginas "
+            f"p50={statistics.median(timings):.2f}ms max={max(timings):.2f}ms "
+            f"consultas/iteración={queries / iterations:.1f}"
+        )
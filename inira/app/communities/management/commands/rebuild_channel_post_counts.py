@@ -0,0 +1,46 @@
+# inira/app/communities/management/commands/rebuild_channel_post_counts.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from inira.app.communities.infrastructure.models import ComunidadCanal, ComunidadPost
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula desde cero post_count de los canales a partir de la tabla "
+        "de posts (p. ej. tras cargas masivas con bulk_create, que no emiten señales)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--canal",
+            dest="canal_id",
+            help="Recalcular solo el canal con este ID",
+        )
+
+    def handle(self, *args, **options):
+        counts = (
+            ComunidadPost.objects.filter(canal=OuterRef("pk"))
+            .values("canal")
+            .annotate(count=Count("id"))
+        )
+
+        queryset = ComunidadCanal.objects.all()
+        if options["canal_id"]:
+            queryset = queryset.filter(pk=options["canal_id"])
+
+        # 🔹 Un único UPDATE con subconsulta correlacionada
+        with transaction.atomic():
+            updated = queryset.update(
+                post_count=Coalesce(
+                    Subquery(counts.values("count")[:1], output_field=IntegerField()),
+                    0,
+                )
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Contadores de posts recalculados: {updated} canales")
+        )
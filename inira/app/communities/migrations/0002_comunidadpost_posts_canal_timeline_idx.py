@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("communities", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comunidadpost",
+            index=models.Index(
+                fields=["canal", "created_at", "id"], name="posts_canal_timeline_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:30
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_post_count(apps, schema_editor):
+    ComunidadCanal = apps.get_model("communities", "ComunidadCanal")
+    ComunidadPost = apps.get_model("communities", "ComunidadPost")
+
+    counts = (
+        ComunidadPost.objects.filter(canal=OuterRef("pk"))
+        .values("canal")
+        .annotate(count=Count("id"))
+    )
+
+    ComunidadCanal.objects.update(
+        post_count=Coalesce(
+            Subquery(counts.values("count")[:1], output_field=IntegerField()), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("communities", "0002_comunidadpost_posts_canal_timeline_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comunidadcanal",
+            name="post_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Número de posts del canal"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comunidadpost",
+            index=models.Index(
+                fields=["comunidad", "created_at"], name="posts_comunidad_created_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_post_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import os
+import time
+from types import SimpleNamespace
+
+from channels.layers import InMemoryChannelLayer
+from django.test import SimpleTestCase
+
+from inira.setting.websocket.consumers import CanalChatConsumer
+from inira.setting.websocket.utils import GroupBatcher
+
+# Sockets simulados en la prueba de carga (WS_LOAD_SOCKETS=5000 por defecto)
+LOAD_SOCKETS = int(os.environ.get("WS_LOAD_SOCKETS", 5000))
+
+
+class CountingChannelLayer(InMemoryChannelLayer):
+    """
+    Channel layer que solo cuenta: mensajes publicados al grupo y frames
+    que recibirían los sockets (mensajes × miembros), sin entregarlos.
+    """
+
+    def __init__(self, members: int):
+        super().__init__()
+        self.members = members
+        self.group_messages = 0
+        self.deliveries = 0
+        self.sent = []
+
+    async def group_send(self, group, message):
+        self.group_messages += 1
+        self.deliveries += self.members
+        self.sent.append(message)
+
+
+def _consumer(user_id: int, *, batch_frames: bool):
+    consumer = CanalChatConsumer.__new__(CanalChatConsumer)
+    consumer.user = SimpleNamespace(id=user_id)
+    consumer.batch_frames = batch_frames
+    consumer.frames = []
+
+    async def send(text_data=None, bytes_data=None, close=False):
+        consumer.frames.append(text_data)
+
+    consumer.send = send
+    return consumer
+
+
+def _typing(user_id: int) -> dict:
+    return {
+        "type": "typing",
+        "user_id": user_id,
+        "username": f"user{user_id}",
+        "is_typing": True,
+    }
+
+
+class GroupBatcherLoadTest(SimpleTestCase):
+    """Fan-out de typing con LOAD_SOCKETS sockets escribiendo en el mismo canal."""
+
+    def _burst(self, interval: float):
+        layer = CountingChannelLayer(members=LOAD_SOCKETS)
+        batcher = GroupBatcher(interval=interval)
+
+        async def run():
+            started = time.perf_counter()
+            for user_id in range(LOAD_SOCKETS):
+                await batcher.add(
+                    layer, "canal_chat_test", _typing(user_id), key=("typing", user_id)
+                )
+            await asyncio.sleep(max(interval, 0) + 0.05)
+            return time.perf_counter() - started
+
+        elapsed = asyncio.run(run())
+        return layer, elapsed
+
+    def test_batching_collapses_burst_into_one_group_message(self):
+        batched, batched_s = self._burst(interval=0.05)
+        unbatched, unbatched_s = self._burst(interval=0)
+
+        print(
+            f"\n[WS_LOAD] sockets={LOAD_SOCKETS} "
+            f"sin lotes: {unbatched.group_messages} mensajes, "
+            f"{unbatched.deliveries} frames ({unbatched_s:.2f}s) | "
+            f"con lotes: {batched.group_messages} mensajes, "
+            f"{batched.deliveries} frames ({batched_s:.2f}s)"
+        )
+
+        self.assertEqual(unbatched.group_messages, LOAD_SOCKETS)
+        self.assertEqual(batched.group_messages, 1)
+        self.assertEqual(len(batched.sent[0]["events"]), LOAD_SOCKETS)
+        self.assertEqual(batched.deliveries, LOAD_SOCKETS)
+
+    def test_same_key_keeps_latest_event(self):
+        layer = CountingChannelLayer(members=1)
+        batcher = GroupBatcher(interval=0.01)
+
+        async def run():
+            for is_typing in (True, False):
+                event = {**_typing(1), "is_typing": is_typing}
+                await batcher.add(layer, "g", event, key=("typing", 1))
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+
+        events = layer.sent[0]["events"]
+        self.assertEqual(len(events), 1)
+        self.assertFalse(json.loads(events[0]["frame"])["is_typing"])
+
+
+class CanalChatConsumerFramesTest(SimpleTestCase):
+    """Formato de los frames según el opt-in `?batch=1` de cada conexión."""
+
+    def _batch_message(self, *user_ids):
+        layer = CountingChannelLayer(members=1)
+        batcher = GroupBatcher(interval=0.01)
+
+        async def run():
+            for user_id in user_ids:
+                await batcher.add(layer, "g", _typing(user_id), key=("typing", user_id))
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+        return layer.sent[0]
+
+    def test_legacy_client_gets_one_frame_per_event_without_its_own(self):
+        consumer = _consumer(1, batch_frames=False)
+
+        asyncio.run(consumer.batch(self._batch_message(1, 2, 3)))
+
+        frames = [json.loads(frame) for frame in consumer.frames]
+        self.assertEqual([frame["type"] for frame in frames], ["typing", "typing"])
+        self.assertEqual([frame["user_id"] for frame in frames], [2, 3])
+
+    def test_opt_in_client_gets_one_batch_frame_without_its_own(self):
+        consumer = _consumer(1, batch_frames=True)
+
+        asyncio.run(consumer.batch(self._batch_message(1, 2, 3)))
+
+        self.assertEqual(len(consumer.frames), 1)
+        frame = json.loads(consumer.frames[0])
+        self.assertEqual(frame["type"], "batch")
+        self.assertEqual([event["user_id"] for event in frame["events"]], [2, 3])
+
+    def test_only_own_events_sends_nothing(self):
+        consumer = _consumer(1, batch_frames=True)
+
+        asyncio.run(consumer.batch(self._batch_message(1)))
+
+        self.assertEqual(consumer.frames, [])
+
+    def test_disabled_batching_sends_legacy_frames(self):
+        layer = CountingChannelLayer(members=1)
+        batcher = GroupBatcher(interval=0)
+        asyncio.run(batcher.add(layer, "g", _typing(2), key=("typing", 2)))
+
+        own, other = _consumer(2, batch_frames=True), _consumer(1, batch_frames=True)
+        asyncio.run(own.ws_event(layer.sent[0]))
+        asyncio.run(other.ws_event(layer.sent[0]))
+
+        self.assertEqual(own.frames, [])
+        self.assertEqual(json.loads(other.frames[0]), _typing(2))
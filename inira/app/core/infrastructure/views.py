@@ -1,11 +1,14 @@
-import json
 import logging
 
+from django.db import transaction
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 
+from inira.app.payments.infrastructure.webhook_worker import enqueue_webhook
+from inira.app.shared.container import container
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,14 +16,21 @@ class WebHookAPIView(APIView):
     permission_classes = [AllowAny]  # importante para que Wompi pueda llamar
 
     def post(self, request):
+        logger.info(f"Webhook recibido de Wompi - Event: {request.data.get('event')}")
 
-        print("🔥 WEBHOOK RECIBIDO 🔥")
-        print(json.dumps(request.data, indent=4))
+        try:
+            use_case = container.payments().receive_wompi_webhook()
+            log, created = use_case.execute(request.data)
+        except PermissionError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        logger.info("Webhook recibido de Wompi")
-        logger.info(json.dumps(request.data, indent=4))
+        # 🔹 Responder rápido: el pago se actualiza en el worker
+        if created:
+            transaction.on_commit(lambda: enqueue_webhook(log.id))
 
         return Response(
-            {"message": "Webhook recibido correctamente"},
+            {"message": "Webhook recibido correctamente", "duplicate": not created},
             status=status.HTTP_200_OK,
         )
@@ -0,0 +1,22 @@
+# inira/app/events/application/use_cases/get_event_markers.py
+
+from typing import Tuple
+from inira.app.events.domain.repositories.events_repository import EventsRepository
+from inira.app.shared.map_tiles import load_tiles
+
+
+class GetEventMarkers:
+    def __init__(self, events_repository: EventsRepository):
+        self.events_repository = events_repository
+
+    def execute(self, *, bbox: Tuple[float, float, float, float], zoom: int):
+        return load_tiles(
+            prefix="events",
+            bbox=bbox,
+            zoom=zoom,
+            loader=lambda span, tile_size, cell_size: self.events_repository.map_markers(
+                bbox=span,
+                tile_size=tile_size,
+                cell_size=cell_size,
+            ),
+        )
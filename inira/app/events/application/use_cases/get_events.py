@@ -1,6 +1,6 @@
 # inira/app/events/domain/use_cases/get_events.py
 
-from typing import Optional
+from typing import Optional, Tuple
 from inira.app.events.domain.repositories.events_repository import EventsRepository
 
 
@@ -14,15 +14,41 @@ class GetEvents:
         id: Optional[str] = None,
         page: int = 1,
         page_size: int = 10,
+        cursor: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
     ):
         # 🔹 UN EVENTO
         if id:
             return self.events_repository.find_by_id(id)
 
+        # 🔹 MUCHOS EVENTOS (PAGINADOS POR CURSOR, SIN COUNT)
+        if cursor is not None:
+            events, next_cursor = self.events_repository.paginate_by_cursor(
+                cursor=cursor,
+                page_size=page_size,
+                lat=lat,
+                lng=lng,
+                radius_km=radius_km,
+                bbox=bbox,
+            )
+
+            return {
+                "page_size": page_size,
+                "next_cursor": next_cursor,
+                "results": events,
+            }
+
         # 🔹 MUCHOS EVENTOS (PAGINADOS)
         total, events = self.events_repository.paginate(
             page=page,
             page_size=page_size,
+            lat=lat,
+            lng=lng,
+            radius_km=radius_km,
+            bbox=bbox,
         )
 
         return {
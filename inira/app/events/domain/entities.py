@@ -18,3 +18,6 @@ class EventEntity:
 
     meeting_point_lat: float | None
     meeting_point_lng: float | None
+
+    # Distancia al punto de búsqueda (solo en búsquedas por ubicación)
+    distance_km: float | None = None
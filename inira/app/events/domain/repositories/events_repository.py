@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from inira.app.events.domain.entities import EventEntity
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 class EventsRepository(ABC):
 
@@ -17,5 +17,37 @@ class EventsRepository(ABC):
         *,
         page: int,
         page_size: int,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
     ) -> Tuple[int, List[EventEntity]]:
         pass
+
+    @abstractmethod
+    def paginate_by_cursor(
+        self,
+        *,
+        cursor: Optional[str],
+        page_size: int,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Tuple[List[EventEntity], Optional[str]]:
+        """Pagina por cursor (keyset); retorna (eventos, siguiente cursor)"""
+        pass
+
+    @abstractmethod
+    def map_markers(
+        self,
+        *,
+        bbox: Tuple[float, float, float, float],
+        tile_size: float,
+        cell_size: Optional[float] = None,
+    ) -> List[dict]:
+        """
+        Marcadores compactos del bbox (puntos o clusters si hay cell_size),
+        cada uno con el `tile` (x, y) de la grilla de `tile_size` al que pertenece
+        """
+        pass
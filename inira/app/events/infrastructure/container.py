@@ -1,5 +1,6 @@
 from dependency_injector import containers, providers
 from inira.app.events.application.use_cases.get_events import GetEvents
+from inira.app.events.application.use_cases.get_event_markers import GetEventMarkers
 from inira.app.events.application.use_cases.register_user_to_event import RegisterUserToEvent
 from inira.app.events.infrastructure.repositories.event_registration_repository_impl import EventRegistrationRepositoryImpl
 from inira.app.events.infrastructure.repositories.events_repository_impl import EventsRepositoryImpl
@@ -23,3 +24,8 @@ class EventsContainer(containers.DeclarativeContainer):
         GetEvents,
         events_repository=events_repository,
     )
+
+    get_event_markers=providers.Factory(
+        GetEventMarkers,
+        events_repository=events_repository,
+    )
@@ -0,0 +1,63 @@
+# inira/app/events/infrastructure/docs/get_event_markers_docs.py
+
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiExample,
+)
+from drf_spectacular.types import OpenApiTypes
+
+
+get_event_markers_docs = extend_schema(
+    tags=["Eventos"],
+    summary="Marcadores de eventos para el mapa",
+    description=(
+        "Retorna marcadores compactos de los eventos cuyo punto de encuentro está "
+        "dentro del área visible del mapa.\n\n"
+        "- Con `zoom` menor a 12 los puntos se agrupan en clusters (`type = cluster`).\n"
+        "- Desde `zoom` 12 se retornan puntos con id, coordenadas, título y fecha "
+        "(`type = point`).\n\n"
+        "La respuesta se arma por tiles cacheados."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="bbox",
+            description="Área visible del mapa: `min_lng,min_lat,max_lng,max_lat`",
+            required=True,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="zoom",
+            description="Nivel de zoom del mapa (0 a 20)",
+            required=True,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={
+        200: OpenApiTypes.OBJECT,
+        400: OpenApiTypes.OBJECT,
+    },
+    examples=[
+        OpenApiExample(
+            name="Puntos (zoom alto)",
+            value={
+                "zoom": 14,
+                "clustered": False,
+                "items": [
+                    {
+                        "type": "point",
+                        "id": "c56a4180-65aa-42ec-a945-5fd21dec0538",
+                        "lat": 6.25184,
+                        "lng": -75.56359,
+                        "title": "Caminata al amanecer",
+                        "date": "2025-03-01T06:00:00+00:00",
+                    },
+                ],
+            },
+            response_only=True,
+            status_codes=["200"],
+        ),
+    ],
+)
@@ -39,6 +39,45 @@ get_events_docs = extend_schema(
             type=OpenApiTypes.INT,
             location=OpenApiParameter.QUERY,
         ),
+        OpenApiParameter(
+            name="cursor",
+            description=(
+                "Activa la paginación por cursor. Enviar vacío para la primera página "
+                "y luego el valor de `next_cursor`. En este modo no se retorna `count` "
+                "y no se admiten `lat`/`lng` (responde 400)."
+            ),
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="lat",
+            description="Latitud del usuario. Con `lng`, ordena por cercanía y agrega `distance_km`",
+            required=False,
+            type=OpenApiTypes.FLOAT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="lng",
+            description="Longitud del usuario (requerida junto con `lat`)",
+            required=False,
+            type=OpenApiTypes.FLOAT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="radius",
+            description="Radio de búsqueda en km alrededor de `lat`/`lng` (máximo = 500)",
+            required=False,
+            type=OpenApiTypes.FLOAT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="bbox",
+            description="Área visible del mapa: `min_lng,min_lat,max_lng,max_lat`",
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
     ],
     responses={
         200: OpenApiTypes.OBJECT,
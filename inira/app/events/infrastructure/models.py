@@ -17,34 +17,30 @@ class Evento(models.Model):
 
     # 👤 Organizador
     organized_by = models.ForeignKey(
-        User,
-        on_delete=models.SET_NULL,
-        null=True,
-        related_name="eventos_organizados"
+        User, on_delete=models.SET_NULL, null=True, related_name="eventos_organizados"
     )
 
     # 📍 Punto de reunión (PostGIS)
     meeting_point = models.PointField(
-        geography=True,
-        spatial_index=True,
-        null=True,
-        blank=True
+        geography=True, spatial_index=True, null=True, blank=True
     )
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 🔹 Paginación por cursor: (date, id) DESC recorre el índice
+            models.Index(fields=["date", "id"], name="eventos_date_id_idx"),
+        ]
+
 
 class EventoInscripcion(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     evento = models.ForeignKey(
-        Evento,
-        on_delete=models.CASCADE,
-        related_name="inscripciones"
+        Evento, on_delete=models.CASCADE, related_name="inscripciones"
     )
     user = models.ForeignKey(
-        User,
-        on_delete=models.CASCADE,
-        related_name="eventos_inscritos"
+        User, on_delete=models.CASCADE, related_name="eventos_inscritos"
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -19,6 +19,9 @@ class EventOutputSerializer(serializers.Serializer):
 
     meeting_point = serializers.SerializerMethodField()
 
+    # 🆕 Solo en búsquedas por ubicación (lat/lng)
+    distance_km = serializers.FloatField(allow_null=True, required=False)
+
     def get_meeting_point(self, obj):
         if obj.meeting_point_lat is None or obj.meeting_point_lng is None:
             return None
@@ -5,6 +5,8 @@ from rest_framework.exceptions import NotFound
 
 from inira.app.events.domain.entities import EventEntity
 from inira.app.events.infrastructure.models import Evento
+from inira.app.shared.geo import apply_geo_filters, tile_clusters, tile_points
+from inira.app.shared.pagination import keyset_page
 
 
 class EventsRepositoryImpl:
@@ -22,14 +24,26 @@ class EventsRepositoryImpl:
 
         return self._to_entity(event)
 
-    def paginate(self, *, page: int, page_size: int):
-        queryset = (
-            Evento.objects
-            .annotate(participants_count=Count("inscripciones"))
-            .select_related("organized_by")
-            .order_by("-date")
+    def paginate(
+        self,
+        *,
+        page: int,
+        page_size: int,
+        lat=None,
+        lng=None,
+        radius_km=None,
+        bbox=None,
+    ):
+        queryset = self._geo_queryset(
+            lat=lat, lng=lng, radius_km=radius_km, bbox=bbox
         )
 
+        # 🔹 Con ubicación se ordena por cercanía al punto de encuentro
+        if lat is not None and lng is not None:
+            queryset = queryset.order_by("distance_m", "-date")
+        else:
+            queryset = queryset.order_by("-date")
+
         total = queryset.count()
 
         offset = (page - 1) * page_size
@@ -39,7 +53,82 @@ class EventsRepositoryImpl:
 
         return total, events
 
+    def paginate_by_cursor(
+        self,
+        *,
+        cursor,
+        page_size: int,
+        lat=None,
+        lng=None,
+        radius_km=None,
+        bbox=None,
+    ):
+        # 🔹 Keyset sobre (date, id): sin OFFSET ni COUNT
+        models, next_cursor = keyset_page(
+            self._geo_queryset(lat=lat, lng=lng, radius_km=radius_km, bbox=bbox),
+            cursor=cursor,
+            page_size=page_size,
+            field="date",
+            descending=True,
+        )
+
+        return [self._to_entity(e) for e in models], next_cursor
+
+    def map_markers(self, *, bbox, tile_size, cell_size=None):
+        queryset = Evento.objects.all()
+
+        # 🔹 Zoom bajo: clusters de grilla calculados en la base de datos
+        if cell_size:
+            return tile_clusters(
+                queryset,
+                field="meeting_point",
+                bbox=bbox,
+                tile_size=tile_size,
+                cell_size=cell_size,
+            )
+
+        # 🔹 Zoom alto: solo las columnas necesarias para dibujar el pin
+        rows = tile_points(
+            queryset,
+            field="meeting_point",
+            bbox=bbox,
+            tile_size=tile_size,
+            values=("id", "title", "date"),
+        )
+
+        return [
+            {
+                "tile": (int(row["tx"]), int(row["ty"])),
+                "type": "point",
+                "id": str(row["id"]),
+                "lat": round(row["y"], 6),
+                "lng": round(row["x"], 6),
+                "title": row["title"],
+                "date": row["date"].isoformat(),
+            }
+            for row in rows
+        ]
+
+    def _base_queryset(self):
+        return (
+            Evento.objects
+            .annotate(participants_count=Count("inscripciones"))
+            .select_related("organized_by")
+        )
+
+    def _geo_queryset(self, *, lat, lng, radius_km, bbox):
+        return apply_geo_filters(
+            self._base_queryset(),
+            field="meeting_point",
+            lat=lat,
+            lng=lng,
+            radius_km=radius_km,
+            bbox=bbox,
+        )
+
     def _to_entity(self, model: Evento) -> EventEntity:
+        distance_m = getattr(model, "distance_m", None)
+
         return EventEntity(
             id=str(model.id),
             title=model.title,
@@ -59,4 +148,8 @@ class EventsRepositoryImpl:
             meeting_point_lng=(
                 model.meeting_point.x if model.meeting_point else None
             ),
+
+            distance_km=(
+                round(distance_m / 1000, 2) if distance_m is not None else None
+            ),
         )
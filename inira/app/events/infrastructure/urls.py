@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import EventoInscripcionAPIView,EventoAPIView
+from .views import EventoInscripcionAPIView,EventoAPIView,EventoMapAPIView
 
 urlpatterns = [
     path("evento-inscripcion/", EventoInscripcionAPIView.as_view(), name="EventoInscripcionAPIView"),
     path("evento/", EventoAPIView.as_view(), name="Evento"),
+    path("evento/mapa/", EventoMapAPIView.as_view(), name="EventoMapa"),
 ]
@@ -8,10 +8,12 @@ from rest_framework.permissions import AllowAny
 from rest_framework.exceptions import ValidationError
 
 from inira.app.shared.container import container
+from inira.app.shared.geo import GeoQueryInputSerializer, MapViewportInputSerializer
 from inira.app.events.infrastructure.out.event_output_serializer import (
     EventOutputSerializer
 )
 from inira.app.events.infrastructure.docs.get_events_docs import get_events_docs
+from inira.app.events.infrastructure.docs.get_event_markers_docs import get_event_markers_docs
 from inira.app.events.infrastructure.docs.post_event_registration_docs import  post_event_registration_docs
 
 class EventoInscripcionAPIView(APIView):
@@ -48,6 +50,10 @@ class EventoAPIView(APIView):
         - id: UUID (opcional)
         - page: int (opcional, default=1)
         - page_size: int (opcional, default=10)
+        - cursor: str (opcional, activa la paginación por cursor; no admite lat/lng)
+        - lat, lng: float (opcional, ordena por cercanía y retorna distance_km)
+        - radius: float (opcional, km alrededor de lat/lng)
+        - bbox: str (opcional, min_lng,min_lat,max_lng,max_lat)
         """
 
         event_id = request.query_params.get("id")
@@ -70,16 +76,42 @@ class EventoAPIView(APIView):
             serializer = EventOutputSerializer(event)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
+        geo = GeoQueryInputSerializer(data=request.query_params.dict())
+        geo.is_valid(raise_exception=True)
+
+        # 🔹 El cursor recorre el orden por fecha: la cercanía no aplica
+        if "cursor" in request.query_params and "lat" in geo.validated_data:
+            raise ValidationError(
+                {"cursor": "La paginación por cursor no se combina con lat/lng"}
+            )
+
         result = use_case.execute(
             page=page,
             page_size=page_size,
+            cursor=request.query_params.get("cursor"),
+            lat=geo.validated_data.get("lat"),
+            lng=geo.validated_data.get("lng"),
+            radius_km=geo.validated_data.get("radius"),
+            bbox=geo.validated_data.get("bbox"),
         )
 
         events = result["results"]
-        total = result["count"]
 
         serializer = EventOutputSerializer(events, many=True)
 
+        # 🔹 Modo cursor (opt-in): sin count ni número de página
+        if "next_cursor" in result:
+            return Response(
+                {
+                    "page_size": page_size,
+                    "next_cursor": result["next_cursor"],
+                    "results": serializer.data,
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        total = result["count"]
+
         return Response(
             {
                 "count": total,
@@ -88,4 +120,23 @@ class EventoAPIView(APIView):
                 "results": serializer.data,
             },
             status=status.HTTP_200_OK,
-        )
\ No newline at end of file
+        )
+
+
+class EventoMapAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @get_event_markers_docs
+    def get(self, request, *args, **kwargs):
+        params = MapViewportInputSerializer(data=request.query_params.dict())
+        params.is_valid(raise_exception=True)
+
+        use_case = container.events().get_event_markers()
+        result = use_case.execute(
+            bbox=params.validated_data["bbox"],
+            zoom=params.validated_data["zoom"],
+        )
+
+        response = Response(result, status=status.HTTP_200_OK)
+        response["Cache-Control"] = "private, max-age=60"
+        return response
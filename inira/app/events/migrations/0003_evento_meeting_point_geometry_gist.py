@@ -0,0 +1,20 @@
+from django.db import migrations
+
+# 🔹 Los filtros por bbox comparan `meeting_point::geometry && ST_MakeEnvelope(...)`
+# (rectángulo plano); el índice geography no sirve para esa expresión
+CREATE_INDEX = """
+CREATE INDEX IF NOT EXISTS eventos_meeting_point_geometry_gist
+    ON events_evento USING GIST ((meeting_point::geometry));
+"""
+
+DROP_INDEX = "DROP INDEX IF EXISTS eventos_meeting_point_geometry_gist;"
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0002_evento_meeting_point_evento_organized_by"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_INDEX, DROP_INDEX),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0003_evento_meeting_point_geometry_gist"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="evento",
+            index=models.Index(fields=["date", "id"], name="eventos_date_id_idx"),
+        ),
+    ]
@@ -55,8 +55,24 @@ class PaymentWebhookLogAdmin(admin.ModelAdmin):
         "event_type",
         "status",
         "processed",
+        "attempts",
         "created_at",
     ]
     list_filter = ["processed", "event_type", "status", "created_at"]
     search_fields = ["transaction_id"]
     readonly_fields = ["raw_payload"]
+
+
+@admin.register(SlotHold)
+class SlotHoldAdmin(admin.ModelAdmin):
+    list_display = [
+        "availability",
+        "payment",
+        "user",
+        "slots",
+        "status",
+        "expires_at",
+        "created_at",
+    ]
+    list_filter = ["status", "expires_at"]
+    search_fields = ["payment__wompi_reference", "user__email"]
@@ -1,12 +1,21 @@
 # inira/app/payments/application/use_cases/check_payment_status.py
 
 import logging
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
 from inira.app.payments.domain.services.wompi_services import WompiService
 from inira.app.payments.domain.repositories.payment_repository import PaymentRepository
-from inira.app.payments.infrastructure.models import Payment
+from inira.app.payments.domain.payment_status import is_final
 
 logger = logging.getLogger(__name__)
 
+# 🔹 Los estados finales se sirven desde cache/DB sin consultar a Wompi
+FINAL_RESULT_TIMEOUT = 60 * 60 * 24
+
+
+def _result_key(payment_id) -> str:
+    return f"payment_status:{payment_id}"
+
 
 class CheckPaymentStatus:
     def __init__(
@@ -21,16 +30,43 @@ class CheckPaymentStatus:
         """
         Verifica el estado de un pago en Wompi y actualiza la base de datos.
         Valida que el pago pertenezca al usuario autenticado.
+        Si el pago ya está en un estado final no se consulta a Wompi.
         """
+        payment = self._get_owned_payment(payment_id, user_id)
+
+        if is_final(payment.status):
+            return self._final_result(payment)
+
+        # 3. Consultar estado en Wompi
+        wompi_response = self.wompi_service.get_transaction_status(
+            payment.wompi_transaction_id
+        )
+
+        return self._apply_wompi_status(payment, wompi_response)
+
+    async def aexecute(self, payment_id: str, user_id: int):
+        """Variante async (requiere un AsyncWompiService)."""
+        payment = await sync_to_async(self._get_owned_payment)(payment_id, user_id)
+
+        if is_final(payment.status):
+            return await sync_to_async(self._final_result)(payment)
+
+        # 3. Consultar estado en Wompi
+        wompi_response = await self.wompi_service.aget_transaction_status(
+            payment.wompi_transaction_id
+        )
+
+        return await sync_to_async(self._apply_wompi_status)(payment, wompi_response)
 
+    def _get_owned_payment(self, payment_id: str, user_id: int):
         logger.info(
             f"[CHECK_STATUS] Consultando pago - "
             f"Payment ID: {payment_id}, "
             f"User ID: {user_id}"
         )
 
-        # 1. Buscar el pago
-        payment: Payment = self.payment_repository.get_by_id(payment_id)
+        # 1. Buscar el pago (sin participantes)
+        payment = self.payment_repository.get_status_snapshot(payment_id)
 
         if not payment:
             logger.warning(
@@ -55,11 +91,9 @@ class CheckPaymentStatus:
             f"Current Status: {payment.status}"
         )
 
-        # 3. Consultar estado en Wompi
-        wompi_response = self.wompi_service.get_transaction_status(
-            payment.wompi_transaction_id
-        )
+        return payment
 
+    def _apply_wompi_status(self, payment, wompi_response: dict) -> dict:
         wompi_data = wompi_response.get("data", {})
         new_status = wompi_data.get("status")
 
@@ -100,6 +134,27 @@ class CheckPaymentStatus:
                 f"Status: {payment.status}"
             )
 
+        result = self._build_result(payment, redirect_url, extra)
+
+        if is_final(payment.status):
+            cache.set(_result_key(payment.id), result, FINAL_RESULT_TIMEOUT)
+
+        return result
+
+    def _final_result(self, payment) -> dict:
+        logger.info(
+            f"[CHECK_STATUS] Estado final, sin consultar Wompi - "
+            f"Payment ID: {payment.id}, "
+            f"Status: {payment.status}"
+        )
+
+        cached = cache.get(_result_key(payment.id))
+        if cached and cached["status"] == payment.status:
+            return cached
+
+        return self._build_result(payment, None, {})
+
+    def _build_result(self, payment, redirect_url, extra: dict) -> dict:
         return {
             "payment_id": str(payment.id),
             "transaction_id": payment.wompi_transaction_id,
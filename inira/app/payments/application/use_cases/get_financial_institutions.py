@@ -1,24 +1,45 @@
 # inira/app/payments/application/use_cases/get_financial_institutions.py
 
+import hashlib
+import json
 import logging
+from asgiref.sync import sync_to_async
+from django.utils import timezone
 from inira.app.payments.domain.services.wompi_services import WompiService
+from inira.app.shared.cache import get_with_refresh_ahead
 
 logger = logging.getLogger(__name__)
 
+CACHE_KEY = "wompi_pse_financial_institutions"
+
+# 🔹 Se refresca en segundo plano cada hora; si Wompi falla se sigue
+# sirviendo la última lista válida hasta por 7 días
+REFRESH_EVERY = 60 * 60
+LAST_KNOWN_GOOD_TTL = 7 * 24 * 60 * 60
+
 
 class GetFinancialInstitutions:
     def __init__(self, wompi_service: WompiService):
         self.wompi_service = wompi_service
 
-    def execute(self) -> list:
+    def execute(self) -> dict:
+        """
+        Retorna la lista de bancos PSE junto con su ETag y fecha de
+        modificación para respuestas condicionales (304).
+        """
         logger.info("[INICIO] Obteniendo instituciones financieras PSE")
 
         try:
-            institutions = self.wompi_service.get_financial_institutions()
+            result = get_with_refresh_ahead(
+                CACHE_KEY,
+                self._fetch,
+                timeout=LAST_KNOWN_GOOD_TTL,
+                refresh_ahead=LAST_KNOWN_GOOD_TTL - REFRESH_EVERY,
+            )
 
-            logger.info(f"[FIN] Instituciones obtenidas - Total: {len(institutions)}")
+            logger.info(f"[FIN] Instituciones obtenidas - Total: {len(result['data'])}")
 
-            return institutions
+            return result
 
         except Exception as e:
             logger.error(
@@ -26,3 +47,19 @@ class GetFinancialInstitutions:
                 exc_info=True,
             )
             raise
+
+    async def aexecute(self) -> dict:
+        """Variante async: en caliente solo lee el cache compartido."""
+        return await sync_to_async(self.execute, thread_sensitive=False)()
+
+    def _fetch(self) -> dict:
+        institutions = self.wompi_service.get_financial_institutions()
+
+        raw = json.dumps(institutions, sort_keys=True, default=str)
+        etag = hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+        return {
+            "data": institutions,
+            "etag": f'"{etag}"',
+            "last_modified": timezone.now(),
+        }
@@ -1,8 +1,15 @@
 # inira/app/payments/application/use_cases/process_wompi_payment.py
 
 import logging
+from contextlib import contextmanager
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
 from inira.app.payments.domain.services.wompi_services import WompiService
 from inira.app.payments.domain.repositories.payment_repository import PaymentRepository
+from inira.app.payments.domain.repositories.slot_hold_repository import (
+    SlotHoldRepository,
+)
 from inira.app.routes.domain.entities import RouteEntity
 from inira.app.routes.domain.repositories import RoutesRepository
 from inira.app.routes.infrastructure.models import RutaAvailability
@@ -16,13 +23,79 @@ class ProcessWompiPayment:
         wompi_service: WompiService,
         payment_repository: PaymentRepository,
         routes_repository: RoutesRepository,  # 🆕
+        slot_hold_repository: SlotHoldRepository,
     ):
         self.wompi_service = wompi_service
         self.payment_repository = payment_repository
         self.routes_repository = routes_repository
+        self.slot_hold_repository = slot_hold_repository
 
     def execute(self, payment_data: dict):
+        with self._error_handling(payment_data["user_id"]):
+            prepared = self._prepare(payment_data)
 
+            with self._release_hold_on_error(prepared["hold_id"]):
+                # 6. Crear la transacción en Wompi
+                wompi_response = self.wompi_service.create_pse_transaction(
+                    **prepared["transaction"]
+                )
+
+                return self._persist(payment_data, prepared, wompi_response)
+
+    async def aexecute(self, payment_data: dict):
+        """
+        Variante async: la llamada a Wompi no ocupa un hilo mientras espera.
+        Requiere un AsyncWompiService; el acceso a la base de datos se
+        delega a sync_to_async.
+        """
+        with self._error_handling(payment_data["user_id"]):
+            prepared = await sync_to_async(self._prepare)(payment_data)
+
+            try:
+                # 6. Crear la transacción en Wompi
+                wompi_response = await self.wompi_service.acreate_pse_transaction(
+                    **prepared["transaction"]
+                )
+
+                return await sync_to_async(self._persist)(
+                    payment_data, prepared, wompi_response
+                )
+            except BaseException:
+                await sync_to_async(self.slot_hold_repository.release)(
+                    [prepared["hold_id"]]
+                )
+                raise
+
+    @contextmanager
+    def _error_handling(self, user_id):
+        try:
+            yield
+
+        except ValueError:
+            raise
+
+        except KeyError as e:
+            logger.error(f"[ERROR] Campo faltante: {str(e)} - User ID: {user_id}")
+            raise ValueError(f"Campo requerido faltante: {str(e)}")
+
+        except Exception as e:
+            logger.error(
+                f"[ERROR] Error inesperado - User ID: {user_id}, Error: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    @contextmanager
+    def _release_hold_on_error(self, hold_id: str):
+        try:
+            yield
+        except BaseException:
+            # Sin transacción creada los cupos vuelven a estar disponibles
+            self.slot_hold_repository.release([hold_id])
+            raise
+
+    def _prepare(self, payment_data: dict) -> dict:
+        """Valida ruta, capacidad y disponibilidad; arma la transacción y retiene los cupos."""
         user_id = payment_data["user_id"]
         ruta_id = payment_data["ruta_id"]
         booking_date = payment_data["booking_date"]
@@ -36,83 +109,108 @@ class ProcessWompiPayment:
             f"Participants: {total_participants}"
         )
 
-        try:
-            # 1. Validar que la ruta exista y esté activa
-            ruta: RouteEntity = self.routes_repository.find_by_id(ruta_id)
+        # 1. Validar que la ruta exista y esté activa
+        ruta: RouteEntity = self.routes_repository.find_by_id(ruta_id)
 
-            if not ruta.is_active:
-                raise ValueError("Esta ruta no está disponible actualmente")
+        if not ruta.is_active:
+            raise ValueError("Esta ruta no está disponible actualmente")
 
-            # 2. Validar límites de participantes
-            ruta.validate_booking_capacity(total_participants)
+        # 2. Validar límites de participantes
+        ruta.validate_booking_capacity(total_participants)
 
-            # 3. Validar disponibilidad por fecha
-            availability: RutaAvailability = (
-                self.routes_repository.get_availability_for_date(ruta_id, booking_date)
-            )
+        # 3. Validar disponibilidad por fecha
+        availability: RutaAvailability = (
+            self.routes_repository.get_availability_for_date(ruta_id, booking_date)
+        )
 
-            if not availability.has_available_slots:
-                raise ValueError("No hay cupos disponibles para esta fecha")
+        if not availability.has_available_slots:
+            raise ValueError("No hay cupos disponibles para esta fecha")
 
-            if availability.available_slots < total_participants:
-                raise ValueError(
-                    f"Solo quedan {availability.available_slots} cupos disponibles"
-                )
+        if availability.available_slots < total_participants:
+            raise ValueError(
+                f"Solo quedan {availability.available_slots} cupos disponibles"
+            )
 
-            # 4. Calcular monto en centavos desde el precio de la ruta
-            amount_in_cents = int(ruta.base_price * total_participants * 100)
+        # 4. Calcular monto en centavos desde el precio de la ruta
+        amount_in_cents = int(ruta.base_price * total_participants * 100)
 
-            logger.info(
-                f"[VALIDACIÓN] Ruta válida - "
-                f"Price: {ruta.base_price}, "
-                f"Participants: {total_participants}, "
-                f"Total cents: {amount_in_cents}"
-            )
+        logger.info(
+            f"[VALIDACIÓN] Ruta válida - "
+            f"Price: {ruta.base_price}, "
+            f"Participants: {total_participants}, "
+            f"Total cents: {amount_in_cents}"
+        )
 
-            # 5. Generar referencia
-            reference = (
-                payment_data.get("reference")
-                or f"PAY_USER_{user_id}_{payment_data.get('timestamp', '')}"
-            )
+        # 5. Generar referencia
+        reference = (
+            payment_data.get("reference")
+            or f"PAY_USER_{user_id}_{payment_data.get('timestamp', '')}"
+        )
 
-            logger.info(f"[REFERENCIA] Generada: {reference}")
-
-            # 6. Crear la transacción en Wompi
-            wompi_response = self.wompi_service.create_pse_transaction(
-                amount_in_cents=amount_in_cents,
-                reference=reference,
-                customer_email=payment_data["user_email"],
-                customer_phone=participants[0]["phone"],
-                customer_full_name=participants[0]["full_name"],
-                user_legal_id=payment_data["user_legal_id"],
-                user_legal_id_type=payment_data["user_legal_id_type"],
-                user_type=payment_data["user_type"],
-                financial_institution_code=payment_data["financial_institution_code"],
-            )
+        logger.info(f"[REFERENCIA] Generada: {reference}")
+
+        wompi_transaction = {
+            "amount_in_cents": amount_in_cents,
+            "reference": reference,
+            "customer_email": payment_data["user_email"],
+            "customer_phone": participants[0]["phone"],
+            "customer_full_name": participants[0]["full_name"],
+            "user_legal_id": payment_data["user_legal_id"],
+            "user_legal_id_type": payment_data["user_legal_id_type"],
+            "user_type": payment_data["user_type"],
+            "financial_institution_code": payment_data["financial_institution_code"],
+        }
+
+        # 🆕 Retener los cupos al final: si algo de lo anterior falla no
+        # queda una retención huérfana; desde aquí cualquier error la libera
+        hold_id = self.slot_hold_repository.hold(
+            availability_id=availability.id,
+            user_id=user_id,
+            slots=total_participants,
+            ttl_seconds=settings.BOOKING_HOLD_MINUTES * 60,
+        )
 
-            transaction_id = wompi_response["data"]["id"]
-            transaction_status = wompi_response["data"]["status"]
-            redirect_url = (
-                wompi_response["data"]
-                .get("payment_method", {})
-                .get("extra", {})
-                .get("async_payment_url")
-            )
+        return {
+            "hold_id": hold_id,
+            "amount_in_cents": amount_in_cents,
+            "reference": reference,
+            "total_participants": total_participants,
+            "transaction": wompi_transaction,
+        }
 
-            logger.info(
-                f"[WOMPI] Transacción creada - "
-                f"Transaction ID: {transaction_id}, "
-                f"Status: {transaction_status}"
-            )
+    def _persist(self, payment_data: dict, prepared: dict, wompi_response: dict):
+        """Guarda el pago con la respuesta de Wompi y arma el resultado."""
+        user_id = payment_data["user_id"]
+        ruta_id = payment_data["ruta_id"]
+        booking_date = payment_data["booking_date"]
+        participants = payment_data.get("participants", [])
+        total_participants = prepared["total_participants"]
+
+        transaction_id = wompi_response["data"]["id"]
+        transaction_status = wompi_response["data"]["status"]
+        redirect_url = (
+            wompi_response["data"]
+            .get("payment_method", {})
+            .get("extra", {})
+            .get("async_payment_url")
+        )
 
-            # 7. Guardar el pago con participantes
+        logger.info(
+            f"[WOMPI] Transacción creada - "
+            f"Transaction ID: {transaction_id}, "
+            f"Status: {transaction_status}"
+        )
+
+        # 7. Guardar el pago y confirmar la retención en una sola transacción:
+        # un fallo a mitad de camino no deja un pago sin sus cupos
+        with transaction.atomic():
             payment = self.payment_repository.create(
                 user_id=user_id,
                 wompi_transaction_id=transaction_id,
-                amount_in_cents=amount_in_cents,
+                amount_in_cents=prepared["amount_in_cents"],
                 status=transaction_status,
                 payment_method_type="PSE",
-                reference=reference,
+                reference=prepared["reference"],
                 ruta_id=ruta_id,
                 booking_date=booking_date,
                 total_participants=total_participants,
@@ -126,27 +224,19 @@ class ProcessWompiPayment:
 
             logger.info(f"[DB] Pago guardado - Payment ID: {payment.id}")
 
-            return {
-                "payment_id": str(payment.id),
-                "transaction_id": transaction_id,
-                "status": transaction_status,
-                "redirect_url": redirect_url,
-                "ruta_id": str(ruta_id),
-                "booking_date": str(booking_date),
-                "total_participants": total_participants,
-                "amount": str(payment.amount),
-            }
-
-        except ValueError:
-            raise
-
-        except KeyError as e:
-            logger.error(f"[ERROR] Campo faltante: {str(e)} - User ID: {user_id}")
-            raise ValueError(f"Campo requerido faltante: {str(e)}")
-
-        except Exception as e:
-            logger.error(
-                f"[ERROR] Error inesperado - User ID: {user_id}, Error: {str(e)}",
-                exc_info=True,
-            )
-            raise
+            self.slot_hold_repository.attach_payment(prepared["hold_id"], payment.id)
+
+            # Wompi puede responder ya con un estado final
+            if transaction_status != "PENDING":
+                self.slot_hold_repository.settle({payment.id: transaction_status})
+
+        return {
+            "payment_id": str(payment.id),
+            "transaction_id": transaction_id,
+            "status": transaction_status,
+            "redirect_url": redirect_url,
+            "ruta_id": str(ruta_id),
+            "booking_date": str(booking_date),
+            "total_participants": total_participants,
+            "amount": str(payment.amount),
+        }
@@ -0,0 +1,81 @@
+# inira/app/payments/application/use_cases/process_wompi_webhook.py
+
+import logging
+from typing import Optional
+from inira.app.payments.domain.repositories.payment_repository import PaymentRepository
+from inira.app.payments.domain.repositories.webhook_log_repository import (
+    WebhookLogRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessWompiWebhook:
+    def __init__(
+        self,
+        payment_repository: PaymentRepository,
+        webhook_log_repository: WebhookLogRepository,
+    ):
+        self.payment_repository = payment_repository
+        self.webhook_log_repository = webhook_log_repository
+
+    def execute(self, log_id: str) -> Optional[dict]:
+        """
+        Aplica un evento registrado al pago correspondiente.
+
+        Returns:
+            Datos del nuevo estado si el pago cambió (para notificar al
+            pagador), o None si no hubo cambios.
+        """
+        log = self.webhook_log_repository.get_by_id(log_id)
+
+        if not log or log.processed:
+            return None
+
+        try:
+            return self._apply(log)
+        except Exception as e:
+            # Falla transitoria (p. ej. base de datos): se reintenta con backoff
+            self.webhook_log_repository.mark_failed(log.id, error_message=str(e))
+            raise
+
+    def _apply(self, log) -> Optional[dict]:
+        payment = self.payment_repository.get_by_transaction_id(log.transaction_id)
+
+        if not payment:
+            # El webhook puede llegar antes de que se guarde el pago: se
+            # reintenta hasta agotar los intentos
+            logger.warning(
+                f"[WEBHOOK] Pago no encontrado - Transaction ID: {log.transaction_id}"
+            )
+            self.webhook_log_repository.mark_failed(
+                log.id, error_message="Pago no encontrado"
+            )
+            return None
+
+        # 🔹 La comparación (mismo estado, regresión desde uno final) se hace
+        # con el pago bloqueado: dos eventos simultáneos no cambian dos veces
+        old_status = (
+            self.payment_repository.transition_status(payment.id, log.status)
+            if log.status
+            else None
+        )
+        self.webhook_log_repository.mark_processed(log.id, payment_id=payment.id)
+
+        if old_status is None:
+            return None
+
+        logger.info(
+            f"[WEBHOOK] Pago actualizado - "
+            f"Payment ID: {payment.id}, "
+            f"Status: {old_status} → {log.status}"
+        )
+
+        return {
+            "user_id": payment.user_id,
+            "payment_id": str(payment.id),
+            "transaction_id": payment.wompi_transaction_id,
+            "status": log.status,
+            "previous_status": old_status,
+            "reference": payment.wompi_reference,
+        }
@@ -0,0 +1,58 @@
+# inira/app/payments/application/use_cases/receive_wompi_webhook.py
+
+import logging
+from inira.app.payments.domain.repositories.webhook_log_repository import (
+    WebhookLogRepository,
+)
+from inira.app.payments.domain.services.wompi_services import WompiService
+
+logger = logging.getLogger(__name__)
+
+
+class ReceiveWompiWebhook:
+    def __init__(
+        self,
+        wompi_service: WompiService,
+        webhook_log_repository: WebhookLogRepository,
+    ):
+        self.wompi_service = wompi_service
+        self.webhook_log_repository = webhook_log_repository
+
+    def execute(self, event: dict):
+        """
+        Valida y registra un evento de Wompi (idempotente).
+
+        Returns:
+            (log, created): created es False si el evento ya se había recibido
+
+        Raises:
+            PermissionError: Si el checksum no es válido
+            ValueError: Si el evento no trae la transacción
+        """
+        if not self.wompi_service.verify_event_checksum(event):
+            logger.warning(f"[WEBHOOK] Checksum inválido - Event: {event.get('event')}")
+            raise PermissionError("Checksum del evento inválido")
+
+        transaction_data = event.get("data", {}).get("transaction") or {}
+        transaction_id = transaction_data.get("id")
+
+        if not transaction_id:
+            raise ValueError("El evento no contiene data.transaction.id")
+
+        log, created = self.webhook_log_repository.record(
+            event_type=event.get("event", ""),
+            transaction_id=transaction_id,
+            event_timestamp=event.get("timestamp"),
+            status=transaction_data.get("status", ""),
+            raw_payload=event,
+        )
+
+        logger.info(
+            f"[WEBHOOK] Evento registrado - "
+            f"Log ID: {log.id}, "
+            f"Transaction ID: {transaction_id}, "
+            f"Status: {log.status}, "
+            f"Nuevo: {created}"
+        )
+
+        return log, created
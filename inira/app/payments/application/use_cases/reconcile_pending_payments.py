@@ -0,0 +1,184 @@
+# inira/app/payments/application/use_cases/reconcile_pending_payments.py
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from inira.app.payments.domain.repositories.payment_repository import PaymentRepository
+from inira.app.payments.domain.services.wompi_services import WompiService
+
+logger = logging.getLogger(__name__)
+
+# 🔹 Backoff exponencial por pago: 1 min, 2 min, 4 min ... hasta 1 h
+BACKOFF_BASE = 60
+BACKOFF_MAX = 3600
+BACKOFF_STATE_TTL = 60 * 60 * 24
+
+
+def _backoff_key(payment_id) -> str:
+    return f"reconcile:backoff:{payment_id}"
+
+
+class ReconcilePendingPayments:
+    def __init__(
+        self,
+        wompi_service: WompiService,
+        payment_repository: PaymentRepository,
+    ):
+        self.wompi_service = wompi_service
+        self.payment_repository = payment_repository
+
+    def execute(
+        self,
+        *,
+        batch_size: int = 200,
+        max_workers: int = 8,
+        min_age_seconds: int = 60,
+        limit: int = None,
+        dry_run: bool = False,
+    ) -> dict:
+        """
+        Consulta en Wompi los pagos PENDING y aplica los cambios de estado.
+
+        Recorre los pagos por lotes (keyset sobre created_at, id), consulta
+        cada lote con un pool acotado de hilos y aplica las transiciones del
+        lote en una sola actualización masiva. Los pagos que siguen
+        pendientes (o fallan) se posponen con backoff exponencial.
+
+        Returns:
+            Reporte con contadores, cambios aplicados y throughput
+        """
+        started = time.monotonic()
+        created_before = timezone.now() - timedelta(seconds=min_age_seconds)
+
+        report = {
+            "dry_run": dry_run,
+            "scanned": 0,
+            "checked": 0,
+            "skipped_backoff": 0,
+            "still_pending": 0,
+            "errors": 0,
+            "updated": 0,
+            "transitions": {},
+            "changes": [],
+        }
+
+        after = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while limit is None or report["scanned"] < limit:
+                size = batch_size
+                if limit is not None:
+                    size = min(batch_size, limit - report["scanned"])
+
+                batch = self.payment_repository.pending_batch(
+                    created_before=created_before, after=after, limit=size
+                )
+                if not batch:
+                    break
+
+                after = (batch[-1]["created_at"], batch[-1]["id"])
+                report["scanned"] += len(batch)
+
+                self._reconcile_batch(batch, executor, report, dry_run)
+
+        elapsed = time.monotonic() - started
+        report["elapsed_seconds"] = round(elapsed, 3)
+        report["checked_per_second"] = (
+            round(report["checked"] / elapsed, 2) if elapsed else None
+        )
+
+        logger.info(
+            f"[RECONCILE] Finalizado - "
+            f"Revisados: {report['scanned']}, "
+            f"Consultados: {report['checked']}, "
+            f"Actualizados: {report['updated']}, "
+            f"Errores: {report['errors']}, "
+            f"Dry run: {dry_run}"
+        )
+
+        return report
+
+    def _reconcile_batch(self, batch, executor, report, dry_run):
+        now = time.time()
+        backoff = cache.get_many([_backoff_key(p["id"]) for p in batch])
+
+        due = []
+        for payment in batch:
+            state = backoff.get(_backoff_key(payment["id"]))
+            if state and state["next_at"] > now:
+                report["skipped_backoff"] += 1
+            else:
+                due.append(payment)
+
+        results = executor.map(self._fetch_status, due)
+
+        statuses = {}
+        postponed = {}
+        for payment, status in zip(due, results):
+            report["checked"] += 1
+
+            if status and status != "PENDING":
+                statuses[payment["id"]] = status
+                continue
+
+            if status is None:
+                report["errors"] += 1
+            else:
+                report["still_pending"] += 1
+
+            key = _backoff_key(payment["id"])
+            attempts = (backoff.get(key) or {}).get("attempts", 0) + 1
+            delay = min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+            postponed[key] = {"attempts": attempts, "next_at": now + delay}
+
+        if dry_run:
+            self._record_changes(due, statuses, statuses, report)
+            return
+
+        if statuses:
+            # 🔹 Solo los pagos que cambiaron aquí: los que ya aplicó un
+            # webhook no se reportan ni se vuelven a notificar
+            updated = self.payment_repository.bulk_update_statuses(statuses)
+            report["updated"] += len(updated)
+            self._record_changes(due, statuses, updated, report)
+            cache.delete_many([_backoff_key(payment_id) for payment_id in statuses])
+
+        if postponed:
+            cache.set_many(postponed, BACKOFF_STATE_TTL)
+
+    def _record_changes(self, due, statuses, changed_ids, report):
+        changed_ids = set(changed_ids)
+
+        for payment in due:
+            if payment["id"] not in changed_ids:
+                continue
+
+            status = statuses[payment["id"]]
+            report["transitions"][status] = report["transitions"].get(status, 0) + 1
+            report["changes"].append(
+                {
+                    "payment_id": str(payment["id"]),
+                    "user_id": payment["user_id"],
+                    "transaction_id": payment["wompi_transaction_id"],
+                    "status": status,
+                    "previous_status": "PENDING",
+                }
+            )
+
+    def _fetch_status(self, payment: dict):
+        try:
+            response = self.wompi_service.get_transaction_status(
+                payment["wompi_transaction_id"]
+            )
+            return response.get("data", {}).get("status")
+        except Exception as e:
+            logger.warning(
+                f"[RECONCILE] Error consultando Wompi - "
+                f"Payment ID: {payment['id']}, "
+                f"Error: {str(e)}"
+            )
+            return None
@@ -0,0 +1,13 @@
+# inira/app/payments/domain/payment_status.py
+
+# 🔹 Estados en los que Wompi ya no cambia la transacción
+FINAL_STATUSES = frozenset({"APPROVED", "DECLINED", "ERROR", "VOIDED"})
+
+
+def is_final(status: str) -> bool:
+    return status in FINAL_STATUSES
+
+
+def is_regression(current: str, new: str) -> bool:
+    """Un evento atrasado (p. ej. PENDING) no revierte un estado final"""
+    return is_final(current) and not is_final(new)
@@ -13,6 +13,11 @@ class PaymentRepository(ABC):
     def get_by_id(self, payment_id: str):
         pass
 
+    @abstractmethod
+    def get_status_snapshot(self, payment_id: str):
+        """Pago sin participantes ni relaciones (consulta de estado)"""
+        pass
+
     @abstractmethod
     def get_by_transaction_id(self, transaction_id: str):
         pass
@@ -25,6 +30,15 @@ class PaymentRepository(ABC):
     def update_status(self, payment_id: str, status: str):
         pass
 
+    @abstractmethod
+    def transition_status(self, payment_id: str, status: str):
+        """
+        Cambia el estado con el pago bloqueado, salvo que sea el mismo o una
+        regresión desde un estado final. Retorna el estado anterior, o None
+        si no hubo cambio.
+        """
+        pass
+
     # 🆕
     @abstractmethod
     def update_status_and_url(
@@ -38,3 +52,16 @@ class PaymentRepository(ABC):
     @abstractmethod
     def get_user_payments(self, user_id: int):
         pass
+
+    @abstractmethod
+    def pending_batch(self, *, created_before, after=None, limit: int):
+        """Lote de pagos PENDING con transacción en Wompi (paginado por keyset)"""
+        pass
+
+    @abstractmethod
+    def bulk_update_statuses(self, statuses: dict) -> list:
+        """
+        Aplica {payment_id: status} solo a pagos que siguen en PENDING.
+        Retorna los IDs que cambiaron de estado.
+        """
+        pass
@@ -0,0 +1,41 @@
+# inira/app/payments/domain/repositories/slot_hold_repository.py
+
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class SlotHoldRepository(ABC):
+    @abstractmethod
+    def hold(
+        self,
+        *,
+        availability_id: str,
+        user_id: int,
+        slots: int,
+        ttl_seconds: int,
+    ) -> str:
+        """
+        Descuenta los cupos y crea la retención; retorna su id.
+
+        Raises:
+            ValueError: Si no quedan cupos suficientes
+        """
+        pass
+
+    @abstractmethod
+    def attach_payment(self, hold_id: str, payment_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def release(self, hold_ids: List[str]) -> int:
+        """Devuelve los cupos de las retenciones aún activas"""
+        pass
+
+    @abstractmethod
+    def settle(self, statuses: Dict[str, str]) -> None:
+        """Confirma o libera las retenciones según {payment_id: status}"""
+        pass
+
+    @abstractmethod
+    def expired_ids(self, *, limit: int) -> List[str]:
+        pass
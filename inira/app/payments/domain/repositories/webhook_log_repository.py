@@ -0,0 +1,40 @@
+# inira/app/payments/domain/repositories/webhook_log_repository.py
+
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+
+class WebhookLogRepository(ABC):
+    @abstractmethod
+    def record(
+        self,
+        *,
+        event_type: str,
+        transaction_id: str,
+        event_timestamp: int,
+        status: str,
+        raw_payload: dict,
+    ) -> Tuple[object, bool]:
+        """Guarda el evento si no existe; retorna (log, creado)"""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, log_id: str):
+        pass
+
+    @abstractmethod
+    def mark_processed(self, log_id: str, *, payment_id=None):
+        pass
+
+    @abstractmethod
+    def mark_failed(self, log_id: str, *, error_message: str) -> bool:
+        """
+        Registra un intento fallido y programa el siguiente con backoff;
+        retorna True si se agotaron los intentos (el evento se descarta)
+        """
+        pass
+
+    @abstractmethod
+    def pending_ids(self, *, limit: int) -> List[str]:
+        """IDs de eventos pendientes con el reintento vencido, los más antiguos primero"""
+        pass
@@ -0,0 +1,258 @@
+# inira/app/payments/domain/services/async_wompi_services_impl.py
+
+import asyncio
+import logging
+import time
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from inira.app.payments.domain.services.wompi_services import AsyncWompiService
+from inira.app.payments.domain.services.wompi_services_impl import (
+    LATENCY_METRIC,
+    WOMPI_TIMEOUTS,
+    WompiServiceImpl,
+)
+from inira.app.shared.metrics import aobserve_latency
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (502, 503, 504)
+RETRY_BACKOFF = 0.3
+
+_client = None
+
+
+def get_wompi_async_client() -> httpx.AsyncClient:
+    """
+    Cliente httpx compartido por el proceso (pool keep-alive).
+
+    Daphne ejecuta un único event loop por proceso, así que el cliente
+    se crea una sola vez y se reutiliza entre peticiones.
+    """
+    global _client
+
+    if _client is None:
+        pool_size = settings.WOMPI_HTTP_POOL_SIZE
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+            # Reintenta solo fallos de conexión (la petición no salió)
+            transport=httpx.AsyncHTTPTransport(retries=settings.WOMPI_HTTP_MAX_RETRIES),
+        )
+
+    return _client
+
+
+class AsyncWompiServiceImpl(WompiServiceImpl, AsyncWompiService):
+    """
+    Implementación async con httpx.
+
+    Hereda los métodos síncronos (usados por comandos y tareas en segundo
+    plano) y agrega variantes `a*` que no bloquean hilos del servidor.
+    """
+
+    async def _arequest(self, method: str, url: str, *, endpoint: str, **kwargs):
+        connect, read = WOMPI_TIMEOUTS[endpoint]
+        timeout = httpx.Timeout(read, connect=connect)
+        attempts = settings.WOMPI_HTTP_MAX_RETRIES + 1 if method == "GET" else 1
+
+        started = time.monotonic()
+        try:
+            for attempt in range(attempts):
+                response = await get_wompi_async_client().request(
+                    method, url, timeout=timeout, **kwargs
+                )
+                # 🔹 Reintento con backoff solo para GET idempotentes
+                if (
+                    response.status_code in RETRY_STATUS_CODES
+                    and attempt < attempts - 1
+                ):
+                    await asyncio.sleep(RETRY_BACKOFF * (2**attempt))
+                    continue
+                return response
+        finally:
+            elapsed = time.monotonic() - started
+            await aobserve_latency(LATENCY_METRIC, endpoint, elapsed)
+            logger.debug(f"[WOMPI_HTTP] {endpoint} (async) - {elapsed * 1000:.0f} ms")
+
+    async def acreate_pse_transaction(
+        self,
+        amount_in_cents: int,
+        reference: str,
+        customer_email: str,
+        customer_phone: str,
+        customer_full_name: str,
+        user_legal_id: str,
+        user_legal_id_type: str = "CC",
+        user_type: int = 0,
+        financial_institution_code: str = "1",
+        currency: str = "COP",
+    ):
+        """Crea una transacción PSE en Wompi (async)"""
+
+        logger.info(
+            f"[WOMPI_API] Preparando request async - "
+            f"Reference: {reference}, "
+            f"Amount: {amount_in_cents}, "
+            f"Bank: {financial_institution_code}"
+        )
+
+        # Tokens desde cache (o API con el cache frío) sin bloquear el loop
+        acceptance_token, accept_personal_auth = await sync_to_async(
+            self._get_acceptance_tokens, thread_sensitive=False
+        )()
+
+        payload = {
+            "acceptance_token": acceptance_token,
+            "accept_personal_auth": accept_personal_auth,
+            "amount_in_cents": amount_in_cents,
+            "currency": currency,
+            "reference": reference,
+            "customer_email": customer_email,
+            "signature": self._generate_signature(reference, amount_in_cents, currency),
+            "payment_method": {
+                "type": "PSE",
+                "user_type": user_type,
+                "user_legal_id_type": user_legal_id_type,
+                "user_legal_id": user_legal_id,
+                "financial_institution_code": financial_institution_code,
+                "payment_description": f"Pago - {reference}",
+            },
+            "customer_data": {
+                "phone_number": customer_phone,
+                "full_name": customer_full_name,
+            },
+        }
+
+        headers = {
+            "Authorization": f"Bearer {self.private_key}",
+            "Content-Type": "application/json",
+        }
+
+        url = f"{self.base_url}transactions"
+
+        try:
+            response = await self._arequest(
+                "POST",
+                url,
+                endpoint="create_transaction",
+                json=payload,
+                headers=headers,
+            )
+
+            logger.info(
+                f"[WOMPI_API] Response recibida - "
+                f"Status Code: {response.status_code}, "
+                f"Reference: {reference}"
+            )
+
+            response.raise_for_status()
+            response_data = response.json()
+
+            logger.info(
+                f"[WOMPI_API] Transacción creada - "
+                f"Transaction ID: {response_data.get('data', {}).get('id')}, "
+                f"Status: {response_data.get('data', {}).get('status')}"
+            )
+
+            return response_data
+
+        except httpx.TimeoutException as e:
+            logger.error(
+                f"[WOMPI_API] Timeout - Reference: {reference}, Error: {str(e)}"
+            )
+            raise Exception("Timeout al conectar con Wompi")
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"[WOMPI_API] HTTP Error - "
+                f"Reference: {reference}, "
+                f"Status Code: {e.response.status_code}, "
+                f"Response: {e.response.text}"
+            )
+            raise Exception(f"Error en Wompi API: {e.response.text}")
+
+        except httpx.RequestError as e:
+            logger.error(
+                f"[WOMPI_API] Request Error - Reference: {reference}, Error: {str(e)}"
+            )
+            raise Exception(f"Error de conexión con Wompi: {str(e)}")
+
+    async def aget_transaction_status(self, transaction_id: str):
+        """Obtiene el estado actual de una transacción (async)"""
+
+        logger.info(
+            f"[WOMPI_STATUS] Consultando estado async - Transaction ID: {transaction_id}"
+        )
+
+        url = f"{self.base_url}transactions/{transaction_id}"
+
+        try:
+            response = await self._arequest("GET", url, endpoint="transaction_status")
+            response.raise_for_status()
+            response_data = response.json()
+
+            logger.info(
+                f"[WOMPI_STATUS] Estado obtenido - "
+                f"Transaction ID: {transaction_id}, "
+                f"Status: {response_data.get('data', {}).get('status')}"
+            )
+
+            return response_data
+
+        except httpx.TimeoutException as e:
+            logger.error(
+                f"[WOMPI_STATUS] Timeout - Transaction ID: {transaction_id}, Error: {str(e)}"
+            )
+            raise Exception("Timeout al consultar estado de transacción")
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"[WOMPI_STATUS] HTTP Error - "
+                f"Transaction ID: {transaction_id}, "
+                f"Status Code: {e.response.status_code}, "
+                f"Response: {e.response.text}"
+            )
+            raise Exception(f"Error al consultar transacción: {e.response.text}")
+
+        except httpx.RequestError as e:
+            logger.error(
+                f"[WOMPI_STATUS] Request Error - Transaction ID: {transaction_id}, Error: {str(e)}"
+            )
+            raise Exception(f"Error de conexión con Wompi: {str(e)}")
+
+    async def aget_financial_institutions(self) -> list:
+        """Obtiene la lista de bancos PSE disponibles (async)"""
+
+        url = f"{self.base_url}pse/financial_institutions"
+
+        try:
+            response = await self._arequest(
+                "GET",
+                url,
+                endpoint="financial_institutions",
+                headers={"Authorization": f"Bearer {self.public_key}"},
+            )
+            response.raise_for_status()
+
+            return response.json().get("data", [])
+
+        except httpx.TimeoutException as e:
+            logger.error(f"[WOMPI_BANKS] Timeout - Error: {str(e)}")
+            raise Exception("Timeout al obtener instituciones financieras")
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"[WOMPI_BANKS] HTTP Error - "
+                f"Status Code: {e.response.status_code}, "
+                f"Response: {e.response.text}"
+            )
+            raise Exception(f"Error en Wompi API: {e.response.text}")
+
+        except httpx.RequestError as e:
+            logger.error(f"[WOMPI_BANKS] Request Error - Error: {str(e)}")
+            raise Exception(f"Error de conexión con Wompi: {str(e)}")
@@ -16,3 +16,24 @@ class WompiService(ABC):
     @abstractmethod
     def get_financial_institutions(self) -> list:
         pass
+
+    @abstractmethod
+    def verify_event_checksum(self, event: Dict[str, Any]) -> bool:
+        """Valida el checksum de un evento (webhook) enviado por Wompi"""
+        pass
+
+
+class AsyncWompiService(WompiService):
+    """Cliente de Wompi con variantes async para vistas ASGI."""
+
+    @abstractmethod
+    async def acreate_pse_transaction(self, **kwargs) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def aget_transaction_status(self, transaction_id: str) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def aget_financial_institutions(self) -> list:
+        pass
@@ -1,14 +1,65 @@
 # inira/app/payments/infrastructure/services/wompi_service_impl.py
 
 import hashlib
+import hmac
 import requests
 import logging
+import threading
+import time
 from django.conf import settings
-from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from inira.app.payments.domain.services.wompi_services import WompiService
+from inira.app.shared.cache import get_with_refresh_ahead
+from inira.app.shared.metrics import observe_latency
 
 logger = logging.getLogger(__name__)
 
+# 🔹 Timeouts (connect, read) por endpoint de Wompi
+WOMPI_TIMEOUTS = {
+    "merchant": (3.05, 10),
+    "create_transaction": (3.05, 30),
+    "transaction_status": (3.05, 10),
+    "financial_institutions": (3.05, 10),
+}
+
+LATENCY_METRIC = "wompi_latency"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_wompi_session() -> requests.Session:
+    """
+    Sesión HTTP compartida por el proceso (pool de conexiones keep-alive).
+
+    Los GET se reintentan con backoff ante errores de conexión y 5xx;
+    los POST solo se reintentan si la conexión no llegó a establecerse.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=settings.WOMPI_HTTP_MAX_RETRIES,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset({"GET"}),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=settings.WOMPI_HTTP_POOL_SIZE,
+                    pool_maxsize=settings.WOMPI_HTTP_POOL_SIZE,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
 
 class WompiServiceImpl(WompiService):
     def __init__(self):
@@ -16,10 +67,24 @@ class WompiServiceImpl(WompiService):
         self.private_key = settings.WOMPI_PRIVATE_KEY
         self.public_key = settings.WOMPI_PUBLIC_KEY
         self.integrity_secret = settings.WOMPI_INTEGRITY_SECRET
+        self.events_secret = settings.WOMPI_EVENTS_SECRET
 
-        # Cache keys
-        self.ACCEPTANCE_TOKEN_CACHE_KEY = "wompi_acceptance_token"
-        self.PERSONAL_AUTH_TOKEN_CACHE_KEY = "wompi_personal_auth_token"
+        # Cache de tokens de aceptación (compartido entre workers vía Redis)
+        self.ACCEPTANCE_TOKENS_CACHE_KEY = "wompi_acceptance_tokens"
+        self.ACCEPTANCE_TOKENS_TTL = 6 * 60 * 60
+        self.ACCEPTANCE_TOKENS_REFRESH_AHEAD = 30 * 60
+
+    def _request(self, method: str, url: str, *, endpoint: str, **kwargs):
+        """Ejecuta la petición con la sesión compartida y mide su latencia."""
+        started = time.monotonic()
+        try:
+            return get_wompi_session().request(
+                method, url, timeout=WOMPI_TIMEOUTS[endpoint], **kwargs
+            )
+        finally:
+            elapsed = time.monotonic() - started
+            observe_latency(LATENCY_METRIC, endpoint, elapsed)
+            logger.debug(f"[WOMPI_HTTP] {endpoint} - {elapsed * 1000:.0f} ms")
 
     def _get_merchant_info(self):
         """Obtiene la información del merchant desde Wompi API"""
@@ -30,7 +95,7 @@ class WompiServiceImpl(WompiService):
 
             logger.debug(f"[WOMPI_MERCHANT] URL: {url}")
 
-            response = requests.get(url, timeout=10)
+            response = self._request("GET", url, endpoint="merchant")
             response.raise_for_status()
 
             merchant_data = response.json()
@@ -51,18 +116,20 @@ class WompiServiceImpl(WompiService):
         """
         Obtiene los tokens de aceptación desde cache o API.
         Retorna: (acceptance_token, accept_personal_auth)
+
+        Los tokens se renuevan en segundo plano antes de expirar, así que
+        crear un pago solo consulta el merchant cuando el cache está vacío.
         """
-        # Intentar obtener desde cache
-        acceptance_token = cache.get(self.ACCEPTANCE_TOKEN_CACHE_KEY)
-        personal_auth_token = cache.get(self.PERSONAL_AUTH_TOKEN_CACHE_KEY)
+        return get_with_refresh_ahead(
+            self.ACCEPTANCE_TOKENS_CACHE_KEY,
+            self._fetch_acceptance_tokens,
+            timeout=self.ACCEPTANCE_TOKENS_TTL,
+            refresh_ahead=self.ACCEPTANCE_TOKENS_REFRESH_AHEAD,
+        )
 
-        if acceptance_token and personal_auth_token:
-            logger.info("[WOMPI_TOKENS] Tokens obtenidos desde cache")
-            return acceptance_token, personal_auth_token
+    def _fetch_acceptance_tokens(self):
+        logger.info("[WOMPI_TOKENS] Obteniendo tokens desde API")
 
-        logger.info(
-            "[WOMPI_TOKENS] Tokens no encontrados en cache, obteniendo desde API"
-        )
         merchant_info = self._get_merchant_info()
         presigned_acceptance = merchant_info.get("presigned_acceptance", {})
         presigned_personal_data = merchant_info.get("presigned_personal_data_auth", {})
@@ -94,6 +161,37 @@ class WompiServiceImpl(WompiService):
 
         return signature
 
+    def verify_event_checksum(self, event: dict) -> bool:
+        """
+        Valida el checksum de un evento de Wompi.
+
+        checksum = SHA256(valores de signature.properties + timestamp + secreto
+        de eventos), donde cada propiedad es una ruta dentro de `data`.
+        """
+        signature = event.get("signature") or {}
+        properties = signature.get("properties") or []
+        checksum = signature.get("checksum")
+        timestamp = event.get("timestamp")
+
+        if not self.events_secret:
+            logger.error("[WOMPI_EVENTS] WOMPI_EVENTS_SECRET no está configurado")
+            return False
+
+        if not checksum or not properties or timestamp is None:
+            return False
+
+        values = []
+        for prop in properties:
+            value = event.get("data", {})
+            for part in prop.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            values.append("" if value is None else str(value))
+
+        cadena = f"{''.join(values)}{timestamp}{self.events_secret}"
+        expected = hashlib.sha256(cadena.encode("utf-8")).hexdigest()
+
+        return hmac.compare_digest(expected.lower(), str(checksum).lower())
+
     def create_pse_transaction(
         self,
         amount_in_cents: int,
@@ -158,7 +256,13 @@ class WompiServiceImpl(WompiService):
         try:
             logger.info(f"[WOMPI_API] Enviando request a: {url}")
 
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._request(
+                "POST",
+                url,
+                endpoint="create_transaction",
+                json=payload,
+                headers=headers,
+            )
 
             logger.info(
                 f"[WOMPI_API] Response recibida - "
@@ -222,7 +326,7 @@ class WompiServiceImpl(WompiService):
         try:
             logger.debug(f"[WOMPI_STATUS] URL: {url}")
 
-            response = requests.get(url, timeout=10)
+            response = self._request("GET", url, endpoint="transaction_status")
 
             logger.info(
                 f"[WOMPI_STATUS] Response recibida - "
@@ -277,10 +381,11 @@ class WompiServiceImpl(WompiService):
         logger.info("[WOMPI_BANKS] Obteniendo instituciones financieras")
 
         try:
-            response = requests.get(
+            response = self._request(
+                "GET",
                 url,
+                endpoint="financial_institutions",
                 headers={"Authorization": f"Bearer {self.public_key}"},
-                timeout=10,
             )
 
             logger.info(
@@ -10,10 +10,29 @@ from inira.app.payments.application.use_cases.process_wompi_payment import (
 from inira.app.payments.application.use_cases.check_payment_status import (
     CheckPaymentStatus,
 )
+from inira.app.payments.application.use_cases.receive_wompi_webhook import (
+    ReceiveWompiWebhook,
+)
+from inira.app.payments.application.use_cases.process_wompi_webhook import (
+    ProcessWompiWebhook,
+)
+from inira.app.payments.application.use_cases.reconcile_pending_payments import (
+    ReconcilePendingPayments,
+)
+from django.conf import settings
+from inira.app.payments.domain.services.async_wompi_services_impl import (
+    AsyncWompiServiceImpl,
+)
 from inira.app.payments.domain.services.wompi_services_impl import WompiServiceImpl
 from inira.app.payments.infrastructure.repositories.payment_repository_impl import (
     PaymentRepositoryImpl,
 )
+from inira.app.payments.infrastructure.repositories.slot_hold_repository_impl import (
+    SlotHoldRepositoryImpl,
+)
+from inira.app.payments.infrastructure.repositories.webhook_log_repository_impl import (
+    WebhookLogRepositoryImpl,
+)
 from inira.app.routes.infrastructure.repositories import RoutesRepositoryImpl
 
 
@@ -23,9 +42,16 @@ class PaymentsContainer(containers.DeclarativeContainer):
     # Repositories
     payment_repository = providers.Factory(PaymentRepositoryImpl)
     routes_repository = providers.Factory(RoutesRepositoryImpl)  # 👈
+    webhook_log_repository = providers.Factory(WebhookLogRepositoryImpl)
+    slot_hold_repository = providers.Factory(SlotHoldRepositoryImpl)
 
     # Services
-    wompi_service = providers.Factory(WompiServiceImpl)
+    # 🔹 WOMPI_HTTP_CLIENT = "requests" (síncrono) | "httpx" (async, vistas ASGI)
+    wompi_service = providers.Selector(
+        providers.Callable(lambda: settings.WOMPI_HTTP_CLIENT),
+        requests=providers.Factory(WompiServiceImpl),
+        httpx=providers.Factory(AsyncWompiServiceImpl),
+    )
 
     # Use Cases
     process_wompi_payment = providers.Factory(
@@ -33,6 +59,7 @@ class PaymentsContainer(containers.DeclarativeContainer):
         wompi_service=wompi_service,
         payment_repository=payment_repository,
         routes_repository=routes_repository,  # 👈
+        slot_hold_repository=slot_hold_repository,
     )
 
     check_payment_status = providers.Factory(
@@ -45,3 +72,21 @@ class PaymentsContainer(containers.DeclarativeContainer):
         GetFinancialInstitutions,
         wompi_service=wompi_service,
     )
+
+    receive_wompi_webhook = providers.Factory(
+        ReceiveWompiWebhook,
+        wompi_service=wompi_service,
+        webhook_log_repository=webhook_log_repository,
+    )
+
+    process_wompi_webhook = providers.Factory(
+        ProcessWompiWebhook,
+        payment_repository=payment_repository,
+        webhook_log_repository=webhook_log_repository,
+    )
+
+    reconcile_pending_payments = providers.Factory(
+        ReconcilePendingPayments,
+        wompi_service=wompi_service,
+        payment_repository=payment_repository,
+    )
@@ -18,10 +18,14 @@ get_financial_institutions_docs = extend_schema(
         "del endpoint de creación de pago (`POST /api/v1/payments/`)\n\n"
         "**Importante:**\n"
         "- El usuario debe estar autenticado (token requerido)\n"
-        "- Los datos provienen directamente de la API de Wompi en tiempo real\n"
+        "- La lista se sirve desde cache y se refresca en segundo plano cada hora; "
+        "si Wompi no responde se retorna la última lista válida\n"
+        "- Soporta `If-None-Match` (ETag) e `If-Modified-Since`: si la lista no "
+        "cambió responde **304** sin cuerpo\n"
     ),
     responses={
         200: OpenApiTypes.OBJECT,
+        304: None,
         401: OpenApiTypes.OBJECT,
         500: OpenApiTypes.OBJECT,
     },
@@ -31,6 +31,10 @@ get_payment_status_docs = extend_schema(
         "**Importante:**\n"
         "- Solo puedes consultar pagos que pertenezcan a tu usuario autenticado\n"
         "- El estado se actualiza automáticamente consultando desde Wompi\n"
+        "- Los pagos en estado final (`APPROVED`, `DECLINED`, `VOIDED`, `ERROR`) "
+        "se responden sin consultar a Wompi\n"
+        "- Soporta `If-None-Match` (ETag): si el estado no cambió responde "
+        "**304** sin cuerpo\n"
         "- El monto se retorna en COP (no en centavos)\n"
         "- Se recomienda implementar un timeout máximo de 5 minutos para el polling\n"
     ),
@@ -45,6 +49,7 @@ get_payment_status_docs = extend_schema(
     ],
     responses={
         200: PaymentStatusOutputSerializer,
+        304: None,
         401: OpenApiTypes.OBJECT,
         403: OpenApiTypes.OBJECT,
         404: OpenApiTypes.OBJECT,
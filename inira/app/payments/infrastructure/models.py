@@ -311,18 +311,33 @@ class PaymentWebhookLog(models.Model):
 
     transaction_id = models.CharField(max_length=100, db_index=True)
 
+    # 🆕 Timestamp del evento enviado por Wompi (clave de idempotencia)
+    event_timestamp = models.BigIntegerField(
+        null=True, blank=True, help_text="Timestamp del evento (campo timestamp)"
+    )
+
     status = models.CharField(max_length=50, help_text="Estado recibido en el webhook")
 
     raw_payload = models.JSONField(help_text="Payload completo del webhook")
 
     processed = models.BooleanField(
-        default=False, help_text="Si el webhook fue procesado exitosamente"
+        default=False,
+        help_text="Si el webhook ya no se reintenta (aplicado, o descartado con error)",
     )
 
     error_message = models.TextField(
         blank=True, help_text="Mensaje de error si hubo problemas al procesar"
     )
 
+    # 🆕 Reintentos con backoff de los eventos que fallaron
+    attempts = models.PositiveSmallIntegerField(
+        default=0, help_text="Intentos fallidos de procesamiento"
+    )
+
+    next_attempt_at = models.DateTimeField(
+        null=True, blank=True, help_text="No se reintenta antes de esta fecha"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
@@ -334,6 +349,74 @@ class PaymentWebhookLog(models.Model):
             models.Index(fields=["transaction_id", "created_at"]),
             models.Index(fields=["processed", "created_at"]),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["transaction_id", "event_timestamp"],
+                name="uniq_webhook_transaction_event",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.event_type} - {self.transaction_id} - {self.created_at}"
+
+
+class SlotHold(models.Model):
+    """
+    🆕 Retención temporal de cupos mientras el pago PSE está pendiente.
+    Los cupos se descuentan al crear la retención; se devuelven si el pago
+    es rechazado o si la retención expira (release_expired_holds).
+    """
+
+    class HoldStatus(models.TextChoices):
+        HELD = "HELD", "Retenido"
+        CONFIRMED = "CONFIRMED", "Confirmado"
+        RELEASED = "RELEASED", "Liberado"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    availability = models.ForeignKey(
+        "routes.RutaAvailability",
+        on_delete=models.CASCADE,
+        related_name="holds",
+    )
+
+    payment = models.OneToOneField(
+        Payment,
+        on_delete=models.SET_NULL,
+        related_name="slot_hold",
+        null=True,
+        blank=True,
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="slot_holds",
+    )
+
+    slots = models.PositiveIntegerField(help_text="Cupos retenidos")
+
+    status = models.CharField(
+        max_length=20, choices=HoldStatus.choices, default=HoldStatus.HELD
+    )
+
+    expires_at = models.DateTimeField(
+        help_text="Momento en que los cupos vuelven a estar disponibles"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "slot_holds"
+        ordering = ["-created_at"]
+        verbose_name = "Retención de cupos"
+        verbose_name_plural = "Retenciones de cupos"
+        indexes = [
+            models.Index(
+                fields=["status", "expires_at"], name="slot_holds_status_expires_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.slots} cupos - {self.availability_id} - {self.status}"
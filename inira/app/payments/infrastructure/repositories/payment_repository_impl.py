@@ -1,14 +1,35 @@
 # inira/app/payments/infrastructure/repositories/payment_repository_impl.py
 
 import logging
+from collections import defaultdict
 from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
+from inira.app.payments.domain.payment_status import is_regression
 from inira.app.payments.domain.repositories.payment_repository import PaymentRepository
 from inira.app.payments.infrastructure.models import Payment, PaymentParticipant
+from inira.app.payments.infrastructure.repositories.slot_hold_repository_impl import (
+    SlotHoldRepositoryImpl,
+)
 
 logger = logging.getLogger(__name__)
 
+STATUS_SNAPSHOT_FIELDS = (
+    "id",
+    "user_id",
+    "ruta_id",
+    "status",
+    "amount",
+    "wompi_transaction_id",
+    "wompi_reference",
+    "wompi_payment_link",
+    "booking_date",
+    "total_participants",
+    "created_at",
+    "updated_at",
+)
+
 
 class PaymentRepositoryImpl(PaymentRepository):
 
@@ -130,6 +151,12 @@ class PaymentRepositoryImpl(PaymentRepository):
             .first()
         )
 
+    def get_status_snapshot(self, payment_id: str):
+        # 🔹 Sin prefetch de participantes: solo lo que retorna el estado
+        return (
+            Payment.objects.only(*STATUS_SNAPSHOT_FIELDS).filter(id=payment_id).first()
+        )
+
     def get_by_transaction_id(self, transaction_id: str):
         logger.debug(
             f"[PAYMENT_REPO] Buscando pago por Transaction ID: {transaction_id}"
@@ -169,6 +196,10 @@ class PaymentRepositoryImpl(PaymentRepository):
                 else:
                     payment.save(update_fields=["status", "updated_at"])
 
+                # 🆕 Confirma o libera los cupos retenidos
+                if status != old_status:
+                    SlotHoldRepositoryImpl().settle({payment.id: status})
+
                 logger.info(
                     f"[PAYMENT_REPO] Status actualizado - "
                     f"Payment ID: {payment_id}, "
@@ -203,6 +234,35 @@ class PaymentRepositoryImpl(PaymentRepository):
 
     # inira/app/payments/infrastructure/repositories/payment_repository_impl.py
 
+    def transition_status(self, payment_id: str, status: str):
+        # 🔹 Fila bloqueada: dos webhooks (o webhook y reconciliación) no
+        # comparan contra el mismo estado viejo
+        with transaction.atomic():
+            current = (
+                Payment.objects.select_for_update()
+                .filter(id=payment_id)
+                .values_list("status", flat=True)
+                .first()
+            )
+            if current is None or current == status or is_regression(current, status):
+                return None
+
+            fields = {"status": status, "updated_at": timezone.now()}
+            if status == Payment.PaymentStatus.APPROVED:
+                fields["completed_at"] = fields["updated_at"]
+
+            Payment.objects.filter(id=payment_id).update(**fields)
+            SlotHoldRepositoryImpl().settle({payment_id: status})
+
+        logger.info(
+            f"[PAYMENT_REPO] Transición de estado - "
+            f"Payment ID: {payment_id}, "
+            f"Old: {current}, "
+            f"New: {status}"
+        )
+
+        return current
+
     def update_status_and_url(
         self,
         payment_id: str,
@@ -242,6 +302,9 @@ class PaymentRepositoryImpl(PaymentRepository):
 
             payment.save(update_fields=fields_to_update)
 
+            if status != old_status:
+                SlotHoldRepositoryImpl().settle({payment.id: status})
+
             logger.info(
                 f"[PAYMENT_REPO] Pago actualizado - "
                 f"Payment ID: {payment_id}, "
@@ -259,3 +322,64 @@ class PaymentRepositoryImpl(PaymentRepository):
                 exc_info=True,
             )
             raise
+
+    def pending_batch(self, *, created_before, after=None, limit: int):
+        """
+        🔹 Usa el índice (status, created_at). `after` es la tupla
+        (created_at, id) del último pago del lote anterior.
+        """
+        queryset = Payment.objects.filter(
+            status=Payment.PaymentStatus.PENDING,
+            created_at__lt=created_before,
+            wompi_transaction_id__isnull=False,
+        )
+
+        if after:
+            created_at, payment_id = after
+            queryset = queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=payment_id)
+            )
+
+        return list(
+            queryset.order_by("created_at", "id").values(
+                "id", "wompi_transaction_id", "user_id", "created_at"
+            )[:limit]
+        )
+
+    def bulk_update_statuses(self, statuses: dict) -> list:
+        by_status = defaultdict(list)
+        for payment_id, status in statuses.items():
+            by_status[status].append(payment_id)
+
+        now = timezone.now()
+        updated = []
+
+        with transaction.atomic():
+            for status, payment_ids in by_status.items():
+                fields = {"status": status, "updated_at": now}
+                if status == Payment.PaymentStatus.APPROVED:
+                    fields["completed_at"] = now
+
+                # 🔹 Solo desde PENDING: no pisa lo que ya aplicó un webhook.
+                # Las filas quedan bloqueadas hasta el commit, así los IDs
+                # retornados son exactamente los que cambiaron aquí
+                pending = list(
+                    Payment.objects.select_for_update()
+                    .filter(id__in=payment_ids, status=Payment.PaymentStatus.PENDING)
+                    .values_list("id", flat=True)
+                )
+                if pending:
+                    Payment.objects.filter(id__in=pending).update(**fields)
+                    updated += pending
+
+            SlotHoldRepositoryImpl().settle(
+                {payment_id: statuses[payment_id] for payment_id in updated}
+            )
+
+        logger.info(
+            f"[PAYMENT_REPO] Actualización masiva - "
+            f"Solicitados: {len(statuses)}, "
+            f"Actualizados: {len(updated)}"
+        )
+
+        return updated
@@ -0,0 +1,180 @@
+# inira/app/payments/infrastructure/repositories/slot_hold_repository_impl.py
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Least
+from django.utils import timezone
+
+from inira.app.payments.domain.repositories.slot_hold_repository import (
+    SlotHoldRepository,
+)
+from inira.app.payments.infrastructure.models import Payment, SlotHold
+from inira.app.routes.infrastructure.models import RutaAvailability, RutaSenderismo
+
+logger = logging.getLogger(__name__)
+
+HELD = SlotHold.HoldStatus.HELD
+
+RELEASE_STATUSES = {
+    Payment.PaymentStatus.DECLINED,
+    Payment.PaymentStatus.ERROR,
+    Payment.PaymentStatus.VOIDED,
+}
+
+
+def _take_slots(availability_id, slots: int) -> bool:
+    # 🔹 UPDATE condicional: la fila se bloquea solo durante la sentencia
+    return bool(
+        RutaAvailability.objects.filter(
+            pk=availability_id, is_available=True, available_slots__gte=slots
+        ).update(
+            available_slots=F("available_slots") - slots,
+            updated_at=timezone.now(),
+        )
+    )
+
+
+def _return_slots(availability_id, slots: int) -> None:
+    max_capacity = RutaSenderismo.objects.filter(availabilities=OuterRef("pk")).values(
+        "max_capacity"
+    )[:1]
+
+    RutaAvailability.objects.filter(pk=availability_id).update(
+        available_slots=Least(F("available_slots") + slots, Subquery(max_capacity)),
+        updated_at=timezone.now(),
+    )
+
+
+class SlotHoldRepositoryImpl(SlotHoldRepository):
+    def hold(
+        self,
+        *,
+        availability_id: str,
+        user_id: int,
+        slots: int,
+        ttl_seconds: int,
+    ) -> str:
+        with transaction.atomic():
+            if not _take_slots(availability_id, slots):
+                remaining = (
+                    RutaAvailability.objects.filter(pk=availability_id)
+                    .values_list("available_slots", flat=True)
+                    .first()
+                )
+                raise ValueError(f"Solo quedan {remaining or 0} cupos disponibles")
+
+            hold = SlotHold.objects.create(
+                availability_id=availability_id,
+                user_id=user_id,
+                slots=slots,
+                expires_at=timezone.now() + timedelta(seconds=ttl_seconds),
+            )
+
+        logger.info(
+            f"[SLOT_HOLD] Cupos retenidos - "
+            f"Hold ID: {hold.id}, "
+            f"Availability ID: {availability_id}, "
+            f"Slots: {slots}"
+        )
+
+        return str(hold.id)
+
+    def attach_payment(self, hold_id: str, payment_id: str) -> None:
+        SlotHold.objects.filter(id=hold_id).update(
+            payment_id=payment_id, updated_at=timezone.now()
+        )
+
+    def release(self, hold_ids) -> int:
+        if not hold_ids:
+            return 0
+
+        with transaction.atomic():
+            # 🔹 skip_locked: el sweeper y los webhooks no liberan dos veces
+            holds = list(
+                SlotHold.objects.select_for_update(skip_locked=True)
+                .filter(id__in=hold_ids, status=HELD)
+                .values("id", "availability_id", "slots")
+            )
+            if not holds:
+                return 0
+
+            slots_by_availability = defaultdict(int)
+            for hold in holds:
+                slots_by_availability[hold["availability_id"]] += hold["slots"]
+
+            for availability_id, slots in slots_by_availability.items():
+                _return_slots(availability_id, slots)
+
+            SlotHold.objects.filter(id__in=[h["id"] for h in holds]).update(
+                status=SlotHold.HoldStatus.RELEASED, updated_at=timezone.now()
+            )
+
+        logger.info(f"[SLOT_HOLD] Retenciones liberadas: {len(holds)}")
+
+        return len(holds)
+
+    def settle(self, statuses) -> None:
+        approved = [
+            payment_id
+            for payment_id, status in statuses.items()
+            if status == Payment.PaymentStatus.APPROVED
+        ]
+        failed = [
+            payment_id
+            for payment_id, status in statuses.items()
+            if status in RELEASE_STATUSES
+        ]
+
+        if approved:
+            SlotHold.objects.filter(payment_id__in=approved, status=HELD).update(
+                status=SlotHold.HoldStatus.CONFIRMED, updated_at=timezone.now()
+            )
+            self._reclaim_released(approved)
+
+        if failed:
+            self.release(
+                list(
+                    SlotHold.objects.filter(
+                        payment_id__in=failed, status=HELD
+                    ).values_list("id", flat=True)
+                )
+            )
+
+    def expired_ids(self, *, limit: int):
+        return list(
+            SlotHold.objects.filter(status=HELD, expires_at__lte=timezone.now())
+            .order_by("expires_at")
+            .values_list("id", flat=True)[:limit]
+        )
+
+    def _reclaim_released(self, payment_ids) -> None:
+        """Pagos aprobados después de que su retención expiró: volver a tomar los cupos."""
+        released = SlotHold.objects.filter(
+            payment_id__in=payment_ids, status=SlotHold.HoldStatus.RELEASED
+        ).only("id", "payment_id", "availability_id", "slots")
+
+        for hold in released:
+            with transaction.atomic():
+                # 🔹 Primero se reclama la retención: solo quien cambia el estado
+                # toma los cupos, así una aprobación duplicada no los toma dos veces
+                claimed = SlotHold.objects.filter(
+                    id=hold.id, status=SlotHold.HoldStatus.RELEASED
+                ).update(
+                    status=SlotHold.HoldStatus.CONFIRMED, updated_at=timezone.now()
+                )
+                if claimed != 1:
+                    continue
+
+                if not _take_slots(hold.availability_id, hold.slots):
+                    # Sin cupos la retención vuelve a RELEASED
+                    transaction.set_rollback(True)
+                    logger.error(
+                        f"[SLOT_HOLD] Pago aprobado sin cupos - "
+                        f"Payment ID: {hold.payment_id}, "
+                        f"Availability ID: {hold.availability_id}, "
+                        f"Slots: {hold.slots}"
+                    )
@@ -0,0 +1,111 @@
+# inira/app/payments/infrastructure/repositories/webhook_log_repository_impl.py
+
+import logging
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from inira.app.payments.domain.repositories.webhook_log_repository import (
+    WebhookLogRepository,
+)
+from inira.app.payments.infrastructure.models import PaymentWebhookLog
+
+logger = logging.getLogger(__name__)
+
+# 🔹 Reintentos: 1, 2, 4, 8... minutos; al agotarlos el evento se descarta
+MAX_ATTEMPTS = 6
+RETRY_BASE_SECONDS = 60
+
+
+class WebhookLogRepositoryImpl(WebhookLogRepository):
+    def record(
+        self,
+        *,
+        event_type: str,
+        transaction_id: str,
+        event_timestamp: int,
+        status: str,
+        raw_payload: dict,
+    ):
+        # 🔹 La restricción única (transaction_id, event_timestamp) descarta
+        # los reintentos de Wompi aunque lleguen en paralelo
+        try:
+            with transaction.atomic():
+                log = PaymentWebhookLog.objects.create(
+                    event_type=event_type,
+                    transaction_id=transaction_id,
+                    event_timestamp=event_timestamp,
+                    status=status,
+                    raw_payload=raw_payload,
+                )
+            return log, True
+
+        except IntegrityError:
+            logger.info(
+                f"[WEBHOOK_REPO] Evento duplicado - "
+                f"Transaction ID: {transaction_id}, "
+                f"Timestamp: {event_timestamp}"
+            )
+            log = PaymentWebhookLog.objects.get(
+                transaction_id=transaction_id, event_timestamp=event_timestamp
+            )
+            return log, False
+
+    def get_by_id(self, log_id: str):
+        try:
+            return PaymentWebhookLog.objects.get(pk=log_id)
+        except PaymentWebhookLog.DoesNotExist:
+            return None
+
+    def mark_processed(self, log_id: str, *, payment_id=None):
+        PaymentWebhookLog.objects.filter(pk=log_id).update(
+            payment_id=payment_id,
+            processed=True,
+            error_message="",
+            next_attempt_at=None,
+        )
+
+    def mark_failed(self, log_id: str, *, error_message: str) -> bool:
+        with transaction.atomic():
+            log = (
+                PaymentWebhookLog.objects.select_for_update()
+                .filter(pk=log_id)
+                .only("attempts")
+                .first()
+            )
+            if log is None:
+                return False
+
+            attempts = log.attempts + 1
+            exhausted = attempts >= MAX_ATTEMPTS
+            PaymentWebhookLog.objects.filter(pk=log_id).update(
+                attempts=attempts,
+                # Procesado = ya no se reintenta; el error queda para auditoría
+                processed=exhausted,
+                error_message=error_message,
+                next_attempt_at=(
+                    None
+                    if exhausted
+                    else timezone.now()
+                    + timedelta(seconds=RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+                ),
+            )
+
+        if exhausted:
+            logger.error(
+                f"[WEBHOOK_REPO] Evento descartado tras {attempts} intentos - "
+                f"Log ID: {log_id}, Error: {error_message}"
+            )
+        return exhausted
+
+    def pending_ids(self, *, limit: int):
+        return list(
+            PaymentWebhookLog.objects.filter(processed=False)
+            .filter(
+                Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=timezone.now())
+            )
+            .order_by("created_at")
+            .values_list("id", flat=True)[:limit]
+        )
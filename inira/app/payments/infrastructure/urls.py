@@ -1,11 +1,23 @@
+from django.conf import settings
 from django.urls import path
-from .views import PaymentStatusAPIView, PaymentsAPIView
+from .views import (
+    AsyncPaymentStatusAPIView,
+    AsyncPaymentsAPIView,
+    PaymentStatusAPIView,
+    PaymentsAPIView,
+)
+
+# 🔹 Con el cliente httpx se exponen las vistas async
+if settings.WOMPI_HTTP_CLIENT == "httpx":
+    payments_view, payment_status_view = AsyncPaymentsAPIView, AsyncPaymentStatusAPIView
+else:
+    payments_view, payment_status_view = PaymentsAPIView, PaymentStatusAPIView
 
 urlpatterns = [
-    path("payments/", PaymentsAPIView.as_view(), name="PaymentsAPIView"),
+    path("payments/", payments_view.as_view(), name="PaymentsAPIView"),
     path(
         "payments/<str:payment_id>/status/",
-        PaymentStatusAPIView.as_view(),
+        payment_status_view.as_view(),
         name="payment-status",
     ),
 ]
@@ -1,11 +1,15 @@
 # inira/app/payments/infrastructure/api/payments_api.py
 
+import hashlib
+import json
 import logging
+from adrf.views import APIView as AsyncAPIView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from datetime import datetime
+from django.utils.http import http_date, parse_http_date_safe
 
 from inira.app.payments.infrastructure.docs.get_financial_institutions_docs import (
     get_financial_institutions_docs,
@@ -26,6 +30,45 @@ from inira.app.shared.container import container
 logger = logging.getLogger(__name__)
 
 
+def _financial_institutions_response(request, result: dict) -> Response:
+    # 🔹 Respuesta condicional: el cliente reutiliza su copia si no cambió
+    last_modified = int(result["last_modified"].timestamp())
+    if_none_match = request.headers.get("If-None-Match")
+    if_modified_since = parse_http_date_safe(
+        request.headers.get("If-Modified-Since", "")
+    )
+    not_modified = (
+        if_none_match == result["etag"]
+        if if_none_match
+        else if_modified_since is not None and if_modified_since >= last_modified
+    )
+
+    if not_modified:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response({"data": result["data"]}, status=status.HTTP_200_OK)
+
+    response["ETag"] = result["etag"]
+    response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = "private, max-age=300"
+    return response
+
+
+def _payment_status_response(request, data: dict) -> Response:
+    # 🔹 ETag del cuerpo: el polling recibe 304 mientras el estado no cambie
+    raw = json.dumps(data, sort_keys=True, default=str)
+    etag = f'"{hashlib.md5(raw.encode("utf-8")).hexdigest()}"'
+
+    if request.headers.get("If-None-Match") == etag:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data, status=status.HTTP_200_OK)
+
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
 class PaymentsAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -34,9 +77,9 @@ class PaymentsAPIView(APIView):
         """Obtener lista de bancos disponibles para PSE"""
         try:
             use_case = container.payments().get_financial_institutions()
-            institutions = use_case.execute()
+            result = use_case.execute()
 
-            return Response({"data": institutions}, status=status.HTTP_200_OK)
+            return _financial_institutions_response(request, result)
 
         except Exception as e:
             logger.error(
@@ -114,7 +157,127 @@ class PaymentStatusAPIView(APIView):
             output_serializer = PaymentStatusOutputSerializer(data=result)
             output_serializer.is_valid(raise_exception=True)
 
-            return Response(output_serializer.validated_data, status=status.HTTP_200_OK)
+            return _payment_status_response(request, output_serializer.validated_data)
+
+        except PermissionError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except Exception as e:
+            logger.error(
+                f"[PAYMENT_STATUS_API] Error inesperado - "
+                f"Payment ID: {payment_id}, "
+                f"User ID: {request.user.id}, "
+                f"Error: {str(e)}",
+                exc_info=True,
+            )
+            return Response(
+                {"detail": "Error al consultar estado del pago"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+# ======================================================
+# 🆕 Variantes async (WOMPI_HTTP_CLIENT = "httpx")
+# Las esperas a Wompi no ocupan hilos del servidor ASGI.
+# ======================================================
+
+
+class AsyncPaymentsAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    @get_financial_institutions_docs
+    async def get(self, request):
+        """Obtener lista de bancos disponibles para PSE"""
+        try:
+            use_case = container.payments().get_financial_institutions()
+            result = await use_case.aexecute()
+
+            return _financial_institutions_response(request, result)
+
+        except Exception as e:
+            logger.error(
+                f"[PAYMENTS_API] Error obteniendo bancos - "
+                f"User ID: {request.user.id}, "
+                f"Error: {str(e)}, "
+                f"Type: {type(e).__name__}",
+                exc_info=True,
+            )
+            return Response(
+                {"detail": "Error obteniendo instituciones financieras"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @post_payment_docs
+    async def post(self, request):
+        """Procesar pago PSE con Wompi para reserva de ruta"""
+
+        input_serializer = ProcessPaymentInputSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+
+        try:
+            use_case = container.payments().process_wompi_payment()
+
+            result = await use_case.aexecute(
+                {
+                    **input_serializer.validated_data,
+                    "user_id": request.user.id,
+                    "user_email": request.user.email,
+                    "timestamp": int(datetime.now().timestamp()),
+                }
+            )
+
+            output_serializer = PaymentOutputSerializer(data=result)
+            output_serializer.is_valid(raise_exception=True)
+
+            return Response(
+                output_serializer.validated_data, status=status.HTTP_201_CREATED
+            )
+
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            logger.error(
+                f"[PAYMENTS_API] Error inesperado - "
+                f"User ID: {request.user.id}, "
+                f"Error: {str(e)}, "
+                f"Type: {type(e).__name__}",
+                exc_info=True,
+            )
+            return Response(
+                {"detail": "Error procesando el pago"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class AsyncPaymentStatusAPIView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    @get_payment_status_docs
+    async def get(self, request, payment_id):
+        """Obtener el estado actual de un pago"""
+
+        try:
+            use_case = container.payments().check_payment_status()
+
+            result = await use_case.aexecute(
+                payment_id=payment_id,
+                user_id=request.user.id,
+            )
+
+            output_serializer = PaymentStatusOutputSerializer(data=result)
+            output_serializer.is_valid(raise_exception=True)
+
+            return _payment_status_response(request, output_serializer.validated_data)
 
         except PermissionError as e:
             return Response(
@@ -0,0 +1,52 @@
+# inira/app/payments/infrastructure/webhook_worker.py
+
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.consumer import SyncConsumer
+from channels.layers import get_channel_layer
+
+from inira.app.shared.container import container
+from inira.setting.websocket.utils import broadcast_payment_status
+
+logger = logging.getLogger(__name__)
+
+# 🔹 Canal atendido por: python manage.py runworker payment-webhooks
+WEBHOOK_CHANNEL = "payment-webhooks"
+
+
+def enqueue_webhook(log_id) -> None:
+    """
+    Encola el procesamiento de un evento ya registrado.
+
+    Si el channel layer falla el evento queda con processed=False y lo
+    recoge el comando `process_payment_webhooks`.
+    """
+    try:
+        async_to_sync(get_channel_layer().send)(
+            WEBHOOK_CHANNEL, {"type": "process.webhook", "log_id": str(log_id)}
+        )
+    except Exception as e:
+        logger.warning(f"[WEBHOOK] No se pudo encolar el log {log_id}: {e}")
+
+
+def handle_webhook(log_id) -> None:
+    """Aplica el evento al pago y notifica al pagador si el estado cambió."""
+    try:
+        change = container.payments().process_wompi_webhook().execute(log_id)
+    except Exception as e:
+        logger.error(f"[WEBHOOK] Error procesando log {log_id}: {e}", exc_info=True)
+        return
+
+    if change:
+        try:
+            broadcast_payment_status(change.pop("user_id"), change)
+        except Exception as e:
+            logger.warning(f"[WEBHOOK] No se pudo notificar el pago: {e}")
+
+
+class PaymentWebhookWorker(SyncConsumer):
+    """Worker de channels que procesa los eventos de Wompi fuera del request."""
+
+    def process_webhook(self, message):
+        handle_webhook(message["log_id"])
@@ -0,0 +1,26 @@
+# inira/app/payments/management/commands/process_payment_webhooks.py
+
+from django.core.management.base import BaseCommand
+
+from inira.app.payments.infrastructure.webhook_worker import handle_webhook
+from inira.app.payments.infrastructure.repositories.webhook_log_repository_impl import (
+    WebhookLogRepositoryImpl,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Procesa los eventos de Wompi pendientes (respaldo si el worker "
+        "payment-webhooks no estaba disponible)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=500)
+
+    def handle(self, *args, **options):
+        log_ids = WebhookLogRepositoryImpl().pending_ids(limit=options["limit"])
+
+        for log_id in log_ids:
+            handle_webhook(log_id)
+
+        self.stdout.write(f"Eventos procesados: {len(log_ids)}")
@@ -0,0 +1,54 @@
+# inira/app/payments/management/commands/reconcile_payments.py
+
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from inira.app.shared.container import container
+from inira.setting.websocket.utils import broadcast_payment_status
+
+
+class Command(BaseCommand):
+    help = "Reconcilia con Wompi los pagos que siguen en PENDING."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.WOMPI_HTTP_POOL_SIZE,
+            help="Consultas concurrentes a Wompi (por defecto el tamaño del pool HTTP)",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=60,
+            help="Segundos mínimos desde la creación del pago",
+        )
+        parser.add_argument("--limit", type=int, default=None)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Consulta Wompi pero no modifica los pagos",
+        )
+
+    def handle(self, *args, **options):
+        use_case = container.payments().reconcile_pending_payments()
+        report = use_case.execute(
+            batch_size=options["batch_size"],
+            max_workers=options["workers"],
+            min_age_seconds=options["min_age"],
+            limit=options["limit"],
+            dry_run=options["dry_run"],
+        )
+
+        changes = report.pop("changes")
+        if not options["dry_run"]:
+            for change in changes:
+                try:
+                    broadcast_payment_status(change.pop("user_id"), change)
+                except Exception as e:
+                    self.stderr.write(f"No se pudo notificar el pago: {e}")
+
+        self.stdout.write(json.dumps(report, indent=2))
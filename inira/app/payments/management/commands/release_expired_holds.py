@@ -0,0 +1,33 @@
+# inira/app/payments/management/commands/release_expired_holds.py
+
+from django.core.management.base import BaseCommand
+
+from inira.app.shared.container import container
+
+
+class Command(BaseCommand):
+    help = (
+        "Libera los cupos de las retenciones vencidas (pagos PSE que no se "
+        "confirmaron a tiempo). Pensado para ejecutarse periódicamente (cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        repository = container.payments().slot_hold_repository()
+        released = 0
+
+        while True:
+            hold_ids = repository.expired_ids(limit=options["batch_size"])
+            if not hold_ids:
+                break
+
+            count = repository.release(hold_ids)
+            released += count
+
+            # Todas bloqueadas por otro proceso: se reintentan en la próxima ejecución
+            if not count:
+                break
+
+        self.stdout.write(f"Retenciones liberadas: {released}")
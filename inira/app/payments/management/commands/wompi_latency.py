@@ -0,0 +1,19 @@
+# inira/app/payments/management/commands/wompi_latency.py
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from inira.app.payments.domain.services.wompi_services_impl import (
+    LATENCY_METRIC,
+    WOMPI_TIMEOUTS,
+)
+from inira.app.shared.metrics import latency_histogram
+
+
+class Command(BaseCommand):
+    help = "Muestra el histograma de latencia de las llamadas a Wompi por endpoint."
+
+    def handle(self, *args, **options):
+        for endpoint in WOMPI_TIMEOUTS:
+            self.stdout.write(json.dumps(latency_histogram(LATENCY_METRIC, endpoint)))
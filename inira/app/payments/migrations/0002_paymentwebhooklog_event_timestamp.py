@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="paymentwebhooklog",
+            name="event_timestamp",
+            field=models.BigIntegerField(
+                blank=True,
+                help_text="Timestamp del evento (campo timestamp)",
+                null=True,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="paymentwebhooklog",
+            constraint=models.UniqueConstraint(
+                fields=("transaction_id", "event_timestamp"),
+                name="uniq_webhook_transaction_event",
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.7 on 2026-10-18 18:10
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0002_paymentwebhooklog_event_timestamp"),
+        ("routes", "0006_rutasenderismo_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlotHold",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("slots", models.PositiveIntegerField(help_text="Cupos retenidos")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("HELD", "Retenido"),
+                            ("CONFIRMED", "Confirmado"),
+                            ("RELEASED", "Liberado"),
+                        ],
+                        default="HELD",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "expires_at",
+                    models.DateTimeField(
+                        help_text="Momento en que los cupos vuelven a estar disponibles"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "availability",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="holds",
+                        to="routes.rutaavailability",
+                    ),
+                ),
+                (
+                    "payment",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="slot_hold",
+                        to="payments.payment",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="slot_holds",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Retención de cupos",
+                "verbose_name_plural": "Retenciones de cupos",
+                "db_table": "slot_holds",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "expires_at"],
+                        name="slot_holds_status_expires_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payments", "0003_slothold"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="paymentwebhooklog",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0, help_text="Intentos fallidos de procesamiento"
+            ),
+        ),
+        migrations.AddField(
+            model_name="paymentwebhooklog",
+            name="next_attempt_at",
+            field=models.DateTimeField(
+                blank=True, help_text="No se reintenta antes de esta fecha", null=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="paymentwebhooklog",
+            name="processed",
+            field=models.BooleanField(
+                default=False,
+                help_text="Si el webhook ya no se reintenta (aplicado, o descartado con error)",
+            ),
+        ),
+    ]
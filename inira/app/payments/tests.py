@@ -0,0 +1,161 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import Point
+from django.db import connection, connections
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from inira.app.payments.infrastructure.models import Payment, SlotHold
+from inira.app.payments.infrastructure.repositories.slot_hold_repository_impl import (
+    SlotHoldRepositoryImpl,
+)
+from inira.app.routes.infrastructure.models import RutaAvailability, RutaSenderismo
+
+# Reservas simultáneas por prueba (SLOT_HOLD_STRESS_REQUESTS=300 por defecto)
+STRESS_REQUESTS = int(os.environ.get("SLOT_HOLD_STRESS_REQUESTS", 300))
+
+# Hilos (= conexiones a la base de datos) que compiten a la vez
+STRESS_WORKERS = int(os.environ.get("SLOT_HOLD_STRESS_WORKERS", 40))
+
+
+def _parallel(fn, times: int) -> list:
+    """Ejecuta `fn` `times` veces en paralelo; cada hilo cierra su conexión."""
+
+    def run(_):
+        try:
+            return fn()
+        except Exception as error:
+            return error
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=STRESS_WORKERS) as pool:
+        return list(pool.map(run, range(times)))
+
+
+@skipUnless(
+    connection.vendor == "postgresql",
+    "Las pruebas de concurrencia requieren PostgreSQL (bloqueos por fila)",
+)
+class SlotHoldConcurrencyTest(TransactionTestCase):
+    """Cientos de reservas y aprobaciones en paralelo sobre la misma fecha."""
+
+    SLOTS = 50
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="stress", email="stress@example.com", password="stress"
+        )
+        self.ruta = RutaSenderismo.objects.create(
+            title="Ruta de carga",
+            location="Test",
+            distance="5 km",
+            duration="2 h",
+            image="https://example.com/ruta.jpg",
+            description="Ruta para pruebas de concurrencia",
+            coordinates=Point(-75.5, 6.2),
+            phone="3000000000",
+            email="ruta@example.com",
+            whatsapp="3000000000",
+            # Holgura sobre SLOTS: el tope de capacidad no oculta devoluciones dobles
+            max_capacity=self.SLOTS * 2,
+        )
+        self.availability = RutaAvailability.objects.create(
+            ruta=self.ruta,
+            date=date.today() + timedelta(days=7),
+            available_slots=self.SLOTS,
+        )
+        self.repository = SlotHoldRepositoryImpl()
+
+    def _available_slots(self) -> int:
+        self.availability.refresh_from_db()
+        return self.availability.available_slots
+
+    def test_parallel_holds_never_oversell(self):
+        results = _parallel(
+            lambda: self.repository.hold(
+                availability_id=self.availability.id,
+                user_id=self.user.id,
+                slots=1,
+                ttl_seconds=900,
+            ),
+            STRESS_REQUESTS,
+        )
+
+        held = [result for result in results if isinstance(result, str)]
+        rejected = [result for result in results if isinstance(result, ValueError)]
+
+        self.assertEqual(len(held), self.SLOTS)
+        self.assertEqual(len(rejected), STRESS_REQUESTS - self.SLOTS)
+        self.assertEqual(self._available_slots(), 0)
+        self.assertEqual(
+            SlotHold.objects.filter(status=SlotHold.HoldStatus.HELD).count(),
+            self.SLOTS,
+        )
+
+    def test_duplicate_approvals_reclaim_released_hold_once(self):
+        payment = Payment.objects.create(
+            user=self.user, ruta=self.ruta, status=Payment.PaymentStatus.APPROVED
+        )
+        hold = SlotHold.objects.create(
+            availability=self.availability,
+            payment=payment,
+            user=self.user,
+            slots=3,
+            status=SlotHold.HoldStatus.RELEASED,
+            expires_at=timezone.now(),
+        )
+
+        # Webhook, reconciliación y consulta de estado aprobando a la vez
+        results = _parallel(
+            lambda: self.repository.settle(
+                {str(payment.id): Payment.PaymentStatus.APPROVED}
+            ),
+            STRESS_REQUESTS,
+        )
+
+        self.assertFalse([r for r in results if isinstance(r, Exception)])
+        self.assertEqual(self._available_slots(), self.SLOTS - hold.slots)
+        hold.refresh_from_db()
+        self.assertEqual(hold.status, SlotHold.HoldStatus.CONFIRMED)
+
+    def test_reclaim_without_slots_keeps_hold_released(self):
+        RutaAvailability.objects.filter(pk=self.availability.pk).update(
+            available_slots=1
+        )
+        payment = Payment.objects.create(
+            user=self.user, ruta=self.ruta, status=Payment.PaymentStatus.APPROVED
+        )
+        hold = SlotHold.objects.create(
+            availability=self.availability,
+            payment=payment,
+            user=self.user,
+            slots=2,
+            status=SlotHold.HoldStatus.RELEASED,
+            expires_at=timezone.now(),
+        )
+
+        self.repository.settle({str(payment.id): Payment.PaymentStatus.APPROVED})
+
+        self.assertEqual(self._available_slots(), 1)
+        hold.refresh_from_db()
+        self.assertEqual(hold.status, SlotHold.HoldStatus.RELEASED)
+
+    def test_parallel_release_returns_slots_once(self):
+        hold_id = self.repository.hold(
+            availability_id=self.availability.id,
+            user_id=self.user.id,
+            slots=5,
+            ttl_seconds=900,
+        )
+
+        released = _parallel(
+            lambda: self.repository.release([hold_id]), STRESS_REQUESTS
+        )
+
+        self.assertEqual(sum(r for r in released if isinstance(r, int)), 1)
+        self.assertEqual(self._available_slots(), self.SLOTS)
@@ -25,7 +25,7 @@ class RutaSenderismoAdmin(GISModelAdmin):
         "is_active",
     ]
     search_fields = ["title", "location", "company"]
-    readonly_fields = ["id", "created_at", "updated_at"]
+    readonly_fields = ["id", "rating_sum", "rating_count", "created_at", "updated_at"]
 
 
 @admin.register(RutaRating)
@@ -0,0 +1,20 @@
+# inira/app/routes/application/use_cases/get_route_availability.py
+
+from inira.app.routes.domain.repositories import RoutesRepository
+
+
+class GetRouteAvailability:
+    def __init__(self, routes_repository: RoutesRepository):
+        self.routes_repository = routes_repository
+
+    def execute(self, *, ruta_id: str, start, end) -> dict:
+        days = self.routes_repository.availability_calendar(
+            ruta_id, start=start, end=end
+        )
+
+        return {
+            "ruta_id": str(ruta_id),
+            "start": start,
+            "end": end,
+            "days": days,
+        }
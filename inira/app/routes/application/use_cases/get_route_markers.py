@@ -0,0 +1,22 @@
+# inira/app/routes/application/use_cases/get_route_markers.py
+
+from typing import Tuple
+from inira.app.routes.domain.repositories import RoutesRepository
+from inira.app.shared.map_tiles import load_tiles
+
+
+class GetRouteMarkers:
+    def __init__(self, routes_repository: RoutesRepository):
+        self.routes_repository = routes_repository
+
+    def execute(self, *, bbox: Tuple[float, float, float, float], zoom: int):
+        return load_tiles(
+            prefix="routes",
+            bbox=bbox,
+            zoom=zoom,
+            loader=lambda span, tile_size, cell_size: self.routes_repository.map_markers(
+                bbox=span,
+                tile_size=tile_size,
+                cell_size=cell_size,
+            ),
+        )
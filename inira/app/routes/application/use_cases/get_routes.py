@@ -1,4 +1,5 @@
-from typing import Optional
+from datetime import date
+from typing import Optional, Tuple
 from inira.app.routes.domain.repositories import RoutesRepository
 
 
@@ -14,19 +15,61 @@ class GetRoutes:
         page_size: int = 10,
         difficulty: Optional[str] = None,
         category: Optional[str] = None,
+        requires_payment: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        q: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        available_on: Optional[date] = None,
+        people: int = 1,
     ):
         # 🔹 UNA RUTA
         if id:
             return self.routes_repository.find_by_id(id)
 
-        # 🔹 MUCHAS RUTAS (PAGINADAS)
+        # 🔹 MUCHAS RUTAS (PAGINADAS POR CURSOR, SIN COUNT)
+        if cursor is not None:
+            routes, next_cursor = self.routes_repository.paginate_by_cursor(
+                cursor=cursor,
+                page_size=page_size,
+                difficulty=difficulty,
+                category=category,
+                requires_payment=requires_payment,
+                is_active=is_active,
+                q=q,
+                lat=lat,
+                lng=lng,
+                radius_km=radius_km,
+                bbox=bbox,
+                available_on=available_on,
+                people=people,
+            )
+
+            return {
+                "page_size": page_size,
+                "next_cursor": next_cursor,
+                "results": routes,
+            }
+
+        # 🔹 MUCHAS RUTAS (PAGINADAS EN BASE DE DATOS)
         total, routes = self.routes_repository.paginate(
             page=page,
             page_size=page_size,
             difficulty=difficulty,
             category=category,
+            requires_payment=requires_payment,
+            is_active=is_active,
+            q=q,
+            lat=lat,
+            lng=lng,
+            radius_km=radius_km,
+            bbox=bbox,
+            available_on=available_on,
+            people=people,
         )
-        print(total)
 
         return {
             "count": total,
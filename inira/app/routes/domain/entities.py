@@ -55,6 +55,12 @@ class RouteEntity:
     rating_avg: Optional[float] = None
     rating_count: int = 0
 
+    # Distancia al punto de búsqueda (solo en búsquedas por ubicación)
+    distance_km: Optional[float] = None
+
+    # Cupos libres en la fecha buscada (solo en búsquedas por available_on)
+    available_slots: Optional[int] = None
+
     # -------------------------
     # 🔧 MÉTODOS DE DOMINIO
     # -------------------------
@@ -1,6 +1,7 @@
 # inira/app/routes/domain/repositories.py
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List, Tuple, Optional
 from inira.app.routes.domain.entities import RouteEntity
 
@@ -29,9 +30,51 @@ class RoutesRepository(ABC):
         category: Optional[str] = None,
         requires_payment: Optional[bool] = None,
         is_active: Optional[bool] = None,
+        q: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        available_on: Optional[date] = None,
+        people: int = 1,
     ) -> Tuple[int, List[RouteEntity]]:
         pass
 
+    @abstractmethod
+    def paginate_by_cursor(
+        self,
+        *,
+        cursor: Optional[str],
+        page_size: int,
+        difficulty: Optional[str] = None,
+        category: Optional[str] = None,
+        requires_payment: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        q: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        available_on: Optional[date] = None,
+        people: int = 1,
+    ) -> Tuple[List[RouteEntity], Optional[str]]:
+        """Pagina por cursor (keyset); retorna (rutas, siguiente cursor)"""
+        pass
+
+    @abstractmethod
+    def map_markers(
+        self,
+        *,
+        bbox: Tuple[float, float, float, float],
+        tile_size: float,
+        cell_size: Optional[float] = None,
+    ) -> List[dict]:
+        """
+        Marcadores compactos del bbox (puntos o clusters si hay cell_size),
+        cada uno con el `tile` (x, y) de la grilla de `tile_size` al que pertenece
+        """
+        pass
+
     # 🆕 Métodos para gestión de disponibilidad
     @abstractmethod
     def get_availability_for_date(self, ruta_id: str, date):
@@ -43,6 +86,16 @@ class RoutesRepository(ABC):
         """Verifica si hay cupos disponibles"""
         pass
 
+    @abstractmethod
+    def availability_calendar(self, ruta_id: str, *, start, end) -> List[dict]:
+        """Cupos por día en el rango [start, end] (una fila por fecha)"""
+        pass
+
+    @abstractmethod
+    def generate_availability(self, *, start, days: int, ruta_id: str = None) -> int:
+        """Crea en bloque las fechas faltantes para las rutas activas; retorna cuántas se crearon"""
+        pass
+
     # inira/app/routes/domain/repositories.py — agregar abstractmethod
 
     @abstractmethod
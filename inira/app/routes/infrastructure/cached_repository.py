@@ -0,0 +1,101 @@
+# inira/app/routes/infrastructure/cached_repository.py
+
+from typing import List, Optional, Tuple
+
+from inira.app.routes.domain.entities import RouteEntity
+from inira.app.routes.domain.repositories import RoutesRepository
+from inira.app.routes.infrastructure.models import ROUTES_CACHE_NAMESPACE
+from inira.app.shared.cache import get_or_set, make_key
+
+DETAIL_TIMEOUT = 300
+LIST_TIMEOUT = 60
+
+# Solo se cachean las primeras páginas del listado sin búsqueda, ubicación ni fecha
+CACHED_PAGES = 3
+
+
+class CachedRoutesRepository(RoutesRepository):
+    """
+    Cache-aside (Redis) sobre otro RoutesRepository.
+
+    Las claves se versionan por namespace; las señales de rutas,
+    calificaciones y disponibilidad incrementan la versión (ver models.py).
+    """
+
+    def __init__(self, repository: RoutesRepository):
+        self.repository = repository
+
+    def save(self, route: RouteEntity) -> RouteEntity:
+        return self.repository.save(route)
+
+    def find_by_id(self, id: str) -> RouteEntity:
+        return get_or_set(
+            make_key(ROUTES_CACHE_NAMESPACE, "detail", id=str(id)),
+            lambda: self.repository.find_by_id(id),
+            namespace=ROUTES_CACHE_NAMESPACE,
+            timeout=DETAIL_TIMEOUT,
+        )
+
+    def all(self) -> List[RouteEntity]:
+        return self.repository.all()
+
+    def paginate(
+        self, *, page: int, page_size: int, **filters
+    ) -> Tuple[int, List[RouteEntity]]:
+        is_cacheable = (
+            page <= CACHED_PAGES
+            and not filters.get("q")
+            and filters.get("lat") is None
+            and filters.get("bbox") is None
+            and filters.get("available_on") is None
+        )
+        if not is_cacheable:
+            return self.repository.paginate(page=page, page_size=page_size, **filters)
+
+        return get_or_set(
+            make_key(
+                ROUTES_CACHE_NAMESPACE,
+                "page",
+                page=page,
+                page_size=page_size,
+                **filters,
+            ),
+            lambda: self.repository.paginate(page=page, page_size=page_size, **filters),
+            namespace=ROUTES_CACHE_NAMESPACE,
+            timeout=LIST_TIMEOUT,
+        )
+
+    def paginate_by_cursor(
+        self, *, cursor: Optional[str], page_size: int, **filters
+    ) -> Tuple[List[RouteEntity], Optional[str]]:
+        return self.repository.paginate_by_cursor(
+            cursor=cursor, page_size=page_size, **filters
+        )
+
+    def map_markers(self, *, bbox, tile_size, cell_size=None) -> List[dict]:
+        # Los tiles ya tienen su propio cache (shared/map_tiles.py)
+        return self.repository.map_markers(
+            bbox=bbox, tile_size=tile_size, cell_size=cell_size
+        )
+
+    # 🔹 Disponibilidad y datos por usuario: siempre desde la base de datos
+    def get_availability_for_date(self, ruta_id: str, date):
+        return self.repository.get_availability_for_date(ruta_id, date)
+
+    def check_availability(self, ruta_id: str, date, number_of_people: int) -> bool:
+        return self.repository.check_availability(ruta_id, date, number_of_people)
+
+    def availability_calendar(self, ruta_id: str, *, start, end) -> List[dict]:
+        return self.repository.availability_calendar(ruta_id, start=start, end=end)
+
+    def generate_availability(self, *, start, days: int, ruta_id: str = None) -> int:
+        return self.repository.generate_availability(
+            start=start, days=days, ruta_id=ruta_id
+        )
+
+    def paginate_by_user(
+        self, *, user_id: str, page: int, page_size: int
+    ) -> Tuple[int, List[RouteEntity]]:
+        return self.repository.paginate_by_user(
+            user_id=user_id, page=page, page_size=page_size
+        )
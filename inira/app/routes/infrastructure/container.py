@@ -2,14 +2,28 @@ from dependency_injector import containers, providers
 
 from inira.app.routes.application.use_cases.create_route import CreateRoute
 from inira.app.routes.application.use_cases.get_my_routes import GetMyRoutes
+from inira.app.routes.application.use_cases.get_route_availability import (
+    GetRouteAvailability,
+)
+from inira.app.routes.application.use_cases.get_route_markers import GetRouteMarkers
 from inira.app.routes.application.use_cases.get_routes import GetRoutes
+from inira.app.routes.infrastructure.cached_repository import CachedRoutesRepository
 from inira.app.routes.infrastructure.repositories import RoutesRepositoryImpl
 
 
 class RoutesContainer(containers.DeclarativeContainer):
     """Contenedor de dependencias del módulo rutas inject."""
 
-    routes_repository = providers.Factory(RoutesRepositoryImpl)
+    routes_repository = providers.Factory(
+        CachedRoutesRepository,
+        repository=providers.Factory(RoutesRepositoryImpl),
+    )
     get_routes = providers.Factory(GetRoutes, routes_repository=routes_repository)
     create_route = providers.Factory(CreateRoute, routes_repository=routes_repository)
     get_my_routes = providers.Factory(GetMyRoutes, routes_repository=routes_repository)
+    get_route_markers = providers.Factory(
+        GetRouteMarkers, routes_repository=routes_repository
+    )
+    get_route_availability = providers.Factory(
+        GetRouteAvailability, routes_repository=routes_repository
+    )
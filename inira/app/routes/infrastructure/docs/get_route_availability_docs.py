@@ -0,0 +1,63 @@
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiExample,
+)
+from drf_spectacular.types import OpenApiTypes
+
+
+get_route_availability_docs = extend_schema(
+    tags=["Rutas"],
+    summary="Calendario de disponibilidad de una ruta",
+    description=(
+        "Retorna los cupos disponibles por día de una ruta en un rango de fechas, "
+        "en una sola petición (pensado para el selector de fechas).\n\n"
+        "- Sin parámetros retorna los próximos 30 días.\n"
+        "- El rango máximo es de 92 días.\n"
+        "- Las fechas pasadas o deshabilitadas se marcan con `is_available = false`."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="ruta_id",
+            description="UUID de la ruta",
+            required=True,
+            type=OpenApiTypes.UUID,
+            location=OpenApiParameter.PATH,
+        ),
+        OpenApiParameter(
+            name="start",
+            description="Fecha inicial (YYYY-MM-DD). Por defecto hoy",
+            required=False,
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="end",
+            description="Fecha final inclusiva (YYYY-MM-DD). Por defecto start + 29 días",
+            required=False,
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={
+        200: OpenApiTypes.OBJECT,
+        400: OpenApiTypes.OBJECT,
+        404: OpenApiTypes.OBJECT,
+    },
+    examples=[
+        OpenApiExample(
+            name="Calendario",
+            value={
+                "ruta_id": "550e8400-e29b-41d4-a716-446655440000",
+                "start": "2026-11-01",
+                "end": "2026-11-02",
+                "days": [
+                    {"date": "2026-11-01", "available_slots": 12, "is_available": True},
+                    {"date": "2026-11-02", "available_slots": 0, "is_available": True},
+                ],
+            },
+            response_only=True,
+            status_codes=["200"],
+        ),
+    ],
+)
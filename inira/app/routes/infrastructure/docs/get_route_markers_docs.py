@@ -0,0 +1,81 @@
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiExample,
+)
+from drf_spectacular.types import OpenApiTypes
+
+
+get_route_markers_docs = extend_schema(
+    tags=["Rutas"],
+    summary="Marcadores de rutas para el mapa",
+    description=(
+        "Retorna marcadores compactos de las rutas activas dentro del área visible "
+        "del mapa.\n\n"
+        "- Con `zoom` menor a 12 los puntos se agrupan en clusters calculados en el "
+        "servidor (`type = cluster`).\n"
+        "- Desde `zoom` 12 se retornan puntos individuales con id, coordenadas, "
+        "dificultad y rating (`type = point`).\n\n"
+        "La respuesta se arma por tiles cacheados, por lo que desplazar el mapa "
+        "solo consulta los tiles nuevos."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="bbox",
+            description="Área visible del mapa: `min_lng,min_lat,max_lng,max_lat`",
+            required=True,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="zoom",
+            description="Nivel de zoom del mapa (0 a 20)",
+            required=True,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={
+        200: OpenApiTypes.OBJECT,
+        400: OpenApiTypes.OBJECT,
+    },
+    examples=[
+        OpenApiExample(
+            name="Clusters (zoom bajo)",
+            value={
+                "zoom": 8,
+                "clustered": True,
+                "items": [
+                    {"type": "cluster", "count": 14, "lat": 6.2442, "lng": -75.5812},
+                ],
+            },
+            response_only=True,
+            status_codes=["200"],
+        ),
+        OpenApiExample(
+            name="Puntos (zoom alto)",
+            value={
+                "zoom": 14,
+                "clustered": False,
+                "items": [
+                    {
+                        "type": "point",
+                        "id": "550e8400-e29b-41d4-a716-446655440000",
+                        "lat": 6.25184,
+                        "lng": -75.56359,
+                        "difficulty": "Fácil",
+                        "rating": 4.5,
+                    },
+                ],
+            },
+            response_only=True,
+            status_codes=["200"],
+        ),
+        OpenApiExample(
+            name="Área demasiado grande",
+            value={"bbox": "El área solicitada es demasiado grande para este zoom"},
+            response_only=True,
+            status_codes=["400"],
+        ),
+    ],
+)
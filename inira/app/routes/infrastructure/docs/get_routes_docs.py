@@ -15,9 +15,12 @@ get_routes_docs = extend_schema(
     summary="Obtener rutas de senderismo",
     description=(
         "Obtiene rutas de senderismo registradas en el sistema.\n\n"
-        "- Si **NO** se envía el parámetro `id`, retorna el listado completo.\n"
+        "- Si **NO** se envía el parámetro `id`, retorna el listado paginado.\n"
         "- Si se envía el parámetro `id`, retorna una ruta específica.\n\n"
-        "El parámetro `id` se envía como **query param**, no como path."
+        "El parámetro `id` se envía como **query param**, no como path.\n\n"
+        "Con `lat` y `lng` el listado se ordena por cercanía usando el índice "
+        "espacial. El modo cursor ordena por fecha y no se combina con `q` "
+        "ni con `lat`/`lng` (responde 400)."
     ),
     parameters=[
         OpenApiParameter(
@@ -41,6 +44,100 @@ get_routes_docs = extend_schema(
             type=OpenApiTypes.STR,
             location=OpenApiParameter.QUERY,
         ),
+        OpenApiParameter(
+            name="requires_payment",
+            description="Filtrar rutas que requieren (o no) pago previo",
+            required=False,
+            type=OpenApiTypes.BOOL,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="is_active",
+            description="Filtrar por estado (por defecto solo rutas activas)",
+            required=False,
+            type=OpenApiTypes.BOOL,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="page",
+            description="Número de página (default = 1)",
+            required=False,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="page_size",
+            description="Cantidad de resultados por página (default = 10, máximo = 100)",
+            required=False,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="cursor",
+            description=(
+                "Activa la paginación por cursor. Enviar vacío para la primera página "
+                "y luego el valor de `next_cursor`. En este modo no se retorna `count` "
+                "y no se admiten `q` ni `lat`/`lng`."
+            ),
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="q",
+            description=(
+                "Búsqueda de texto en título, ubicación, empresa y descripción "
+                "(español, sin tildes). Ordena por relevancia combinada con el rating"
+            ),
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="available_on",
+            description=(
+                "Solo rutas con cupos en esta fecha (YYYY-MM-DD). Agrega "
+                "`available_slots` a cada resultado"
+            ),
+            required=False,
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="people",
+            description="Cupos requeridos en `available_on` (default = 1)",
+            required=False,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="lat",
+            description="Latitud del usuario. Con `lng`, ordena por cercanía y agrega `distance_km`",
+            required=False,
+            type=OpenApiTypes.FLOAT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="lng",
+            description="Longitud del usuario (requerida junto con `lat`)",
+            required=False,
+            type=OpenApiTypes.FLOAT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="radius",
+            description="Radio de búsqueda en km alrededor de `lat`/`lng` (máximo = 500)",
+            required=False,
+            type=OpenApiTypes.FLOAT,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="bbox",
+            description="Área visible del mapa: `min_lng,min_lat,max_lng,max_lat`",
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
     ],
     responses={
         200: OpenApiTypes.OBJECT,
@@ -54,6 +151,8 @@ get_routes_docs = extend_schema(
             summary="Respuesta cuando no se envía ID",
             value={
                 "count": 2,
+                "page": 1,
+                "page_size": 10,
                 "results": [
                     {
                         "id": "550e8400-e29b-41d4-a716-446655440000",
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+
+# Rango máximo del calendario (un trimestre)
+MAX_CALENDAR_DAYS = 92
+DEFAULT_CALENDAR_DAYS = 30
+
+
+class AvailabilityCalendarInputSerializer(serializers.Serializer):
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        start = attrs.get("start") or timezone.localdate()
+        end = attrs.get("end") or start + timedelta(days=DEFAULT_CALENDAR_DAYS - 1)
+
+        if end < start:
+            raise serializers.ValidationError(
+                {"end": "Debe ser igual o posterior a start"}
+            )
+
+        if (end - start).days + 1 > MAX_CALENDAR_DAYS:
+            raise serializers.ValidationError(
+                {"end": f"El rango máximo es de {MAX_CALENDAR_DAYS} días"}
+            )
+
+        attrs["start"] = start
+        attrs["end"] = end
+        return attrs
@@ -1,11 +1,24 @@
+from django.utils import timezone
 from rest_framework import serializers
 
+from inira.app.shared.geo import GeoQueryInputSerializer
 
-class GetRoutesInputSerializer(serializers.Serializer):
+
+class GetRoutesInputSerializer(GeoQueryInputSerializer):
     id = serializers.UUIDField(required=False)
 
     difficulty = serializers.CharField(required=False)
     category = serializers.CharField(required=False)
+    requires_payment = serializers.BooleanField(required=False, allow_null=True)
+    is_active = serializers.BooleanField(required=False, allow_null=True)
+
+    q = serializers.CharField(required=False, allow_blank=True, max_length=200)
+
+    # 🆕 Rutas con cupos en una fecha para N personas
+    available_on = serializers.DateField(required=False)
+    people = serializers.IntegerField(required=False, min_value=1, default=1)
+
+    cursor = serializers.CharField(required=False, allow_blank=True)
 
     page = serializers.IntegerField(required=False, min_value=1, default=1)
     page_size = serializers.IntegerField(
@@ -14,3 +27,25 @@ class GetRoutesInputSerializer(serializers.Serializer):
         max_value=100,
         default=10
     )
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+
+        # 🔹 El cursor recorre el orden por fecha: relevancia y cercanía no aplican
+        if "cursor" in attrs and ((attrs.get("q") or "").strip() or "lat" in attrs):
+            raise serializers.ValidationError(
+                {
+                    "cursor": (
+                        "La paginación por cursor no se combina con q ni con lat/lng"
+                    )
+                }
+            )
+
+        return attrs
+
+    def validate_available_on(self, value):
+        if value < timezone.localdate():
+            raise serializers.ValidationError(
+                "La fecha de disponibilidad no puede estar en el pasado"
+            )
+        return value
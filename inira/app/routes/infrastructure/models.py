@@ -1,11 +1,30 @@
 import uuid
 from django.contrib.gis.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Least
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from decimal import Decimal
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from datetime import date
 
+from inira.app.shared.cache import bump_namespace
+
+# Configuración de búsqueda: stemming en español + unaccent ("cañon" ~ "canon")
+SEARCH_CONFIG = "spanish_unaccent"
+
+# Namespace del cache de lectura de rutas (ver CachedRoutesRepository)
+ROUTES_CACHE_NAMESPACE = "routes"
+
+
+def invalidate_routes_cache():
+    """Invalida el cache de rutas cuando la transacción actual confirma."""
+    transaction.on_commit(lambda: bump_namespace(ROUTES_CACHE_NAMESPACE))
+
 
 class RutaSenderismo(models.Model):
     """
@@ -144,6 +163,19 @@ class RutaSenderismo(models.Model):
         blank=True, help_text="Qué deben llevar los participantes"
     )
 
+    # 🆕 Agregados de calificación (mantenidos al calificar)
+    rating_sum = models.PositiveIntegerField(
+        default=0, help_text="Suma de todas las calificaciones de la ruta"
+    )
+
+    rating_count = models.PositiveIntegerField(
+        default=0, help_text="Número total de calificaciones de la ruta"
+    )
+
+    # 🆕 Búsqueda de texto completo (title, location, company, description).
+    # La mantiene un trigger de PostgreSQL, ver migración 0006.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     # Auditoría
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -157,6 +189,7 @@ class RutaSenderismo(models.Model):
             models.Index(fields=["requires_payment", "is_active"]),
             models.Index(fields=["category", "type"]),
             models.Index(fields=["is_active", "created_at"]),
+            GinIndex(fields=["search_vector"], name="rutas_search_vector_gin"),
         ]
 
     def __str__(self):
@@ -202,6 +235,28 @@ class RutaSenderismo(models.Model):
         """Verifica si la ruta tiene precio configurado"""
         return self.base_price > 0
 
+    @property
+    def rating_avg(self):
+        """Promedio de calificaciones calculado desde los agregados"""
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
+
+    def apply_rating_change(self, *, score_delta: int, count_delta: int = 0):
+        """
+        Actualiza los agregados de calificación con un UPDATE atómico.
+
+        Args:
+            score_delta: Diferencia a sumar en rating_sum
+            count_delta: Diferencia a sumar en rating_count (1 al crear)
+        """
+        RutaSenderismo.objects.filter(pk=self.pk).update(
+            rating_sum=models.F("rating_sum") + score_delta,
+            rating_count=models.F("rating_count") + count_delta,
+        )
+        # update() no emite señales: invalidar explícitamente
+        invalidate_routes_cache()
+
 
 class RutaRating(models.Model):
     """
@@ -319,11 +374,18 @@ class RutaAvailability(models.Model):
         if self.is_past_date:
             raise ValueError("No se pueden reservar cupos en fechas pasadas")
 
-        if self.available_slots < number:
-            raise ValueError(f"Solo quedan {self.available_slots} cupos disponibles")
+        # 🔹 UPDATE condicional: dos reservas simultáneas no pueden sobrevender
+        updated = RutaAvailability.objects.filter(
+            pk=self.pk, is_available=True, available_slots__gte=number
+        ).update(
+            available_slots=models.F("available_slots") - number,
+            updated_at=timezone.now(),
+        )
+
+        self.refresh_from_db(fields=["available_slots", "updated_at"])
 
-        self.available_slots -= number
-        self.save(update_fields=["available_slots", "updated_at"])
+        if not updated:
+            raise ValueError(f"Solo quedan {self.available_slots} cupos disponibles")
 
     def release_slots(self, number: int):
         """
@@ -332,9 +394,13 @@ class RutaAvailability(models.Model):
         Args:
             number: Número de cupos a liberar
         """
-        original_capacity = self.ruta.max_capacity
-        self.available_slots = min(self.available_slots + number, original_capacity)
-        self.save(update_fields=["available_slots", "updated_at"])
+        RutaAvailability.objects.filter(pk=self.pk).update(
+            available_slots=Least(
+                models.F("available_slots") + number, self.ruta.max_capacity
+            ),
+            updated_at=timezone.now(),
+        )
+        self.refresh_from_db(fields=["available_slots", "updated_at"])
 
     def mark_as_unavailable(self):
         """Marca esta fecha como no disponible"""
@@ -382,3 +448,24 @@ class RutaImage(models.Model):
 
     def __str__(self):
         return f"{self.ruta.title} - Imagen {self.order}"
+
+
+@receiver(post_delete, sender=RutaRating)
+def decrement_route_rating_on_delete(sender, instance, **kwargs):
+    # Borrados en cascada (usuario o admin) no pasan por la vista: descontar
+    # aquí para que rating_sum / rating_count no se desvíen
+    RutaSenderismo.objects.filter(pk=instance.ruta_id, rating_count__gt=0).update(
+        rating_sum=models.F("rating_sum") - instance.score,
+        rating_count=models.F("rating_count") - 1,
+    )
+
+
+# 🔹 Invalidación del cache de rutas: cambios en rutas, calificaciones y disponibilidad
+@receiver(post_save, sender=RutaSenderismo)
+@receiver(post_delete, sender=RutaSenderismo)
+@receiver(post_save, sender=RutaRating)
+@receiver(post_delete, sender=RutaRating)
+@receiver(post_save, sender=RutaAvailability)
+@receiver(post_delete, sender=RutaAvailability)
+def invalidate_routes_cache_on_change(sender, **kwargs):
+    invalidate_routes_cache()
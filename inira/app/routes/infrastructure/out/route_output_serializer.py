@@ -62,3 +62,17 @@ class RouteOutputSerializer(serializers.Serializer):
         allow_null=True, help_text="Promedio de calificaciones"
     )
     rating_count = serializers.IntegerField(help_text="Número total de calificaciones")
+
+    # 🆕 Solo en búsquedas por ubicación (lat/lng)
+    distance_km = serializers.FloatField(
+        allow_null=True,
+        required=False,
+        help_text="Distancia en km al punto de búsqueda",
+    )
+
+    # 🆕 Solo en búsquedas por fecha (available_on)
+    available_slots = serializers.IntegerField(
+        allow_null=True,
+        required=False,
+        help_text="Cupos libres en la fecha buscada",
+    )
@@ -1,13 +1,22 @@
 # inira/app/routes/infrastructure/repositories/routes_repository_impl.py
 
+from datetime import date, timedelta
 from typing import List, Tuple, Optional
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FilteredRelation, FloatField, Q
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.utils import timezone
 from rest_framework.exceptions import NotFound
-from django.db.models import Avg, Count
 from decimal import Decimal
 
 from inira.app.routes.domain.entities import RouteEntity, Coordinates
 from inira.app.routes.domain.repositories import RoutesRepository
-from inira.app.routes.infrastructure.models import RutaSenderismo
+from inira.app.routes.infrastructure.models import SEARCH_CONFIG, RutaSenderismo
+from inira.app.shared.geo import apply_geo_filters, tile_clusters, tile_points
+from inira.app.shared.pagination import keyset_page
+
+# Filas por INSERT al generar disponibilidad
+GENERATE_BATCH_SIZE = 1000
 
 
 class RoutesRepositoryImpl(RoutesRepository):
@@ -36,20 +45,16 @@ class RoutesRepositoryImpl(RoutesRepository):
 
     def find_by_id(self, id: str) -> RouteEntity:
         try:
-            model = RutaSenderismo.objects.annotate(
-                rating_avg=Avg("ratings__score"),
-                rating_count=Count("ratings"),
-            ).get(pk=id)
+            model = RutaSenderismo.objects.select_related("created_by").get(pk=id)
         except RutaSenderismo.DoesNotExist:
             raise NotFound(f"No existe una ruta con id {id}")
 
         return self._to_entity(model)
 
     def all(self) -> List[RouteEntity]:
-        queryset = RutaSenderismo.objects.annotate(
-            rating_avg=Avg("ratings__score"),
-            rating_count=Count("ratings"),
-        ).order_by("-created_at")
+        queryset = RutaSenderismo.objects.select_related("created_by").order_by(
+            "-created_at"
+        )
         return [self._to_entity(model) for model in queryset]
 
     def paginate(
@@ -61,12 +66,107 @@ class RoutesRepositoryImpl(RoutesRepository):
         category: Optional[str] = None,
         requires_payment: Optional[bool] = None,
         is_active: Optional[bool] = None,
+        q: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        available_on: Optional[date] = None,
+        people: int = 1,
     ) -> Tuple[int, List[RouteEntity]]:
 
-        queryset = RutaSenderismo.objects.annotate(
-            rating_avg=Avg("ratings__score"),
-            rating_count=Count("ratings"),
-        ).order_by("-created_at")
+        queryset = self._filtered_queryset(
+            difficulty=difficulty,
+            category=category,
+            requires_payment=requires_payment,
+            is_active=is_active,
+            q=q,
+            lat=lat,
+            lng=lng,
+            radius_km=radius_km,
+            bbox=bbox,
+            available_on=available_on,
+            people=people,
+        )
+
+        # 🔹 Con búsqueda se ordena por relevancia; con ubicación, por cercanía
+        if q:
+            queryset = queryset.order_by("-search_score", "-created_at")
+        elif lat is not None and lng is not None:
+            queryset = queryset.order_by("distance_m", "-created_at")
+        else:
+            queryset = queryset.order_by("-created_at")
+
+        total = queryset.count()
+
+        offset = (page - 1) * page_size
+        queryset = queryset[offset : offset + page_size]
+
+        routes = [self._to_entity(model) for model in queryset]
+
+        return total, routes
+
+    def paginate_by_cursor(
+        self,
+        *,
+        cursor: Optional[str],
+        page_size: int,
+        difficulty: Optional[str] = None,
+        category: Optional[str] = None,
+        requires_payment: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        q: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        available_on: Optional[date] = None,
+        people: int = 1,
+    ) -> Tuple[List[RouteEntity], Optional[str]]:
+
+        # 🔹 Los filtros (texto y espaciales) aplican, pero el orden sigue siendo por fecha
+        queryset = self._filtered_queryset(
+            difficulty=difficulty,
+            category=category,
+            requires_payment=requires_payment,
+            is_active=is_active,
+            q=q,
+            lat=lat,
+            lng=lng,
+            radius_km=radius_km,
+            bbox=bbox,
+            available_on=available_on,
+            people=people,
+        )
+
+        # 🔹 Keyset sobre (created_at, id): sin OFFSET ni COUNT
+        models, next_cursor = keyset_page(
+            queryset,
+            cursor=cursor,
+            page_size=page_size,
+            field="created_at",
+            descending=True,
+        )
+
+        return [self._to_entity(model) for model in models], next_cursor
+
+    def _filtered_queryset(
+        self,
+        *,
+        difficulty: Optional[str] = None,
+        category: Optional[str] = None,
+        requires_payment: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        q: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_km: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+        available_on: Optional[date] = None,
+        people: int = 1,
+    ):
+        # 🔹 Los ratings vienen de columnas desnormalizadas (sin JOIN + GROUP BY)
+        queryset = RutaSenderismo.objects.select_related("created_by")
 
         # 🔹 Filtros opcionales
         if difficulty:
@@ -85,14 +185,89 @@ class RoutesRepositoryImpl(RoutesRepository):
             # Por defecto, solo mostrar rutas activas
             queryset = queryset.filter(is_active=True)
 
-        total = queryset.count()
+        # 🆕 Búsqueda de texto completo sobre el tsvector indexado (GIN)
+        if q:
+            query = SearchQuery(q, config=SEARCH_CONFIG, search_type="websearch")
+            rating_avg = Coalesce(
+                Cast("rating_sum", FloatField()) / NullIf(F("rating_count"), 0),
+                0.0,
+            )
+            queryset = queryset.filter(search_vector=query).annotate(
+                # ts_rank ponderado por el rating (hasta +50% con 5 estrellas)
+                search_score=SearchRank(F("search_vector"), query)
+                * (1.0 + rating_avg / 10.0),
+            )
 
-        offset = (page - 1) * page_size
-        queryset = queryset[offset : offset + page_size]
+        # 🆕 Rutas con cupos en una fecha: LEFT JOIN a la disponibilidad de ese día
+        # (índice único ruta+date). Sin fila para la fecha = capacidad completa.
+        if available_on:
+            queryset = queryset.annotate(
+                day=FilteredRelation(
+                    "availabilities",
+                    condition=Q(availabilities__date=available_on),
+                ),
+                slots_on_date=Coalesce(F("day__available_slots"), F("max_capacity")),
+            ).filter(
+                Q(day__is_available=True) | Q(day__id__isnull=True),
+                slots_on_date__gte=people,
+            )
 
-        routes = [self._to_entity(model) for model in queryset]
+        # 🆕 Búsqueda por ubicación (ST_DWithin / bbox + distancia KNN)
+        queryset = apply_geo_filters(
+            queryset,
+            field="coordinates",
+            lat=lat,
+            lng=lng,
+            radius_km=radius_km,
+            bbox=bbox,
+        )
 
-        return total, routes
+        return queryset
+
+    def map_markers(
+        self,
+        *,
+        bbox: Tuple[float, float, float, float],
+        tile_size: float,
+        cell_size: Optional[float] = None,
+    ) -> List[dict]:
+        queryset = RutaSenderismo.objects.filter(is_active=True)
+
+        # 🔹 Zoom bajo: clusters de grilla calculados en la base de datos
+        if cell_size:
+            return tile_clusters(
+                queryset,
+                field="coordinates",
+                bbox=bbox,
+                tile_size=tile_size,
+                cell_size=cell_size,
+            )
+
+        # 🔹 Zoom alto: solo las columnas necesarias para dibujar el pin
+        rows = tile_points(
+            queryset,
+            field="coordinates",
+            bbox=bbox,
+            tile_size=tile_size,
+            values=("id", "difficulty", "rating_sum", "rating_count"),
+        )
+
+        return [
+            {
+                "tile": (int(row["tx"]), int(row["ty"])),
+                "type": "point",
+                "id": str(row["id"]),
+                "lat": round(row["y"], 6),
+                "lng": round(row["x"], 6),
+                "difficulty": row["difficulty"],
+                "rating": (
+                    round(row["rating_sum"] / row["rating_count"], 1)
+                    if row["rating_count"]
+                    else None
+                ),
+            }
+            for row in rows
+        ]
 
     # 🆕 Método para obtener disponibilidad de una ruta en una fecha
     def get_availability_for_date(
@@ -135,13 +310,99 @@ class RoutesRepositoryImpl(RoutesRepository):
             and availability.available_slots >= number_of_people
         )
 
+    def availability_calendar(self, ruta_id: str, *, start, end) -> List[dict]:
+        """
+        Calendario de cupos de una ruta. Las fechas aún sin fila se
+        reportan con la capacidad máxima (así las crearía get_or_create).
+        """
+        from inira.app.routes.infrastructure.models import RutaAvailability
+
+        ruta = (
+            RutaSenderismo.objects.filter(pk=ruta_id)
+            .values("max_capacity", "is_active")
+            .first()
+        )
+        if not ruta:
+            raise NotFound(f"No existe una ruta con id {ruta_id}")
+
+        # 🔹 Una sola consulta para todo el rango (índice ruta, date)
+        rows = {
+            row["date"]: row
+            for row in RutaAvailability.objects.filter(
+                ruta_id=ruta_id, date__range=(start, end)
+            ).values("date", "available_slots", "is_available")
+        }
+
+        today = timezone.localdate()
+        calendar = []
+        for offset in range((end - start).days + 1):
+            day = start + timedelta(days=offset)
+            row = rows.get(
+                day,
+                {"available_slots": ruta["max_capacity"], "is_available": True},
+            )
+            calendar.append(
+                {
+                    "date": day,
+                    "available_slots": row["available_slots"],
+                    "is_available": (
+                        ruta["is_active"] and row["is_available"] and day >= today
+                    ),
+                }
+            )
+
+        return calendar
+
+    def generate_availability(self, *, start, days: int, ruta_id: str = None) -> int:
+        from inira.app.routes.infrastructure.models import RutaAvailability
+
+        rutas = RutaSenderismo.objects.filter(is_active=True)
+        if ruta_id:
+            rutas = rutas.filter(pk=ruta_id)
+
+        dates = [start + timedelta(days=offset) for offset in range(days)]
+        if not dates:
+            return 0
+
+        rows = [
+            RutaAvailability(
+                ruta_id=ruta_pk,
+                date=day,
+                available_slots=max_capacity,
+                is_available=True,
+            )
+            for ruta_pk, max_capacity in rutas.values_list("id", "max_capacity")
+            for day in dates
+        ]
+
+        existing = RutaAvailability.objects.filter(
+            ruta__in=rutas, date__range=(dates[0], dates[-1])
+        )
+        before = existing.count()
+
+        # 🔹 Un solo bulk_create por lotes; ignore_conflicts deja intactas las
+        # fechas que ya existían (p. ej. creadas por una reserva)
+        RutaAvailability.objects.bulk_create(
+            rows, batch_size=GENERATE_BATCH_SIZE, ignore_conflicts=True
+        )
+
+        # ignore_conflicts no informa cuántas filas se insertaron: se cuenta
+        # antes y después (incluye fechas creadas en paralelo en ese lapso)
+        return existing.count() - before
+
     # -------------------------
     # 🔧 MÉTODO PRIVADO DE MAPEO
     # -------------------------
     def _to_entity(self, model: RutaSenderismo) -> RouteEntity:
-        # Obtener rating_avg y rating_count si están disponibles (vienen de annotate)
-        rating_avg = getattr(model, "rating_avg", None)
-        rating_count = getattr(model, "rating_count", None)
+        # rating_avg se calcula desde las columnas rating_sum / rating_count
+        rating_avg = model.rating_avg
+        rating_count = model.rating_count
+
+        # Solo existe cuando la consulta incluye lat/lng
+        distance_m = getattr(model, "distance_m", None)
+
+        # Solo existe cuando la consulta incluye available_on
+        slots_on_date = getattr(model, "slots_on_date", None)
 
         return RouteEntity(
             # Campos originales obligatorios
@@ -178,10 +439,12 @@ class RoutesRepositoryImpl(RoutesRepository):
             included_services=model.included_services,
             requirements=model.requirements,
             what_to_bring=model.what_to_bring,
-            # 🆕 Campos calculados (del annotate)
+            # 🆕 Campos calculados (agregados desnormalizados)
             rating_avg=float(rating_avg) if rating_avg else None,
             rating_count=rating_count or 0,
             created_by=str(model.created_by) if model.created_by else None,
+            distance_km=round(distance_m / 1000, 2) if distance_m is not None else None,
+            available_slots=slots_on_date,
         )
 
     def paginate_by_user(
@@ -193,11 +456,8 @@ class RoutesRepositoryImpl(RoutesRepository):
     ) -> Tuple[int, List[RouteEntity]]:
 
         queryset = (
-            RutaSenderismo.objects.annotate(
-                rating_avg=Avg("ratings__score"),
-                rating_count=Count("ratings"),
-            )
-            .filter(created_by_id=user_id)
+            RutaSenderismo.objects.filter(created_by_id=user_id)
+            .select_related("created_by")
             .order_by("-created_at")
         )
 
@@ -4,6 +4,8 @@ from .views import (
     RutaSenderismoAPIView,
     RutaRatingAPIView,
     RutaBannerAPIView,
+    RutaMapAPIView,
+    RutaAvailabilityAPIView,
 )
 
 urlpatterns = [
@@ -11,4 +13,10 @@ urlpatterns = [
     path("rate-routes/", RutaRatingAPIView.as_view(), name="rutas"),
     path("ruta-banner/", RutaBannerAPIView.as_view(), name="rutas"),
     path("rutas/mis-rutas/", MyRoutesAPIView.as_view(), name="rutas"),
+    path("rutas/mapa/", RutaMapAPIView.as_view(), name="rutas-mapa"),
+    path(
+        "rutas/<uuid:ruta_id>/disponibilidad/",
+        RutaAvailabilityAPIView.as_view(),
+        name="rutas-disponibilidad",
+    ),
 ]
@@ -14,13 +14,26 @@ from inira.app.routes.infrastructure.docs.get_routes_banner_docs import (
     get_routes_banner_docs,
 )
 from inira.app.routes.infrastructure.docs.rate_route_docs import rate_route_docs
+from inira.app.routes.infrastructure.docs.get_route_availability_docs import (
+    get_route_availability_docs,
+)
+from inira.app.routes.infrastructure.input.availability_calendar_input_serializer import (
+    AvailabilityCalendarInputSerializer,
+)
+from inira.app.routes.infrastructure.input.get_routes_input_serializer import (
+    GetRoutesInputSerializer,
+)
 from inira.app.routes.infrastructure.input.route_input_serializer import (
     RouteInputSerializer,
 )
 from inira.app.routes.infrastructure.input.ruta_rating_serializer import (
     RutaRatingInputSerializer,
 )
-from inira.app.routes.infrastructure.models import RutaRating, RutaSenderismo
+from inira.app.routes.infrastructure.models import (
+    ROUTES_CACHE_NAMESPACE,
+    RutaRating,
+    RutaSenderismo,
+)
 from inira.app.routes.infrastructure.out.ruta_banner_serializer import (
     RutaBannerSerializer,
 )
@@ -32,8 +45,13 @@ from inira.app.routes.infrastructure.out.route_output_serializer import (
     RouteOutputSerializer,
 )
 from inira.app.routes.infrastructure.docs.get_routes_docs import get_routes_docs
+from inira.app.routes.infrastructure.docs.get_route_markers_docs import (
+    get_route_markers_docs,
+)
+from inira.app.shared.cache import get_or_set, make_key
+from inira.app.shared.geo import MapViewportInputSerializer
 
-from django.db.models import Avg, Count
+from django.db import transaction
 
 from inira.app.shared.permissions import require_group
 
@@ -47,40 +65,64 @@ class RutaSenderismoAPIView(APIView):
         Query params soportados:
         - id: UUID (opcional)
         - page: int (opcional, default=1)
-        - page_size: int (opcional, default=10)
+        - page_size: int (opcional, default=10, máximo=100)
+        - difficulty: str (opcional)
+        - category: str (opcional)
+        - requires_payment: bool (opcional)
+        - is_active: bool (opcional, por defecto solo rutas activas)
+        - cursor: str (opcional, activa la paginación por cursor; vacío = primera página)
+        - lat, lng: float (opcional, ordena por cercanía y retorna distance_km)
+        - radius: float (opcional, km alrededor de lat/lng)
+        - bbox: str (opcional, min_lng,min_lat,max_lng,max_lat)
+        - q: str (opcional, búsqueda de texto completo ordenada por relevancia)
         """
 
-        route_id = request.query_params.get("id")
-        page = request.query_params.get("page", 1)
-        page_size = request.query_params.get("page_size", 10)
-        try:
-            page = int(page)
-            page_size = int(page_size)
-            if page <= 0 or page_size <= 0:
-                raise ValueError
-        except ValueError:
-            raise ValidationError(
-                {"detail": "page y page_size deben ser enteros positivos"}
-            )
+        params = GetRoutesInputSerializer(data=request.query_params.dict())
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
 
         use_case = container.routes().get_routes()
+        route_id = filters.get("id")
         if route_id:
-            route = use_case.execute(id=route_id)
+            route = use_case.execute(id=str(route_id))
             serializer = RouteOutputSerializer(route)
             return Response(serializer.data, status=status.HTTP_200_OK)
-        result = use_case.execute()
-        routes = result["results"]
-        total = result["count"]
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated_routes = routes[start:end]
-        serializer = RouteOutputSerializer(paginated_routes, many=True)
+
+        # 🔹 La paginación y los filtros se resuelven en la base de datos
+        result = use_case.execute(
+            page=filters["page"],
+            page_size=filters["page_size"],
+            difficulty=filters.get("difficulty"),
+            category=filters.get("category"),
+            requires_payment=filters.get("requires_payment"),
+            is_active=filters.get("is_active"),
+            cursor=filters.get("cursor"),
+            q=(filters.get("q") or "").strip() or None,
+            lat=filters.get("lat"),
+            lng=filters.get("lng"),
+            radius_km=filters.get("radius"),
+            bbox=filters.get("bbox"),
+            available_on=filters.get("available_on"),
+            people=filters["people"],
+        )
+        serializer = RouteOutputSerializer(result["results"], many=True)
+
+        # 🔹 Modo cursor (opt-in): sin count ni número de página
+        if "next_cursor" in result:
+            return Response(
+                {
+                    "page_size": result["page_size"],
+                    "next_cursor": result["next_cursor"],
+                    "results": serializer.data,
+                },
+                status=status.HTTP_200_OK,
+            )
 
         return Response(
             {
-                "count": total,
-                "page": page,
-                "page_size": page_size,
+                "count": result["count"],
+                "page": result["page"],
+                "page_size": result["page_size"],
                 "results": serializer.data,
             },
             status=status.HTTP_200_OK,
@@ -126,20 +168,62 @@ class MyRoutesAPIView(APIView):  # 👈 view separado, más limpio
         )
 
 
+class RutaMapAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @get_route_markers_docs
+    def get(self, request, *args, **kwargs):
+        params = MapViewportInputSerializer(data=request.query_params.dict())
+        params.is_valid(raise_exception=True)
+
+        use_case = container.routes().get_route_markers()
+        result = use_case.execute(
+            bbox=params.validated_data["bbox"],
+            zoom=params.validated_data["zoom"],
+        )
+
+        response = Response(result, status=status.HTTP_200_OK)
+        response["Cache-Control"] = "private, max-age=60"
+        return response
+
+
+class RutaAvailabilityAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @get_route_availability_docs
+    def get(self, request, ruta_id):
+        params = AvailabilityCalendarInputSerializer(data=request.query_params.dict())
+        params.is_valid(raise_exception=True)
+
+        use_case = container.routes().get_route_availability()
+        result = use_case.execute(
+            ruta_id=ruta_id,
+            start=params.validated_data["start"],
+            end=params.validated_data["end"],
+        )
+
+        response = Response(result, status=status.HTTP_200_OK)
+        response["Cache-Control"] = "private, max-age=30"
+        return response
+
+
 class RutaBannerAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
     @get_routes_banner_docs
     def get(self, request):
-        rutas = RutaSenderismo.objects.annotate(
-            rating_avg=Avg("ratings__score"),
-            rating_count=Count("ratings"),
-        ).order_by("-created_at")[:5]
-
-        serializer = RutaBannerSerializer(rutas, many=True)
+        # 🔹 Cache-aside: el banner se consulta en casi cada apertura de la app
+        data = get_or_set(
+            make_key(ROUTES_CACHE_NAMESPACE, "banner"),
+            lambda: RutaBannerSerializer(
+                RutaSenderismo.objects.order_by("-created_at")[:5], many=True
+            ).data,
+            namespace=ROUTES_CACHE_NAMESPACE,
+            timeout=120,
+        )
 
         return Response(
-            serializer.data,
+            data,
             status=status.HTTP_200_OK,
         )
 
@@ -152,18 +236,12 @@ class RutaRatingAPIView(APIView):
         ruta_id = request.query_params.get("ruta_id")
         ruta = get_object_or_404(RutaSenderismo, id=ruta_id)
         user_rating = RutaRating.objects.filter(ruta=ruta, user=request.user).first()
-        stats = RutaRating.objects.filter(ruta=ruta).aggregate(
-            rating_avg=Avg("score"),
-            rating_count=Count("id"),
-        )
 
         return Response(
             {
                 "score": user_rating.score if user_rating else None,
-                "rating_avg": (
-                    round(stats["rating_avg"], 1) if stats["rating_avg"] else None
-                ),
-                "rating_count": stats["rating_count"],
+                "rating_avg": round(ruta.rating_avg, 1) if ruta.rating_avg else None,
+                "rating_count": ruta.rating_count,
             },
             status=status.HTTP_200_OK,
         )
@@ -176,12 +254,31 @@ class RutaRatingAPIView(APIView):
         ruta_id = serializer.validated_data["ruta_id"]
         score = serializer.validated_data["score"]
         ruta = get_object_or_404(RutaSenderismo, id=ruta_id)
-        rating = RutaRating.objects.filter(ruta=ruta, user=request.user).first()
 
-        if rating:
-            rating.score = score
-            rating.save(update_fields=["score"])
+        # 🔹 La calificación y los agregados de la ruta se guardan juntos
+        with transaction.atomic():
+            rating = (
+                RutaRating.objects.select_for_update()
+                .filter(ruta=ruta, user=request.user)
+                .first()
+            )
+
+            created = rating is None
+
+            if not created:
+                previous_score = rating.score
+                rating.score = score
+                rating.save(update_fields=["score"])
+                ruta.apply_rating_change(score_delta=score - previous_score)
+            else:
+                rating = RutaRating.objects.create(
+                    ruta=ruta,
+                    user=request.user,
+                    score=score,
+                )
+                ruta.apply_rating_change(score_delta=score, count_delta=1)
 
+        if not created:
             return Response(
                 {
                     "detail": "Calificación actualizada",
@@ -191,12 +288,6 @@ class RutaRatingAPIView(APIView):
                 },
                 status=status.HTTP_200_OK,
             )
-        rating = RutaRating.objects.create(
-            ruta=ruta,
-            user=request.user,
-            score=score,
-        )
-
         return Response(
             {
                 "detail": "Ruta calificada correctamente",
@@ -0,0 +1,82 @@
+# inira/app/routes/management/bench_data.py
+
+import random
+import uuid
+from typing import List
+
+from django.contrib.gis.geos import Point
+
+from inira.app.routes.infrastructure.models import RutaSenderismo
+
+# Vocabulario para títulos y descripciones: búsquedas con distinta selectividad
+PLACES = [
+    "Salento",
+    "Guatapé",
+    "Villa de Leyva",
+    "Chingaza",
+    "Sumapaz",
+    "Jardín",
+    "Minca",
+    "Barichara",
+    "Cocora",
+    "Iguaque",
+    "Sierra Nevada",
+    "Tatacoa",
+]
+FEATURES = [
+    "cascada",
+    "laguna",
+    "páramo",
+    "cañón",
+    "mirador",
+    "bosque de niebla",
+    "río",
+    "nevado",
+    "cueva",
+    "termales",
+    "cafetal",
+    "frailejones",
+]
+ADJECTIVES = ["escondida", "alta", "antigua", "del cóndor", "de los colibríes"]
+
+
+def seed_routes(count: int, *, seed: int = 42) -> List[str]:
+    """
+    Crea `count` rutas activas repartidas por Colombia y retorna sus IDs.
+
+    bulk_create no emite señales (ni invalidación de cache); el trigger de
+    search_vector sí se ejecuta en la base de datos.
+    """
+    rng = random.Random(seed)
+    tag = uuid.uuid4().hex[:8]
+
+    def route(n: int) -> RutaSenderismo:
+        place, feature = rng.choice(PLACES), rng.choice(FEATURES)
+        return RutaSenderismo(
+            title=f"{feature.capitalize()} {rng.choice(ADJECTIVES)} de {place}",
+            location=place,
+            distance=f"{rng.randint(2, 25)} km",
+            duration=f"{rng.randint(1, 9)} horas",
+            difficulty=rng.choice(RutaSenderismo.Dificultad.values),
+            image="https://example.com/ruta.jpg",
+            type=rng.choice(RutaSenderismo.Tipo.values),
+            category=rng.choice(RutaSenderismo.Categoria.values),
+            description=(
+                f"Recorrido {tag}-{n} hacia {rng.choice(FEATURES)} y "
+                f"{rng.choice(FEATURES)} cerca de {rng.choice(PLACES)}."
+            ),
+            coordinates=Point(
+                rng.uniform(-77.5, -72.0), rng.uniform(1.0, 11.0), srid=4326
+            ),
+            phone="3000000000",
+            email="bench@example.com",
+            whatsapp="3000000000",
+            max_capacity=rng.randint(5, 40),
+            rating_sum=rng.randint(0, 500),
+            rating_count=rng.randint(0, 100),
+        )
+
+    rutas = RutaSenderismo.objects.bulk_create(
+        (route(n) for n in range(count)), batch_size=1000
+    )
+    return [str(ruta.id) for ruta in rutas]
@@ -0,0 +1,112 @@
+# inira/app/routes/management/commands/benchmark_route_availability.py
+
+import itertools
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from inira.app.routes.infrastructure.repositories import RoutesRepositoryImpl
+from inira.app.routes.management.bench_data import seed_routes
+from inira.app.shared.benchmark import (
+    analyze,
+    captured_sql,
+    explain,
+    measure,
+    rolled_back,
+    summary,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Carga de disponibilidad (rutas × días) y búsqueda de rutas con cupos "
+        "(available_on) y calendario sobre datos sintéticos; todo se revierte "
+        "al terminar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--routes", type=int, default=10000)
+        parser.add_argument("--days", type=int, default=90)
+        parser.add_argument(
+            "--full-ratio",
+            type=float,
+            default=0.3,
+            help="Fracción de fechas sin cupos (filtro selectivo)",
+        )
+        parser.add_argument("--people", type=int, default=4)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--explain", action="store_true")
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            ruta_ids = seed_routes(options["routes"])
+            repository = RoutesRepositoryImpl()
+            start = timezone.localdate()
+            days = options["days"]
+
+            started = time.perf_counter()
+            created = repository.generate_availability(start=start, days=days)
+            self.stdout.write(
+                f"[AVAILABILITY_BENCH] carga: {created} fechas "
+                f"({len(ruta_ids)} rutas × {days} días) en "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "UPDATE ruta_availabilities SET available_slots = 0 "
+                    "WHERE random() < %s",
+                    [options["full_ratio"]],
+                )
+            analyze("rutas_senderismo", "ruta_availabilities")
+
+            self._run(repository, ruta_ids, start, options)
+
+    def _run(self, repository, ruta_ids, start, options):
+        days = options["days"]
+        page_size = options["page_size"]
+        rng = random.Random(7)
+        # Cada iteración consulta una fecha distinta del rango
+        dates = itertools.cycle(
+            start + timedelta(days=rng.randrange(days)) for _ in range(days)
+        )
+
+        def search():
+            return repository.paginate(
+                page=1,
+                page_size=page_size,
+                available_on=next(dates),
+                people=options["people"],
+            )
+
+        def search_cursor():
+            return repository.paginate_by_cursor(
+                cursor="",
+                page_size=page_size,
+                available_on=next(dates),
+                people=options["people"],
+            )
+
+        def calendar():
+            return repository.availability_calendar(
+                rng.choice(ruta_ids), start=start, end=start + timedelta(days=days - 1)
+            )
+
+        for label, fn in (
+            ("available_on offset página 1", search),
+            ("available_on cursor página 1", search_cursor),
+            (f"calendario {days} días", calendar),
+        ):
+            timings, queries = measure(fn, iterations=options["iterations"])
+            self.stdout.write(
+                f"[AVAILABILITY_BENCH] {label}: {summary(timings, queries)}"
+            )
+
+        if options["explain"]:
+            for sql in captured_sql(search):
+                self.stdout.write(explain(sql))
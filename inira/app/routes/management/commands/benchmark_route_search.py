@@ -0,0 +1,69 @@
+# inira/app/routes/management/commands/benchmark_route_search.py
+
+import statistics
+
+from django.core.management.base import BaseCommand
+
+from inira.app.routes.infrastructure.repositories import RoutesRepositoryImpl
+from inira.app.routes.management.bench_data import seed_routes
+from inira.app.shared.benchmark import (
+    analyze,
+    captured_sql,
+    explain,
+    measure,
+    rolled_back,
+    summary,
+)
+
+SEARCH_INDEX = "rutas_search_vector_gin"
+
+# Objetivo de la búsqueda con 100k rutas
+TARGET_MS = 50
+
+DEFAULT_QUERIES = ["cascada", "laguna páramo", "bosque de niebla salento", "cafetal"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide la búsqueda de texto completo de rutas (q) sobre datos sintéticos "
+        "y muestra el EXPLAIN de sus consultas para comprobar que usan el "
+        "índice GIN; todo se revierte al terminar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--routes", type=int, default=100000)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("queries", nargs="*", default=DEFAULT_QUERIES)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            seed_routes(options["routes"])
+            analyze("rutas_senderismo")
+
+            repository = RoutesRepositoryImpl()
+            for q in options["queries"]:
+                self._report(repository, q, options)
+
+    def _report(self, repository, q, options):
+        def search():
+            return repository.paginate(q=q, page=1, page_size=options["page_size"])
+
+        timings, queries = measure(search, iterations=options["iterations"])
+        p50 = statistics.median(timings)
+        total, _ = search()
+
+        self.stdout.write(
+            f"[SEARCH_BENCH] q={q!r} ({total} resultados): {summary(timings, queries)} "
+            f"objetivo {TARGET_MS}ms: {'OK' if p50 <= TARGET_MS else 'EXCEDIDO'}"
+        )
+
+        # 🔹 El plan de las mismas consultas del endpoint (conteo y página)
+        for sql in captured_sql(search):
+            plan = explain(sql)
+            uses_index = SEARCH_INDEX in plan
+            self.stdout.write(
+                f"[SEARCH_BENCH] índice {SEARCH_INDEX}: "
+                f"{'usado' if uses_index else 'NO usado'}"
+            )
+            self.stdout.write(plan)
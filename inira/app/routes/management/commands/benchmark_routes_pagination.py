@@ -0,0 +1,75 @@
+# inira/app/routes/management/commands/benchmark_routes_pagination.py
+
+from django.core.management.base import BaseCommand
+
+from inira.app.routes.infrastructure.repositories import RoutesRepositoryImpl
+from inira.app.routes.management.bench_data import seed_routes
+from inira.app.shared.benchmark import analyze, measure, rolled_back, summary
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el listado de rutas cargando todo en memoria (antes) con la "
+        "paginación en base de datos (offset y cursor) sobre datos sintéticos; "
+        "todo se revierte al terminar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--routes", type=int, default=10000)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument(
+            "--deep-page", type=int, default=200, help="Página profunda a medir"
+        )
+        parser.add_argument("--iterations", type=int, default=10)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            seed_routes(options["routes"])
+            analyze("rutas_senderismo")
+            self._run(RoutesRepositoryImpl(), options)
+
+    def _run(self, repository, options):
+        page_size = options["page_size"]
+        deep_page = options["deep_page"]
+        total, _ = repository.paginate(page=1, page_size=1)
+
+        def in_memory(page):
+            # Comportamiento anterior: todas las rutas mapeadas y cortadas en Python
+            _, routes = repository.paginate(page=1, page_size=total)
+            return routes[(page - 1) * page_size : page * page_size]
+
+        def walk_cursor(pages):
+            cursor = ""
+            for _ in range(pages):
+                _, cursor = repository.paginate_by_cursor(
+                    cursor=cursor, page_size=page_size
+                )
+                if cursor is None:
+                    break
+
+        cases = [
+            ("memoria (antes) página 1", lambda: in_memory(1), 1),
+            (
+                "offset página 1",
+                lambda: repository.paginate(page=1, page_size=page_size),
+                None,
+            ),
+            (
+                f"offset página {deep_page}",
+                lambda: repository.paginate(page=deep_page, page_size=page_size),
+                None,
+            ),
+            ("cursor página 1", lambda: walk_cursor(1), None),
+            (
+                f"cursor {deep_page} páginas seguidas",
+                lambda: walk_cursor(deep_page),
+                1,
+            ),
+        ]
+
+        self.stdout.write(f"[ROUTES_BENCH] {total} rutas, page_size={page_size}")
+        for label, fn, iterations in cases:
+            timings, queries = measure(
+                fn, iterations=iterations or options["iterations"]
+            )
+            self.stdout.write(f"[ROUTES_BENCH] {label}: {summary(timings, queries)}")
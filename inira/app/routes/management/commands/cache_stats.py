@@ -0,0 +1,24 @@
+# inira/app/routes/management/commands/cache_stats.py
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from inira.app.routes.infrastructure.models import ROUTES_CACHE_NAMESPACE
+from inira.app.shared.cache import cache_stats
+
+
+class Command(BaseCommand):
+    help = "Muestra los contadores de aciertos/fallos del cache por namespace."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "namespaces",
+            nargs="*",
+            default=[ROUTES_CACHE_NAMESPACE],
+            help="Namespaces a consultar (por defecto: routes)",
+        )
+
+    def handle(self, *args, **options):
+        for namespace in options["namespaces"]:
+            self.stdout.write(json.dumps(cache_stats(namespace)))
@@ -0,0 +1,32 @@
+# inira/app/routes/management/commands/generate_route_availability.py
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from inira.app.routes.infrastructure.repositories import RoutesRepositoryImpl
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-crea la disponibilidad de las rutas activas para las próximas "
+        "semanas usando su capacidad máxima. Las fechas existentes no se modifican."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--weeks", type=int, default=8)
+        parser.add_argument(
+            "--ruta",
+            dest="ruta_id",
+            help="Generar solo para la ruta con este ID",
+        )
+
+    def handle(self, *args, **options):
+        created = RoutesRepositoryImpl().generate_availability(
+            start=timezone.localdate(),
+            days=options["weeks"] * 7,
+            ruta_id=options["ruta_id"],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Fechas de disponibilidad creadas: {created}")
+        )
@@ -0,0 +1,58 @@
+# inira/app/routes/management/commands/rebuild_route_ratings.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from inira.app.routes.infrastructure.models import (
+    RutaRating,
+    RutaSenderismo,
+    invalidate_routes_cache,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula desde cero rating_sum y rating_count de las rutas "
+        "a partir de la tabla de calificaciones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ruta",
+            dest="ruta_id",
+            help="Recalcular solo la ruta con este ID",
+        )
+
+    def handle(self, *args, **options):
+        stats = (
+            RutaRating.objects.filter(ruta=OuterRef("pk"))
+            .values("ruta")
+            .annotate(total=Sum("score"), count=Count("id"))
+        )
+
+        queryset = RutaSenderismo.objects.all()
+        if options["ruta_id"]:
+            queryset = queryset.filter(pk=options["ruta_id"])
+
+        # 🔹 Un único UPDATE con subconsultas correlacionadas
+        with transaction.atomic():
+            updated = queryset.update(
+                rating_sum=Coalesce(
+                    Subquery(stats.values("total")[:1], output_field=IntegerField()),
+                    0,
+                ),
+                rating_count=Coalesce(
+                    Subquery(stats.values("count")[:1], output_field=IntegerField()),
+                    0,
+                ),
+            )
+            # update() no emite señales: invalidar el cache de rutas al confirmar
+            invalidate_routes_cache()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Agregados de calificación recalculados: {updated} rutas"
+            )
+        )
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.7 on 2026-10-18 15:10
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    RutaSenderismo = apps.get_model("routes", "RutaSenderismo")
+    RutaRating = apps.get_model("routes", "RutaRating")
+
+    stats = (
+        RutaRating.objects.filter(ruta=OuterRef("pk"))
+        .values("ruta")
+        .annotate(total=Sum("score"), count=Count("id"))
+    )
+
+    RutaSenderismo.objects.update(
+        rating_sum=Coalesce(
+            Subquery(stats.values("total")[:1], output_field=IntegerField()), 0
+        ),
+        rating_count=Coalesce(
+            Subquery(stats.values("count")[:1], output_field=IntegerField()), 0
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("routes", "0004_rutasenderismo_created_by"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rutasenderismo",
+            name="rating_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Número total de calificaciones de la ruta"
+            ),
+        ),
+        migrations.AddField(
+            model_name="rutasenderismo",
+            name="rating_sum",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Suma de todas las calificaciones de la ruta"
+            ),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
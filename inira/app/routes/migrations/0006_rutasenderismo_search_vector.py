@@ -0,0 +1,76 @@
+# Generated by Django 5.2.7 on 2026-10-18 16:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import UnaccentExtension
+from django.db import migrations
+
+
+CREATE_SEARCH_CONFIG = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'spanish_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION spanish_unaccent (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION spanish_unaccent
+            ALTER MAPPING FOR hword, hword_part, word
+            WITH unaccent, spanish_stem;
+    END IF;
+END
+$$;
+"""
+
+DROP_SEARCH_CONFIG = "DROP TEXT SEARCH CONFIGURATION IF EXISTS spanish_unaccent;"
+
+# 🔹 Pesos: título (A) > ubicación (B) > empresa (C) > descripción (D)
+SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('spanish_unaccent', coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('spanish_unaccent', coalesce({row}location, '')), 'B') ||
+    setweight(to_tsvector('spanish_unaccent', coalesce({row}company, '')), 'C') ||
+    setweight(to_tsvector('spanish_unaccent', coalesce({row}description, '')), 'D')
+"""
+
+CREATE_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION rutas_senderismo_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_EXPRESSION.format(row="NEW.")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER rutas_senderismo_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, location, company, description
+    ON rutas_senderismo
+    FOR EACH ROW EXECUTE FUNCTION rutas_senderismo_search_vector_update();
+
+UPDATE rutas_senderismo SET search_vector = {SEARCH_VECTOR_EXPRESSION.format(row="")};
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS rutas_senderismo_search_vector_trigger ON rutas_senderismo;
+DROP FUNCTION IF EXISTS rutas_senderismo_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("routes", "0005_rutasenderismo_rating_sum_rating_count"),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        migrations.RunSQL(CREATE_SEARCH_CONFIG, DROP_SEARCH_CONFIG),
+        migrations.AddField(
+            model_name="rutasenderismo",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rutasenderismo",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="rutas_search_vector_gin"
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
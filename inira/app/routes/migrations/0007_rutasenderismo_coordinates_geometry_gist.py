@@ -0,0 +1,20 @@
+from django.db import migrations
+
+# 🔹 Los filtros por bbox comparan `coordinates::geometry && ST_MakeEnvelope(...)`
+# (rectángulo plano); el índice geography no sirve para esa expresión
+CREATE_INDEX = """
+CREATE INDEX IF NOT EXISTS rutas_coordinates_geometry_gist
+    ON rutas_senderismo USING GIST ((coordinates::geometry));
+"""
+
+DROP_INDEX = "DROP INDEX IF EXISTS rutas_coordinates_geometry_gist;"
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("routes", "0006_rutasenderismo_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_INDEX, DROP_INDEX),
+    ]
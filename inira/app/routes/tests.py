@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from inira.app.shared.map_tiles import grid_shape, load_tiles, tile_bbox, tiles_for_bbox
+
+WORLD = (-180.0, -90.0, 180.0, 90.0)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class MapTilesWorldTest(SimpleTestCase):
+    """Con zoom bajo un tile cubre medio mundo o más: nada puede salir de ±180/±90."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_whole_world_tiles_stay_inside_grid(self):
+        for zoom in range(3):
+            with self.subTest(zoom=zoom):
+                columns, rows = grid_shape(zoom)
+                tiles = tiles_for_bbox(WORLD, zoom)
+
+                self.assertCountEqual(
+                    tiles, [(x, y) for x in range(columns) for y in range(rows)]
+                )
+                for x, y in tiles:
+                    min_lng, min_lat, max_lng, max_lat = tile_bbox(zoom, x, y)
+                    self.assertGreaterEqual(min_lng, -180.0)
+                    self.assertGreaterEqual(min_lat, -90.0)
+                    self.assertLessEqual(max_lng, 180.0)
+                    self.assertLessEqual(max_lat, 90.0)
+
+    def test_world_edges_belong_to_the_last_tile(self):
+        self.assertEqual(tiles_for_bbox((170.0, 80.0, 180.0, 90.0), 0), [(0, 0)])
+        self.assertEqual(tiles_for_bbox((170.0, 80.0, 180.0, 90.0), 2), [(3, 1)])
+
+    def test_out_of_range_bbox_is_clamped(self):
+        self.assertEqual(
+            tiles_for_bbox((-400.0, -100.0, 400.0, 100.0), 1), [(0, 0), (1, 0)]
+        )
+
+    def test_whole_world_loads_with_one_world_sized_span(self):
+        for zoom in range(3):
+            with self.subTest(zoom=zoom):
+                spans = []
+
+                def loader(span, size, cell_size):
+                    spans.append(span)
+                    return [{"tile": (0, 0), "type": "cluster", "count": 1}]
+
+                result = load_tiles(
+                    prefix=f"test-{zoom}", bbox=WORLD, zoom=zoom, loader=loader
+                )
+
+                self.assertEqual(spans, [WORLD])
+                self.assertEqual(len(result["items"]), 1)
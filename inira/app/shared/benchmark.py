@@ -0,0 +1,66 @@
+# inira/app/shared/benchmark.py
+
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Tuple
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back():
+    """Transacción que siempre se revierte: los datos sintéticos no quedan."""
+    try:
+        with transaction.atomic():
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+def analyze(*tables: str) -> None:
+    """Actualiza las estadísticas del planner después de sembrar datos."""
+    with connection.cursor() as cursor:
+        for table in tables:
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+
+def measure(fn: Callable[[], object], *, iterations: int) -> Tuple[List[float], float]:
+    """Ejecuta `fn` `iterations` veces; retorna (tiempos en ms, consultas/iteración)."""
+    timings, queries = [], 0
+
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - started) * 1000)
+        queries += len(captured)
+
+    return timings, queries / iterations
+
+
+def summary(timings: List[float], queries: float) -> str:
+    return (
+        f"p50={statistics.median(timings):.2f}ms max={max(timings):.2f}ms "
+        f"consultas/iteración={queries:.1f}"
+    )
+
+
+def captured_sql(fn: Callable[[], object]) -> List[str]:
+    """SQL (con parámetros) de las consultas que ejecuta `fn`."""
+    with CaptureQueriesContext(connection) as captured:
+        fn()
+    return [query["sql"] for query in captured.captured_queries]
+
+
+def explain(sql: str) -> str:
+    """Plan real (EXPLAIN ANALYZE, BUFFERS) de una consulta capturada."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+        return "\n".join(row[0] for row in cursor.fetchall())
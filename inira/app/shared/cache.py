@@ -0,0 +1,258 @@
+# inira/app/shared/cache.py
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple
+
+from django.core.cache import cache
+
+from inira.app.shared import metrics
+
+logger = logging.getLogger(__name__)
+
+# 🔹 Protección contra estampida: un solo proceso recalcula una clave fría
+LOCK_TIMEOUT = 10  # segundos que dura el lock si el proceso muere
+LOCK_WAIT = 2.0  # segundos que esperan los demás antes de recalcular
+LOCK_POLL = 0.05
+
+_MISS = object()
+
+
+class CacheKey(NamedTuple):
+    """Clave de `get_or_set` junto con el namespace que la versiona."""
+
+    namespace: str
+    key: str
+
+
+def _version_key(namespace: str) -> str:
+    return f"cachever:{namespace}"
+
+
+def namespace_version(namespace: str) -> int:
+    """Versión actual del namespace; cambiarla invalida todas sus claves."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key) or 1
+    return version
+
+
+def bump_namespace(namespace: str) -> None:
+    """Invalida todas las claves del namespace incrementando su versión."""
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # La versión no existía (o expiró): cualquier valor nuevo sirve
+        cache.set(key, int(time.time()), timeout=None)
+    except Exception as e:
+        logger.warning(f"[CACHE] No se pudo invalidar {namespace}: {e}")
+
+
+def make_key(namespace: str, name: str, **params) -> CacheKey:
+    """
+    Clave {namespace}:{name}:{hash de los parámetros}.
+
+    La versión del namespace no va en la clave sino junto al valor: así
+    `get_or_set` lee versión y valor en una sola ida a Redis.
+    """
+    raw = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.md5(raw.encode("utf-8")).hexdigest()[:16]
+    return CacheKey(namespace, f"{namespace}:{name}:{digest}")
+
+
+def cache_stats(namespace: str) -> Dict[str, Any]:
+    """Contadores de aciertos/fallos acumulados del namespace."""
+    values = metrics.counters("cache", namespace)
+    hits = values.get("hit", 0)
+    misses = values.get("miss", 0)
+    total = hits + misses
+
+    return {
+        "namespace": namespace,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else None,
+    }
+
+
+def get_or_set(
+    key: CacheKey,
+    loader: Callable[[], Any],
+    *,
+    namespace: str,
+    timeout: int,
+) -> Any:
+    """
+    Cache-aside con protección contra estampida.
+
+    Versión del namespace y valor (guardado como (versión, valor)) se leen
+    con un solo get_many; un valor de otra versión cuenta como fallo. Los
+    aciertos y fallos se suman en los contadores de `metrics` (en memoria,
+    sin round trip).
+
+    Ante un fallo solo el proceso que obtiene el lock ejecuta `loader`;
+    el resto espera hasta LOCK_WAIT segundos a que el valor aparezca.
+    Si Redis no está disponible se consulta directamente la fuente.
+    """
+    version_key = _version_key(key.namespace)
+    try:
+        found = cache.get_many([version_key, key.key])
+        version = found.get(version_key) or namespace_version(key.namespace)
+    except Exception as e:
+        logger.warning(f"[CACHE] Lectura fallida ({key.key}): {e}")
+        return loader()
+
+    def current(entry):
+        stored_version, value = entry
+        return value if stored_version == version else _MISS
+
+    entry = found.get(key.key)
+    if entry is not None and current(entry) is not _MISS:
+        metrics.incr_counter("cache", namespace, "hit")
+        return entry[1]
+
+    metrics.incr_counter("cache", namespace, "miss")
+
+    return _load_single_flight(
+        key.key,
+        loader,
+        lambda value: cache.set(key.key, (version, value), timeout=timeout),
+        read=current,
+    )
+
+
+def _load_single_flight(
+    key: str,
+    loader: Callable[[], Any],
+    store: Callable,
+    read: Callable[[Any], Any] = lambda value: value,
+):
+    lock_key = f"lock:{key}"
+    error_key = f"lockerr:{key}"
+
+    try:
+        acquired = cache.add(lock_key, 1, timeout=LOCK_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"[CACHE] Lock no disponible ({key}): {e}")
+        return loader()
+
+    if acquired:
+        return _load_and_store(key, loader, store, lock_key, error_key)
+
+    # 🔹 Otro proceso está recalculando: esperar su resultado (o su error)
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL)
+        try:
+            found = cache.get_many([key, error_key, lock_key])
+        except Exception as e:
+            logger.warning(f"[CACHE] Espera fallida ({key}): {e}")
+            return loader()
+
+        # Un valor viejo (otra versión) no sirve: se sigue esperando
+        value = read(found[key]) if key in found else _MISS
+        if value is not _MISS:
+            return value
+        if error_key in found:
+            raise found[error_key]
+        if lock_key not in found:
+            # El dueño del lock terminó sin guardar el valor
+            return loader()
+
+    logger.warning(f"[CACHE] Timeout esperando el lock de {key}")
+    return loader()
+
+
+def _load_and_store(key, loader, store, lock_key, error_key):
+    try:
+        value = loader()
+    except Exception as error:
+        # Los que esperan reciben el mismo error en vez de agotar LOCK_WAIT
+        _safe(lambda: cache.set(error_key, error, timeout=LOCK_WAIT))
+        _safe(lambda: cache.delete(lock_key))
+        raise
+
+    # Guardar antes de soltar el lock: los que esperan leen el valor
+    _safe(lambda: store(value))
+    _safe(lambda: cache.delete(lock_key))
+    return value
+
+
+def _safe(operation: Callable[[], Any]) -> None:
+    try:
+        operation()
+    except Exception as e:
+        logger.warning(f"[CACHE] Operación fallida: {e}")
+
+
+def get_with_refresh_ahead(
+    key: str,
+    loader: Callable[[], Any],
+    *,
+    timeout: int,
+    refresh_ahead: int,
+) -> Any:
+    """
+    Cache con refresco anticipado para valores costosos de obtener (tokens).
+
+    El valor vive `timeout` segundos. Durante los últimos `refresh_ahead`
+    segundos se sigue retornando el valor cacheado y un solo proceso lo
+    renueva en un hilo en segundo plano, de modo que ninguna petición
+    espera la llamada al proveedor salvo con el cache vacío.
+    """
+
+    def store(value):
+        cache.set(
+            key,
+            {"value": value, "refresh_at": time.time() + timeout - refresh_ahead},
+            timeout=timeout,
+        )
+
+    try:
+        entry = cache.get(key)
+    except Exception as e:
+        logger.warning(f"[CACHE] Lectura fallida ({key}): {e}")
+        return loader()
+
+    if entry is None:
+        # Cache vacío: un solo proceso consulta al proveedor (los demás esperan)
+        entry = _load_single_flight(
+            key,
+            lambda: {"value": loader()},
+            lambda new_entry: store(new_entry["value"]),
+        )
+        return entry["value"]
+
+    if time.time() >= entry["refresh_at"] and _try_lock(f"lock:{key}"):
+        threading.Thread(
+            target=_refresh_in_background,
+            args=(key, loader, store),
+            daemon=True,
+        ).start()
+
+    return entry["value"]
+
+
+def _try_lock(lock_key: str) -> bool:
+    try:
+        return cache.add(lock_key, 1, timeout=LOCK_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"[CACHE] Lock no disponible ({lock_key}): {e}")
+        return False
+
+
+def _refresh_in_background(key: str, loader: Callable[[], Any], store: Callable):
+    try:
+        store(loader())
+        logger.info(f"[CACHE] {key} renovado en segundo plano")
+    except Exception as e:
+        # El valor actual sigue vigente hasta su expiración
+        logger.warning(f"[CACHE] Falló el refresco de {key}: {e}")
+    finally:
+        cache.delete(f"lock:{key}")
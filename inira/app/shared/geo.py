@@ -0,0 +1,255 @@
+# inira/app/shared/geo.py
+
+from django.contrib.gis.db.models import GeometryField, PointField
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.db.models import (
+    Avg,
+    BooleanField,
+    CharField,
+    Count,
+    F,
+    FloatField,
+    Func,
+    Min,
+    Value,
+)
+from django.db.models.functions import Cast, Floor, Least
+from rest_framework import serializers
+
+
+def parse_bbox(value: str) -> tuple:
+    """Convierte 'min_lng,min_lat,max_lng,max_lat' en una tupla de floats."""
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(v) for v in value.split(","))
+    except ValueError:
+        raise serializers.ValidationError(
+            "bbox debe tener el formato min_lng,min_lat,max_lng,max_lat"
+        )
+
+    # 🔹 Recortado al mundo: un viewport alejado puede pasar de ±180/±90
+    min_lng, max_lng = max(min_lng, -180.0), min(max_lng, 180.0)
+    min_lat, max_lat = max(min_lat, -90.0), min(max_lat, 90.0)
+
+    if min_lng >= max_lng or min_lat >= max_lat:
+        raise serializers.ValidationError("bbox inválido: mínimos deben ser menores")
+
+    return (min_lng, min_lat, max_lng, max_lat)
+
+
+def geography_point(lat: float, lng: float) -> Value:
+    """Punto WGS84 como valor SQL de tipo geography."""
+    return Value(
+        Point(lng, lat, srid=4326),
+        output_field=PointField(geography=True, srid=4326),
+    )
+
+
+class KNNDistance(Func):
+    """
+    Distancia en metros usando el operador KNN de PostGIS (`<->`).
+
+    Al ordenar por esta expresión PostgreSQL recorre el índice espacial
+    (GiST) en orden de cercanía, en vez de calcular la distancia para
+    todas las filas y ordenar.
+    """
+
+    arg_joiner = " <-> "
+    template = "%(expressions)s"
+    output_field = FloatField()
+
+    def __init__(self, field: str, *, lat: float, lng: float):
+        super().__init__(F(field), geography_point(lat, lng))
+
+
+class AsGeometry(Func):
+    """Cast a geometry: coincide con los índices GiST `(coordenada::geometry)`."""
+
+    template = "%(expressions)s::geometry"
+    output_field = GeometryField(srid=4326)
+
+
+class MakeEnvelope(Func):
+    """Rectángulo plano lon/lat (ST_MakeEnvelope) a partir de un bbox."""
+
+    function = "ST_MakeEnvelope"
+    output_field = GeometryField(srid=4326)
+
+    def __init__(self, bbox: tuple):
+        super().__init__(*(Value(float(v)) for v in bbox), Value(4326))
+
+
+class InBbox(Func):
+    """
+    `geometry && envelope`: el bbox como rectángulo plano en grados.
+
+    Un polígono geography tiene aristas geodésicas (se curvan hacia los
+    polos), así que no coincide con la grilla de tiles ni con el viewport.
+    """
+
+    arg_joiner = " && "
+    template = "%(expressions)s"
+    output_field = BooleanField()
+
+    def __init__(self, field: str, bbox: tuple):
+        super().__init__(AsGeometry(F(field)), MakeEnvelope(bbox))
+
+
+class PointX(Func):
+    """Longitud de un punto (geography) sin cargar el objeto GEOS."""
+
+    template = "ST_X(%(expressions)s::geometry)"
+    output_field = FloatField()
+
+
+class PointY(Func):
+    """Latitud de un punto (geography) sin cargar el objeto GEOS."""
+
+    template = "ST_Y(%(expressions)s::geometry)"
+    output_field = FloatField()
+
+
+def apply_geo_filters(
+    queryset,
+    *,
+    field: str,
+    lat: float = None,
+    lng: float = None,
+    radius_km: float = None,
+    bbox: tuple = None,
+):
+    """
+    Aplica filtros espaciales indexados y anota `distance_m`.
+
+    - lat/lng: anota la distancia KNN al punto.
+    - radius_km: ST_DWithin sobre el índice espacial (requiere lat/lng).
+    - bbox: (min_lng, min_lat, max_lng, max_lat), `&&` indexado sobre geometry.
+    """
+    if bbox:
+        queryset = queryset.filter(InBbox(field, bbox))
+
+    if lat is not None and lng is not None:
+        if radius_km:
+            queryset = queryset.filter(
+                **{f"{field}__dwithin": (Point(lng, lat, srid=4326), D(km=radius_km))}
+            )
+        queryset = queryset.annotate(distance_m=KNNDistance(field, lat=lat, lng=lng))
+
+    return queryset
+
+
+def _tile_queryset(queryset, *, field: str, bbox: tuple, tile_size: float):
+    # 🔹 bbox indexado + límite superior abierto: un punto en el borde
+    # pertenece a un solo tile; (tx, ty) es el tile de la grilla global.
+    # En el borde del mundo (lng 180 / lat 90) el límite es cerrado y el
+    # punto queda en el último tile.
+    min_lng, min_lat, max_lng, max_lat = bbox
+    last_x = round(360.0 / tile_size) - 1
+    last_y = max(round(180.0 / tile_size), 1) - 1
+
+    upper = {
+        "x__lte" if max_lng >= 180.0 else "x__lt": max_lng,
+        "y__lte" if max_lat >= 90.0 else "y__lt": max_lat,
+    }
+    return (
+        apply_geo_filters(queryset, field=field, bbox=bbox)
+        .annotate(x=PointX(field), y=PointY(field))
+        .filter(**upper)
+        .annotate(
+            tx=Least(Floor((F("x") + 180.0) / tile_size), Value(last_x)),
+            ty=Least(Floor((F("y") + 90.0) / tile_size), Value(last_y)),
+        )
+    )
+
+
+def tile_points(
+    queryset, *, field: str, bbox: tuple, tile_size: float, values: tuple
+) -> list:
+    """Filas compactas (solo `values` + x/y y el tile tx/ty) de los puntos del bbox."""
+    return list(
+        _tile_queryset(queryset, field=field, bbox=bbox, tile_size=tile_size).values(
+            *values, "x", "y", "tx", "ty"
+        )
+    )
+
+
+def tile_clusters(
+    queryset, *, field: str, bbox: tuple, tile_size: float, cell_size: float
+) -> list:
+    """
+    Agrupa los puntos del bbox (varios tiles) en una grilla de `cell_size`
+    grados con una sola consulta; las celdas dividen exactamente los tiles,
+    así cada cluster pertenece a un tile (`tile`).
+    """
+    rows = (
+        _tile_queryset(queryset, field=field, bbox=bbox, tile_size=tile_size)
+        .annotate(
+            cx=Floor((F("x") + 180.0) / cell_size),
+            cy=Floor((F("y") + 90.0) / cell_size),
+        )
+        .values("tx", "ty", "cx", "cy")
+        .annotate(
+            count=Count("pk"),
+            lat=Avg("y"),
+            lng=Avg("x"),
+            # Con un solo punto el cluster lleva su id (abre el detalle directo)
+            any_id=Min(Cast("pk", output_field=CharField())),
+        )
+        .order_by()
+    )
+
+    clusters = []
+    for row in rows:
+        cluster = {
+            "tile": (int(row["tx"]), int(row["ty"])),
+            "type": "cluster",
+            "count": row["count"],
+            "lat": round(row["lat"], 6),
+            "lng": round(row["lng"], 6),
+        }
+        if row["count"] == 1:
+            cluster["id"] = row["any_id"]
+        clusters.append(cluster)
+
+    return clusters
+
+
+class GeoQueryInputSerializer(serializers.Serializer):
+    """Parámetros de búsqueda por ubicación (lat/lng/radius y bbox)."""
+
+    lat = serializers.FloatField(required=False, min_value=-90, max_value=90)
+    lng = serializers.FloatField(required=False, min_value=-180, max_value=180)
+    radius = serializers.FloatField(
+        required=False,
+        min_value=0.1,
+        max_value=500,
+        help_text="Radio de búsqueda en km (requiere lat y lng)",
+    )
+    bbox = serializers.CharField(
+        required=False,
+        help_text="min_lng,min_lat,max_lng,max_lat",
+    )
+
+    def validate_bbox(self, value):
+        return parse_bbox(value)
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+
+        if ("lat" in attrs) != ("lng" in attrs):
+            raise serializers.ValidationError("lat y lng deben enviarse juntos")
+
+        if "radius" in attrs and "lat" not in attrs:
+            raise serializers.ValidationError("radius requiere lat y lng")
+
+        return attrs
+
+
+class MapViewportInputSerializer(serializers.Serializer):
+    """Área visible del mapa y nivel de zoom para los endpoints de marcadores."""
+
+    bbox = serializers.CharField(help_text="min_lng,min_lat,max_lng,max_lat")
+    zoom = serializers.IntegerField(min_value=0, max_value=20)
+
+    def validate_bbox(self, value):
+        return parse_bbox(value)
@@ -0,0 +1,118 @@
+# inira/app/shared/map_tiles.py
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+from rest_framework.exceptions import ValidationError
+
+# 🔹 Configuración de la grilla de tiles (lon/lat)
+TILE_CACHE_TTL = 300  # segundos
+MAX_TILES_PER_REQUEST = 64
+CLUSTER_MAX_ZOOM = 12  # desde este zoom se retornan puntos individuales
+GRID_CELLS_PER_TILE = 8
+
+Bbox = Tuple[float, float, float, float]
+# loader(bbox, tile_size, cell_size): marcadores del bbox, cada uno con su `tile` (x, y)
+TileLoader = Callable[[Bbox, float, Optional[float]], List[dict]]
+
+
+def tile_size(zoom: int) -> float:
+    """Tamaño en grados de un tile para el zoom dado."""
+    return 360.0 / (2**zoom)
+
+
+def grid_shape(zoom: int) -> Tuple[int, int]:
+    """Columnas y filas de la grilla: los tiles son cuadrados y la latitud cubre 180°."""
+    return 2**zoom, max(2 ** (zoom - 1), 1)
+
+
+def tile_bbox(zoom: int, x: int, y: int) -> Bbox:
+    """Bbox del tile recortado al mundo (con zoom 0 la única fila llega a lat 90)."""
+    size = tile_size(zoom)
+    min_lng = -180.0 + x * size
+    min_lat = -90.0 + y * size
+    return (min_lng, min_lat, min(min_lng + size, 180.0), min(min_lat + size, 90.0))
+
+
+def tiles_for_bbox(bbox: Bbox, zoom: int) -> List[Tuple[int, int]]:
+    """Tiles (x, y) que cubren el bbox, alineados a una grilla fija por zoom."""
+    min_lng, min_lat, max_lng, max_lat = _clamp_bbox(bbox)
+    size = tile_size(zoom)
+    columns, rows = grid_shape(zoom)
+
+    # 🔹 lng 180 / lat 90 caen justo en el borde: pertenecen al último tile
+    min_x = min(math.floor((min_lng + 180.0) / size), columns - 1)
+    max_x = min(math.floor((max_lng + 180.0) / size), columns - 1)
+    min_y = min(math.floor((min_lat + 90.0) / size), rows - 1)
+    max_y = min(math.floor((max_lat + 90.0) / size), rows - 1)
+
+    return [(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+
+
+def _clamp_bbox(bbox: Bbox) -> Bbox:
+    min_lng, min_lat, max_lng, max_lat = bbox
+    return (
+        max(min_lng, -180.0),
+        max(min_lat, -90.0),
+        min(max_lng, 180.0),
+        min(max_lat, 90.0),
+    )
+
+
+def load_tiles(*, prefix: str, bbox: Bbox, zoom: int, loader: TileLoader) -> Dict:
+    """
+    Resuelve los marcadores de un viewport tile por tile con cache-aside.
+
+    Cada tile se guarda en cache con la clave `map:{prefix}:{zoom}:{x}:{y}`,
+    de modo que al desplazar el mapa solo se consultan los tiles nuevos.
+    Los tiles faltantes se cargan con una sola llamada al loader sobre el
+    bbox que los cubre, y sus marcadores se reparten por `tile`. Con zoom
+    bajo el loader recibe el tamaño de celda para agrupar en la base de
+    datos; con zoom alto recibe None y retorna puntos.
+    """
+    tiles = tiles_for_bbox(bbox, zoom)
+    if len(tiles) > MAX_TILES_PER_REQUEST:
+        raise ValidationError(
+            {"bbox": "El área solicitada es demasiado grande para este zoom"}
+        )
+
+    clustered = zoom < CLUSTER_MAX_ZOOM
+    size = tile_size(zoom)
+    cell_size = size / GRID_CELLS_PER_TILE if clustered else None
+
+    keys = {f"map:{prefix}:{zoom}:{x}:{y}": (x, y) for x, y in tiles}
+    cached = cache.get_many(list(keys))
+
+    missing = {key: tile for key, tile in keys.items() if key not in cached}
+    if missing:
+        missing = _load_missing(
+            missing, zoom=zoom, size=size, cell_size=cell_size, loader=loader
+        )
+        cache.set_many(missing, TILE_CACHE_TTL)
+
+    items = []
+    for key in keys:
+        items.extend(cached.get(key, missing.get(key, [])))
+
+    return {
+        "zoom": zoom,
+        "clustered": clustered,
+        "items": items,
+    }
+
+
+def _load_missing(missing: Dict, *, zoom: int, size: float, cell_size, loader) -> Dict:
+    xs = [x for x, _ in missing.values()]
+    ys = [y for _, y in missing.values()]
+    span = tile_bbox(zoom, min(xs), min(ys))[:2] + tile_bbox(zoom, max(xs), max(ys))[2:]
+
+    # 🔹 Una sola consulta para todos los tiles faltantes (antes, una por tile)
+    by_tile = {tile: [] for tile in missing.values()}
+    for item in loader(span, size, cell_size):
+        tile = item.pop("tile")
+        # El bbox puede cubrir tiles ya cacheados: esos se descartan
+        if tile in by_tile:
+            by_tile[tile].append(item)
+
+    return {key: by_tile[tile] for key, tile in missing.items()}
@@ -0,0 +1,204 @@
+# inira/app/shared/metrics.py
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Tuple
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores de los buckets en milisegundos (el último es +Inf)
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# 🔹 Timeouts cortos: con Redis lento la métrica se pierde, el pago no espera
+SOCKET_TIMEOUT = 0.25  # segundos
+# Tras un error no se reintenta durante este tiempo (Redis caído no suma latencia)
+ERROR_BACKOFF = 30  # segundos
+# Los contadores se acumulan en memoria y se envían juntos cada tanto
+COUNTER_FLUSH_INTERVAL = 5  # segundos
+
+_client = None
+_async_clients = {}
+_skip_until = 0.0
+
+_counter_lock = threading.Lock()
+_pending_counts = defaultdict(Counter)
+_last_flush = time.monotonic()
+
+
+def _redis():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=SOCKET_TIMEOUT,
+            socket_connect_timeout=SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+def _aredis():
+    """Cliente async por event loop (el pool de conexiones queda ligado al loop)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(id(loop))
+    if client is None:
+        client = aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=SOCKET_TIMEOUT,
+            socket_connect_timeout=SOCKET_TIMEOUT,
+        )
+        _async_clients[id(loop)] = client
+    return client
+
+
+def _available() -> bool:
+    return time.monotonic() >= _skip_until
+
+
+def _failed(action: str, error: Exception) -> None:
+    global _skip_until
+    _skip_until = time.monotonic() + ERROR_BACKOFF
+    # Las métricas nunca deben romper la petición que se mide
+    logger.warning(f"[METRICS] No se pudo {action}: {error}")
+
+
+def _metric_key(metric: str, label: str) -> str:
+    return f"metrics:{metric}:{label}"
+
+
+def _observation(seconds: float) -> Tuple[int, str]:
+    elapsed_ms = int(seconds * 1000)
+    bucket = next(
+        (str(limit) for limit in LATENCY_BUCKETS_MS if elapsed_ms <= limit), "inf"
+    )
+    return elapsed_ms, bucket
+
+
+def _record(pipe, key: str, elapsed_ms: int, bucket: str) -> None:
+    pipe.hincrby(key, f"le_{bucket}", 1)
+    pipe.hincrby(key, "count", 1)
+    pipe.hincrby(key, "sum_ms", elapsed_ms)
+
+
+def observe_latency(metric: str, label: str, seconds: float) -> None:
+    """
+    Registra una observación en un histograma de latencia compartido.
+
+    El histograma es un hash en Redis que agrega todos los workers, con los
+    campos `le_{bucket}`, `count` y `sum_ms`; los tres HINCRBY van en un
+    solo pipeline (un round trip por observación).
+    """
+    if not _available():
+        return
+
+    elapsed_ms, bucket = _observation(seconds)
+    key = _metric_key(metric, label)
+
+    try:
+        with _redis().pipeline(transaction=False) as pipe:
+            _record(pipe, key, elapsed_ms, bucket)
+            pipe.execute()
+    except redis.RedisError as e:
+        _failed(f"registrar {key}", e)
+
+
+async def aobserve_latency(metric: str, label: str, seconds: float) -> None:
+    """observe_latency para código async: no bloquea el event loop."""
+    if not _available():
+        return
+
+    elapsed_ms, bucket = _observation(seconds)
+    key = _metric_key(metric, label)
+
+    try:
+        async with _aredis().pipeline(transaction=False) as pipe:
+            _record(pipe, key, elapsed_ms, bucket)
+            await pipe.execute()
+    except redis.RedisError as e:
+        _failed(f"registrar {key}", e)
+
+
+def latency_histogram(metric: str, label: str) -> Dict:
+    """Histograma (no acumulado) con conteo, suma y promedio en ms."""
+    buckets = [str(limit) for limit in LATENCY_BUCKETS_MS] + ["inf"]
+
+    values = counters(metric, label)
+    count = values.get("count", 0)
+    total_ms = values.get("sum_ms", 0)
+
+    return {
+        "label": label,
+        "count": count,
+        "sum_ms": total_ms,
+        "avg_ms": round(total_ms / count, 1) if count else None,
+        "buckets": {b: values.get(f"le_{b}", 0) for b in buckets},
+    }
+
+
+def incr_counter(metric: str, label: str, field: str, delta: int = 1) -> None:
+    """
+    Incrementa un contador compartido (hash `metrics:{metric}:{label}`).
+
+    El incremento se suma en memoria y cada COUNTER_FLUSH_INTERVAL segundos
+    todos los pendientes del proceso se envían en un solo pipeline, así que
+    contar no agrega un round trip a la operación medida.
+    """
+    with _counter_lock:
+        _pending_counts[_metric_key(metric, label)][field] += delta
+        now = time.monotonic()
+        if now - _last_flush < COUNTER_FLUSH_INTERVAL:
+            return
+        pending = _take_pending(now)
+
+    _flush(pending)
+
+
+def flush_counters() -> None:
+    """Envía ya los contadores pendientes (al terminar el proceso o un comando)."""
+    with _counter_lock:
+        pending = _take_pending(time.monotonic())
+    _flush(pending)
+
+
+def _take_pending(now: float) -> Dict[str, Counter]:
+    global _last_flush
+    pending = dict(_pending_counts)
+    _pending_counts.clear()
+    _last_flush = now
+    return pending
+
+
+def _flush(pending: Dict[str, Counter]) -> None:
+    if not pending or not _available():
+        return
+
+    try:
+        with _redis().pipeline(transaction=False) as pipe:
+            for key, fields in pending.items():
+                for field, delta in fields.items():
+                    pipe.hincrby(key, field, delta)
+            pipe.execute()
+    except redis.RedisError as e:
+        _failed("enviar contadores", e)
+
+
+def counters(metric: str, label: str) -> Dict[str, int]:
+    """Valores de los contadores enviados (no incluye los pendientes en memoria)."""
+    key = _metric_key(metric, label)
+    try:
+        return {field: int(value) for field, value in _redis().hgetall(key).items()}
+    except redis.RedisError as e:
+        _failed(f"leer {key}", e)
+        return {}
+
+
+atexit.register(flush_counters)
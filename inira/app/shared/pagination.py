@@ -0,0 +1,75 @@
+# inira/app/shared/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+def encode_cursor(value: datetime, pk: Any) -> str:
+    """Codifica la posición (valor de orden, id) en un token opaco."""
+    payload = json.dumps([value.isoformat(), str(pk)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, model=None) -> Tuple[datetime, Any]:
+    """
+    Decodifica un token generado por `encode_cursor`.
+
+    Con `model`, el id se convierte con el campo pk del modelo: un cursor
+    manipulado (p. ej. un id que no es UUID) es un 400 y no un error del ORM.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw_value, pk = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value = parse_datetime(raw_value)
+        if value is None or not isinstance(pk, str):
+            raise ValueError
+        if model is not None:
+            pk = model._meta.pk.to_python(pk)
+        return value, pk
+    except (ValueError, TypeError, json.JSONDecodeError, DjangoValidationError):
+        raise ValidationError({"cursor": "Cursor inválido"})
+
+
+def keyset_page(
+    queryset: QuerySet,
+    *,
+    cursor: Optional[str],
+    page_size: int,
+    field: str,
+    descending: bool,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Pagina un queryset por (field, id) sin OFFSET ni COUNT.
+
+    Un cursor vacío o None retorna la primera página. Se lee una fila extra
+    para saber si existe una página siguiente.
+
+    Returns:
+        (filas de la página, cursor de la siguiente página o None)
+    """
+    direction = "lt" if descending else "gt"
+    prefix = "-" if descending else ""
+
+    if cursor:
+        value, pk = decode_cursor(cursor, model=queryset.model)
+        queryset = queryset.filter(
+            Q(**{f"{field}__{direction}": value})
+            | Q(**{field: value, f"pk__{direction}": pk})
+        )
+
+    rows = list(queryset.order_by(f"{prefix}{field}", f"{prefix}pk")[: page_size + 1])
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, field), last.pk)
+
+    return rows, next_cursor
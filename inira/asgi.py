@@ -2,7 +2,7 @@
 
 import os
 from django.core.asgi import get_asgi_application
-from channels.routing import ProtocolTypeRouter, URLRouter
+from channels.routing import ChannelNameRouter, ProtocolTypeRouter, URLRouter
 from channels.security.websocket import AllowedHostsOriginValidator
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "inira.settings")
@@ -12,10 +12,16 @@ django_asgi_app = get_asgi_application()
 # ✅ Importar DESPUÉS de get_asgi_application()
 from inira.setting.websocket import routing
 from inira.setting.websocket.middleware import JWTAuthMiddleware
+from inira.app.payments.infrastructure.webhook_worker import (
+    WEBHOOK_CHANNEL,
+    PaymentWebhookWorker,
+)
 
 application = ProtocolTypeRouter(
     {
         "http": django_asgi_app,
         "websocket": JWTAuthMiddleware(URLRouter(routing.websocket_urlpatterns)),
+        # 🔹 Worker: python manage.py runworker payment-webhooks
+        "channel": ChannelNameRouter({WEBHOOK_CHANNEL: PaymentWebhookWorker.as_asgi()}),
     }
 )
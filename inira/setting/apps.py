@@ -8,6 +8,7 @@ DJANGO_APPS = [
     "channels",
     "django.contrib.staticfiles",
     "django.contrib.gis",
+    "django.contrib.postgres",
 ]
 
 THIRD_PARTY_APPS = [
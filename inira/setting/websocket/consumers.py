@@ -1,12 +1,54 @@
+import asyncio
 import json
 import logging
 from datetime import datetime
+from urllib.parse import parse_qs
 
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+
+from inira.setting.websocket.presence import PresenceRegistry
+from inira.setting.websocket.utils import batch_frame, encode_frame, presence_batcher
+
 logger = logging.getLogger("django")  # Render captura este
 
+# Referencias a las salidas diferidas (evita que el GC cancele las tareas)
+_pending_offline = set()
+
+
+async def announce_presence(channel_layer, group, user_id, username, status):
+    """
+    Diff de presencia agrupado con el resto de eventos. Conserva los tipos
+    user_joined/user_left que ya entienden los clientes.
+    """
+    await presence_batcher.add(
+        channel_layer,
+        group,
+        {
+            "type": "user_joined" if status == "online" else "user_left",
+            "user_id": user_id,
+            "username": username,
+            "status": status,
+            "timestamp": datetime.now().isoformat(),
+        },
+        key=("presence", str(user_id)),
+    )
+
+
+async def _offline_after_grace(channel_layer, group, presence, user_id, username):
+    # 🔹 Debounce: una reconexión dentro de la gracia no genera offline/online
+    await asyncio.sleep(settings.PRESENCE_DEBOUNCE_SECONDS)
+    try:
+        if await presence.confirm_offline(user_id):
+            await announce_presence(channel_layer, group, user_id, username, "offline")
+    except Exception:
+        logger.warning(
+            f"⚠️ Presencia no disponible (salida user={user_id})", exc_info=True
+        )
+
 
 class CanalChatConsumer(AsyncWebsocketConsumer):
     """
@@ -27,9 +69,9 @@ class CanalChatConsumer(AsyncWebsocketConsumer):
             await self.close(code=4001)
             return
 
-        # ✅ SEGURIDAD 2: Verificar membresía del canal
-        is_member = await self.check_canal_membership()
-        if not is_member:
+        # ✅ SEGURIDAD 2 y 3: membresía y permisos de escritura (una consulta, cacheada)
+        access = await self.get_canal_access()
+        if not access["is_member"]:
             logger.warning(
                 f"❌ WS RECHAZADO - Usuario {self.user.username} no es miembro "
                 f"canal={self.canal_id}"
@@ -37,8 +79,12 @@ class CanalChatConsumer(AsyncWebsocketConsumer):
             await self.close(code=4003)
             return
 
-        # ✅ SEGURIDAD 3: Verificar permisos de escritura
-        self.can_write = await self.check_write_permission()
+        self.can_write = access["can_write"]
+        self.comunidad_id = access["comunidad_id"]
+
+        params = parse_qs(self.scope.get("query_string", b"").decode())
+        # 🔹 Opt-in: `?batch=1` recibe typing/entradas/salidas en frames `batch`
+        self.batch_frames = params.get("batch", [""])[0] in ("1", "true")
 
         self.room_group_name = f"canal_chat_{self.canal_id}"
 
@@ -59,38 +105,78 @@ class CanalChatConsumer(AsyncWebsocketConsumer):
                     "user_id": self.user.id,
                     "username": self.user.username,
                     "can_write": self.can_write,
+                    "batch": self.batch_frames,
                     "message": "Conectado al canal exitosamente",
                     "timestamp": self.get_timestamp(),
                 }
             )
         )
 
-        await self.channel_layer.group_send(
-            self.room_group_name,
-            {
-                "type": "user_joined",
-                "user_id": self.user.id,
-                "username": self.user.username,
-                "timestamp": self.get_timestamp(),
-            },
-        )
+        # 🔹 Reconexión: `?since=<cursor>` entrega solo los posts perdidos
+        since = params.get("since")
+        if since:
+            await self.resume(since[0])
 
-    async def disconnect(self, close_code):
-        if hasattr(self, "room_group_name") and hasattr(self, "user"):
-            await self.channel_layer.group_send(
-                self.room_group_name,
+        await self.join_presence()
+
+    async def join_presence(self):
+        # 🔹 Presencia: snapshot para el que entra, diff solo si cambia el estado
+        self.presence = PresenceRegistry(self.canal_id)
+        try:
+            is_new = await self.presence.join(
+                self.user.id, self.user.username, self.channel_name
+            )
+            online = await self.presence.snapshot()
+        except Exception:
+            logger.warning(
+                f"⚠️ Presencia no disponible canal={self.canal_id}", exc_info=True
+            )
+            return
+
+        await self.send(
+            text_data=json.dumps(
                 {
-                    "type": "user_left",
-                    "user_id": self.user.id,
-                    "username": self.user.username,
+                    "type": "presence_snapshot",
+                    "users": online,
                     "timestamp": self.get_timestamp(),
-                },
+                }
             )
+        )
 
+        if is_new:
+            await announce_presence(
+                self.channel_layer,
+                self.room_group_name,
+                self.user.id,
+                self.user.username,
+                "online",
+            )
+
+    async def disconnect(self, close_code):
+        if hasattr(self, "room_group_name"):
             await self.channel_layer.group_discard(
                 self.room_group_name, self.channel_name
             )
 
+        if hasattr(self, "presence"):
+            try:
+                if await self.presence.leave(self.user.id, self.channel_name):
+                    task = asyncio.create_task(
+                        _offline_after_grace(
+                            self.channel_layer,
+                            self.room_group_name,
+                            self.presence,
+                            self.user.id,
+                            self.user.username,
+                        )
+                    )
+                    _pending_offline.add(task)
+                    task.add_done_callback(_pending_offline.discard)
+            except Exception:
+                logger.warning(
+                    f"⚠️ Presencia no disponible canal={self.canal_id}", exc_info=True
+                )
+
         logger.info(
             f"🔌 WS DESCONECTADO canal={self.canal_id} "
             f"user={getattr(self.user, 'username', None)} "
@@ -108,33 +194,38 @@ class CanalChatConsumer(AsyncWebsocketConsumer):
                         {"type": "pong", "timestamp": self.get_timestamp()}
                     )
                 )
+                await self.heartbeat()
 
             elif message_type == "typing":
                 if not self.can_write:
-                    logger.warning(
-                        f"🚫 Usuario {self.user.username} intentó escribir sin permiso "
-                        f"canal={self.canal_id}"
-                    )
-                    await self.send(
-                        text_data=json.dumps(
-                            {
-                                "type": "error",
-                                "message": "No tienes permiso para escribir en este canal",
-                            }
-                        )
-                    )
+                    await self.deny_write()
                     return
 
-                await self.channel_layer.group_send(
+                await presence_batcher.add(
+                    self.channel_layer,
                     self.room_group_name,
                     {
-                        "type": "user_typing",
+                        "type": "typing",
                         "user_id": self.user.id,
                         "username": self.user.username,
                         "is_typing": data.get("is_typing", True),
                     },
+                    key=("typing", self.user.id),
                 )
 
+            elif message_type == "post":
+                if not self.can_write:
+                    await self.deny_write()
+                    return
+
+                await self.publish_post(data.get("content"), data.get("client_id"))
+
+            elif message_type == "resume":
+                await self.resume(data.get("since"))
+
+            elif message_type == "read":
+                await self.mark_read(data.get("cursor"))
+
         except json.JSONDecodeError:
             logger.error("❌ JSON inválido recibido por WS", exc_info=True)
             await self.send(
@@ -149,90 +240,239 @@ class CanalChatConsumer(AsyncWebsocketConsumer):
                 )
             )
 
-    async def new_post(self, event):
+    async def deny_write(self):
+        logger.warning(
+            f"🚫 Usuario {self.user.username} intentó escribir sin permiso "
+            f"canal={self.canal_id}"
+        )
         await self.send(
-            text_data=json.dumps({"type": "new_post", "post": event["post"]})
+            text_data=json.dumps(
+                {
+                    "type": "error",
+                    "message": "No tienes permiso para escribir en este canal",
+                }
+            )
         )
 
-    async def user_joined(self, event):
-        if event["user_id"] != self.user.id:
-            await self.send(
-                text_data=json.dumps(
-                    {
-                        "type": "user_joined",
-                        "user_id": event["user_id"],
-                        "username": event["username"],
-                        "timestamp": event["timestamp"],
-                    }
-                )
+    async def publish_post(self, content, client_id=None):
+        """
+        Crea el post sin pasar por HTTP: el permiso ya se validó al conectar.
+        El autor recibe un `post_ack` (con su client_id) y el canal el `new_post`.
+        """
+        try:
+            post_data = await self.create_post(content)
+        except ValidationError as e:
+            await self.send_validation_error(e)
+            return
+
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                "type": "new_post",
+                "frame": encode_frame({"type": "new_post", "post": post_data}),
+            },
+        )
+
+        await self.send(
+            text_data=encode_frame(
+                {"type": "post_ack", "client_id": client_id, "post": post_data}
             )
+        )
+
+    async def resume(self, since):
+        """
+        Envía los posts posteriores a `since` en páginas keyset sobre
+        (canal_id, created_at, id). Si faltan más de WS_RESUME_MAX_POSTS se
+        corta con `has_more` y el cliente sigue por HTTP con `next_cursor`.
+        """
+        if not since:
+            return
+
+        cursor = since
+        sent = 0
+
+        while True:
+            try:
+                result = await self.get_posts_since(cursor)
+            except ValidationError as e:
+                await self.send_validation_error(e)
+                return
+
+            cursor = result["next_cursor"]
+            sent += len(result["results"])
 
-    async def user_left(self, event):
-        if event["user_id"] != self.user.id:
             await self.send(
-                text_data=json.dumps(
+                text_data=encode_frame(
                     {
-                        "type": "user_left",
-                        "user_id": event["user_id"],
-                        "username": event["username"],
-                        "timestamp": event["timestamp"],
+                        "type": "missed_posts",
+                        "posts": result["results"],
+                        "next_cursor": cursor,
+                        "has_more": cursor is not None,
                     }
                 )
             )
 
-    async def user_typing(self, event):
+            if cursor is None or sent >= settings.WS_RESUME_MAX_POSTS:
+                return
+
+    async def mark_read(self, cursor):
+        # 🔹 Marcador de lectura sin request HTTP; el ack lleva el valor guardado
+        try:
+            result = await self.mark_canal_read(cursor)
+        except ValidationError as e:
+            await self.send_validation_error(e)
+            return
+
+        await self.send(
+            text_data=encode_frame(
+                {"type": "read_ack", "last_read_at": result["last_read_at"]}
+            )
+        )
+
+    async def send_validation_error(self, error: ValidationError):
+        detail = error.detail
+        if isinstance(detail, dict):
+            detail = next(iter(detail.values()))
+        if isinstance(detail, list):
+            detail = detail[0]
+
+        await self.send(text_data=json.dumps({"type": "error", "message": str(detail)}))
+
+    async def new_post(self, event):
+        # El frame llega ya serializado (una vez por mensaje, no por socket)
+        await self.send(text_data=event["frame"])
+
+    async def ws_event(self, event):
+        # Evento suelto (lotes desactivados); los propios no se reenvían
         if event["user_id"] != self.user.id:
-            await self.send(
-                text_data=json.dumps(
-                    {
-                        "type": "typing",
-                        "user_id": event["user_id"],
-                        "username": event["username"],
-                        "is_typing": event["is_typing"],
-                    }
-                )
+            await self.send(text_data=event["frame"])
+
+    async def batch(self, event):
+        # Lote de presencia/typing: se filtran los eventos del propio usuario
+        frames = [
+            item["frame"] for item in event["events"] if item["user_id"] != self.user.id
+        ]
+        if not frames:
+            return
+
+        if self.batch_frames:
+            await self.send(text_data=batch_frame(frames))
+            return
+
+        # Clientes sin opt-in: los frames de siempre, uno por evento
+        for frame in frames:
+            await self.send(text_data=frame)
+
+    async def heartbeat(self):
+        # El ping renueva la conexión y de paso expira sockets muertos del canal
+        try:
+            gone = await self.presence.heartbeat(self.user.id, self.channel_name)
+        except Exception:
+            logger.warning(
+                f"⚠️ Presencia no disponible canal={self.canal_id}", exc_info=True
+            )
+            return
+
+        for user_id, username in gone:
+            await announce_presence(
+                self.channel_layer, self.room_group_name, user_id, username, "offline"
             )
 
     @database_sync_to_async
-    def check_canal_membership(self):
+    def create_post(self, content):
         from inira.app.shared.container import container
+        from inira.app.communities.infrastructure.out.post_output_serializer import (
+            PostOutputSerializer,
+        )
 
-        try:
-            canal_repo = container.communities().canal_repository()
-            member_repo = container.communities().member_repository()
+        post = (
+            container.communities()
+            .publish_post()
+            .execute(
+                comunidad_id=self.comunidad_id,
+                canal_id=self.canal_id,
+                author_id=self.user.id,
+                content=content,
+            )
+        )
+        return PostOutputSerializer(post).data
+
+    @database_sync_to_async
+    def get_posts_since(self, since):
+        from inira.app.shared.container import container
+        from inira.app.communities.infrastructure.out.post_output_serializer import (
+            PostOutputSerializer,
+        )
+
+        result = (
+            container.communities()
+            .get_posts_since()
+            .execute(
+                canal_id=self.canal_id,
+                since=since,
+                page_size=settings.WS_RESUME_PAGE_SIZE,
+            )
+        )
+        return {
+            "results": PostOutputSerializer(result["results"], many=True).data,
+            "next_cursor": result["next_cursor"],
+        }
 
-            canal = canal_repo.find_by_id(self.canal_id)
+    @database_sync_to_async
+    def mark_canal_read(self, cursor):
+        from inira.app.shared.container import container
 
-            return member_repo.exists(
-                comunidad_id=str(canal.comunidad_id),
+        return (
+            container.communities()
+            .mark_canal_read()
+            .execute(
+                canal_id=self.canal_id,
                 user_id=self.user.id,
+                cursor=cursor,
             )
-
-        except Exception:
-            logger.exception(f"🔥 Error verificando membresía canal={self.canal_id}")
-            return False
+        )
 
     @database_sync_to_async
-    def check_write_permission(self):
+    def get_canal_access(self):
         from inira.app.shared.container import container
 
         try:
-            canal_repo = container.communities().canal_repository()
-            member_repo = container.communities().member_repository()
-
-            canal = canal_repo.find_by_id(self.canal_id)
-
-            if canal.is_read_only:
-                return member_repo.is_admin_or_owner(
-                    comunidad_id=str(canal.comunidad_id),
-                    user_id=self.user.id,
-                )
-
-            return True
+            use_case = container.communities().get_canal_access()
+            return use_case.execute(canal_id=self.canal_id, user_id=self.user.id)
 
         except Exception:
-            logger.exception(f"🔥 Error verificando permisos canal={self.canal_id}")
-            return False
+            logger.exception(f"🔥 Error verificando acceso canal={self.canal_id}")
+            return {"is_member": False, "can_write": False}
 
     def get_timestamp(self):
         return datetime.now().isoformat()
+
+
+class PaymentStatusConsumer(AsyncWebsocketConsumer):
+    """
+    Consumer que notifica al usuario los cambios de estado de sus pagos
+    """
+
+    async def connect(self):
+        self.user = self.scope.get("user")
+
+        if not self.user or not self.user.is_authenticated:
+            logger.warning("❌ WS PAGOS RECHAZADO - Usuario no autenticado")
+            await self.close(code=4001)
+            return
+
+        self.room_group_name = f"payments_user_{self.user.id}"
+        await self.channel_layer.group_add(self.room_group_name, self.channel_name)
+
+        await self.accept()
+
+        logger.info(f"✅ WS PAGOS CONECTADO usuario={self.user.username}")
+
+    async def disconnect(self, close_code):
+        if hasattr(self, "room_group_name"):
+            await self.channel_layer.group_discard(
+                self.room_group_name, self.channel_name
+            )
+
+    async def payment_status(self, event):
+        await self.send(text_data=event["frame"])
@@ -1,19 +1,23 @@
 import logging
+import time
 from urllib.parse import parse_qs
 
 from channels.db import database_sync_to_async
-from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
-User = get_user_model()
+from inira.setting.websocket.user_cache import WebSocketUser, get_user_record
 
 logger = logging.getLogger("django")
 
 
 @database_sync_to_async
-def get_user_from_jwt(token_string):
+def _get_user_record(user_id):
+    return get_user_record(user_id)
+
+
+async def get_user_from_jwt(token_string):
     try:
         access_token = AccessToken(token_string)
         user_id = access_token.get("user_id")
@@ -22,18 +26,17 @@ def get_user_from_jwt(token_string):
             logger.warning("❌ JWT sin user_id")
             return AnonymousUser()
 
-        user = User.objects.get(id=user_id)
+        # 🔹 Sin User.objects.get por conexión: registro cacheado (local/Redis)
+        record = await _get_user_record(user_id)
 
-        logger.info(f"✅ WS AUTH OK user_id={user.id} username={user.username}")
+        if not record or not record["is_active"]:
+            logger.warning("❌ JWT válido pero usuario no existe o está inactivo")
+            return AnonymousUser()
 
-        return user
+        return WebSocketUser(**record)
 
     except (InvalidToken, TokenError):
-        logger.exception("❌ JWT inválido en WebSocket")
-        return AnonymousUser()
-
-    except User.DoesNotExist:
-        logger.warning("❌ JWT válido pero usuario no existe")
+        logger.warning("❌ JWT inválido en WebSocket")
         return AnonymousUser()
 
     except Exception:
@@ -50,16 +53,18 @@ class JWTAuthMiddleware:
         self.app = app
 
     async def __call__(self, scope, receive, send):
+        started = time.perf_counter()
         query_string = scope.get("query_string", b"").decode()
 
-        logger.info(f"🔍 WS query_string='{query_string[:200]}'")
-
         query_params = parse_qs(query_string)
         token = query_params.get("token", [None])[0]
 
         if token:
-            logger.info(f"🔐 WS token recibido len={len(token)}")
             scope["user"] = await get_user_from_jwt(token)
+            logger.debug(
+                f"🔐 WS auth user_id={getattr(scope['user'], 'id', None)} "
+                f"{(time.perf_counter() - started) * 1000:.2f}ms"
+            )
         else:
             logger.warning("⚠️ WS conexión sin token JWT")
             scope["user"] = AnonymousUser()
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import time
+
+import redis.asyncio as aioredis
+from django.conf import settings
+
+logger = logging.getLogger("django")
+
+_clients = {}
+
+
+def _redis():
+    """Cliente async por event loop (el pool de conexiones queda ligado al loop)."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(id(loop))
+    if client is None:
+        client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        _clients[id(loop)] = client
+    return client
+
+
+def _user_id(raw: str):
+    return int(raw) if raw.isdigit() else raw
+
+
+class PresenceRegistry:
+    """
+    Presencia de un canal en Redis, compartida por todos los workers ASGI.
+
+    - `presence:{canal}:online` (ZSET): user_id → expiración de su último
+      heartbeat. Si cae por debajo de `now` todas sus conexiones murieron.
+    - `presence:{canal}:conns:{user_id}` (ZSET): channel_name → expiración,
+      para saber si un usuario sigue con otra pestaña abierta.
+    - `presence:{canal}:names` (HASH): user_id → username.
+    - `presence:{canal}:grace:{user_id}`: salida reciente; si el usuario
+      vuelve antes de PRESENCE_DEBOUNCE_SECONDS no se anuncia nada.
+    """
+
+    def __init__(self, canal_id):
+        self.canal_id = canal_id
+        self.online_key = f"presence:{canal_id}:online"
+        self.names_key = f"presence:{canal_id}:names"
+
+    def _conns_key(self, user_id) -> str:
+        return f"presence:{self.canal_id}:conns:{user_id}"
+
+    def _grace_key(self, user_id) -> str:
+        return f"presence:{self.canal_id}:grace:{user_id}"
+
+    async def join(self, user_id, username, channel_name) -> bool:
+        """Registra la conexión; retorna True si hay que anunciar al usuario en línea."""
+        client = _redis()
+        now = time.time()
+        ttl = settings.PRESENCE_TTL_SECONDS
+        conns_key = self._conns_key(user_id)
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.zscore(self.online_key, str(user_id))
+            pipe.delete(self._grace_key(user_id))
+            pipe.zadd(conns_key, {channel_name: now + ttl})
+            pipe.zadd(self.online_key, {str(user_id): now + ttl})
+            pipe.hset(self.names_key, str(user_id), username)
+            pipe.expire(conns_key, ttl * 2)
+            pipe.expire(self.online_key, ttl * 2)
+            pipe.expire(self.names_key, ttl * 2)
+            previous, had_grace, *_ = await pipe.execute()
+
+        was_online = previous is not None and previous > now
+        # Reconexión dentro de la gracia: para los demás nunca se fue
+        return not was_online and not had_grace
+
+    async def heartbeat(self, user_id, channel_name) -> list:
+        """
+        Renueva la conexión (ping) y purga usuarios vencidos.
+        Retorna [(user_id, username)] de quienes quedaron fuera de línea.
+        """
+        client = _redis()
+        now = time.time()
+        ttl = settings.PRESENCE_TTL_SECONDS
+        conns_key = self._conns_key(user_id)
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.zadd(conns_key, {channel_name: now + ttl})
+            pipe.zadd(self.online_key, {str(user_id): now + ttl})
+            pipe.expire(conns_key, ttl * 2)
+            pipe.expire(self.online_key, ttl * 2)
+            pipe.expire(self.names_key, ttl * 2)
+            pipe.zrangebyscore(self.online_key, "-inf", now)
+            *_, expired = await pipe.execute()
+
+        gone = []
+        for expired_user in expired:
+            # Solo un worker gana el ZREM y anuncia la salida
+            if await client.zrem(self.online_key, expired_user):
+                gone.append(
+                    (
+                        _user_id(expired_user),
+                        await client.hget(self.names_key, expired_user),
+                    )
+                )
+                await client.delete(self._conns_key(expired_user))
+        return gone
+
+    async def leave(self, user_id, channel_name) -> bool:
+        """Quita la conexión; retorna True si era la última viva del usuario."""
+        client = _redis()
+        now = time.time()
+        conns_key = self._conns_key(user_id)
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.zrem(conns_key, channel_name)
+            pipe.zcount(conns_key, now, "+inf")
+            _, alive = await pipe.execute()
+
+        if alive:
+            return False
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.zrem(self.online_key, str(user_id))
+            pipe.set(
+                self._grace_key(user_id), 1, ex=settings.PRESENCE_DEBOUNCE_SECONDS * 2
+            )
+            await pipe.execute()
+        return True
+
+    async def confirm_offline(self, user_id) -> bool:
+        """Tras la gracia: True si el usuario no volvió y hay que anunciar la salida."""
+        return bool(await _redis().delete(self._grace_key(user_id)))
+
+    async def snapshot(self) -> list:
+        """Usuarios en línea con heartbeat vigente."""
+        client = _redis()
+        user_ids = await client.zrangebyscore(self.online_key, time.time(), "+inf")
+        if not user_ids:
+            return []
+
+        names = await client.hmget(self.names_key, user_ids)
+        return [
+            {"user_id": _user_id(uid), "username": name}
+            for uid, name in zip(user_ids, names)
+        ]
@@ -9,4 +9,5 @@ websocket_urlpatterns = [
         r"^ws/chat/canal/(?P<canal_id>[0-9a-f-]+)/$",  # ← Agrega ^
         consumers.CanalChatConsumer.as_asgi(),
     ),
+    re_path(r"^ws/payments/$", consumers.PaymentStatusConsumer.as_asgi()),
 ]
@@ -0,0 +1,83 @@
+import logging
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+logger = logging.getLogger("django")
+
+# 🔹 Redis (compartido) + copia local por proceso, más corta
+USER_CACHE_TTL = 300
+LOCAL_CACHE_TTL = 30
+LOCAL_CACHE_MAX = 10000
+
+_local_users = {}
+
+
+class WebSocketUser:
+    """
+    Usuario liviano para el scope de los WebSockets: se arma desde los
+    claims del JWT y el registro cacheado, sin instancia del ORM.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, *, id, username, is_active, groups):
+        self.id = id
+        self.pk = id
+        self.username = username
+        self.is_active = is_active
+        self.groups = tuple(groups)
+
+    def __str__(self):
+        return self.username
+
+
+def user_cache_key(user_id) -> str:
+    return f"ws_user:{user_id}"
+
+
+def invalidate_ws_user(user_id) -> None:
+    """Descarta el registro cacheado (llamado desde las señales de User)."""
+    _local_users.pop(str(user_id), None)
+    try:
+        cache.delete(user_cache_key(user_id))
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudo invalidar el usuario WS {user_id}: {e}")
+
+
+def _load_user_record(user_id):
+    User = get_user_model()
+    record = (
+        User.objects.filter(id=user_id).values("id", "username", "is_active").first()
+    )
+    if record:
+        record["groups"] = list(
+            User.groups.through.objects.filter(user_id=user_id).values_list(
+                "group__name", flat=True
+            )
+        )
+    return record
+
+
+def get_user_record(user_id):
+    """
+    Registro del usuario (id, username, is_active, groups) o None.
+    Orden: cache local → Redis → base de datos (solo en fallo).
+    """
+    local_key = str(user_id)
+    entry = _local_users.get(local_key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    record = cache.get(user_cache_key(user_id))
+    if record is None:
+        record = _load_user_record(user_id) or {}
+        cache.set(user_cache_key(user_id), record, USER_CACHE_TTL)
+
+    if len(_local_users) >= LOCAL_CACHE_MAX:
+        _local_users.clear()
+    _local_users[local_key] = (time.monotonic() + LOCAL_CACHE_TTL, record)
+
+    return record or None
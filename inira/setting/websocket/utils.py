@@ -1,16 +1,145 @@
+import asyncio
+import itertools
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger("django")
+
+# 🔹 Publicación fuera del hilo del request (fire-and-forget)
+_publisher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ws-publish")
+
+
+def encode_frame(payload: dict) -> str:
+    """
+    Serializa un frame una sola vez (JSON compacto). Los consumers envían
+    el texto tal cual, sin volver a hacer json.dumps por cada socket.
+    """
+    return json.dumps(
+        payload, cls=DjangoJSONEncoder, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def _group_send(group: str, message: dict):
+    try:
+        async_to_sync(get_channel_layer().group_send)(group, message)
+    except Exception:
+        logger.exception(f"🔥 Error publicando en el grupo {group}")
+
+
+def publish(group: str, message: dict):
+    """
+    Publica en un grupo cuando la transacción confirma, sin bloquear el
+    request: el envío al channel layer corre en un hilo aparte.
+    """
+    transaction.on_commit(lambda: _publisher.submit(_group_send, group, message))
 
 
 def broadcast_new_post(canal_id: str, post_data: dict):
     """
     Envía un nuevo post en tiempo real a todos los usuarios conectados al canal
     """
+    publish(
+        f"canal_chat_{canal_id}",
+        {
+            "type": "new_post",
+            "frame": encode_frame({"type": "new_post", "post": post_data}),
+        },
+    )
+
+
+def broadcast_payment_status(user_id, payment_data: dict):
+    """
+    Notifica al pagador el nuevo estado de su pago (evita el polling)
+    """
     channel_layer = get_channel_layer()
 
     async_to_sync(channel_layer.group_send)(
-        f"canal_chat_{canal_id}", {"type": "new_post", "post": post_data}
+        f"payments_user_{user_id}",
+        {
+            "type": "payment_status",
+            "frame": encode_frame({"type": "payment_status", "payment": payment_data}),
+        },
     )
+
+
+class GroupBatcher:
+    """
+    Agrupa eventos efímeros de un grupo (escribiendo, entradas y salidas)
+    y los publica en un solo mensaje del channel layer cada `interval`
+    segundos. Con una clave, el último evento reemplaza a los anteriores
+    (ej. typing del mismo usuario).
+
+    Cada evento viaja ya serializado junto con su user_id: el consumer
+    descarta los del propio usuario y decide el formato del frame (un
+    `batch` para las conexiones que lo pidieron, frames sueltos para el
+    resto). Con `interval <= 0` no se agrupa y cada evento sale solo.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending = {}
+        self._tasks = {}
+        self._seq = itertools.count()
+
+    async def add(self, channel_layer, group: str, event: dict, *, key=None):
+        if self.interval <= 0:
+            await self._send(
+                channel_layer,
+                group,
+                {
+                    "type": "ws_event",
+                    "user_id": event.get("user_id"),
+                    "frame": encode_frame(event),
+                },
+            )
+            return
+
+        pending = self._pending.setdefault(group, {})
+        pending[key if key is not None else next(self._seq)] = event
+
+        if group not in self._tasks:
+            self._tasks[group] = asyncio.ensure_future(
+                self._flush_later(channel_layer, group)
+            )
+
+    async def _flush_later(self, channel_layer, group: str):
+        try:
+            await asyncio.sleep(self.interval)
+        finally:
+            self._tasks.pop(group, None)
+            events = list(self._pending.pop(group, {}).values())
+
+        if events:
+            await self._send(
+                channel_layer,
+                group,
+                {
+                    "type": "batch",
+                    "events": [
+                        {"user_id": event.get("user_id"), "frame": encode_frame(event)}
+                        for event in events
+                    ],
+                },
+            )
+
+    async def _send(self, channel_layer, group: str, message: dict):
+        try:
+            await channel_layer.group_send(group, message)
+        except Exception:
+            logger.exception(f"🔥 Error publicando eventos en el grupo {group}")
+
+
+def batch_frame(frames: list) -> str:
+    """Frame {"type": "batch", "events": [...]} a partir de frames ya serializados."""
+    return '{"type":"batch","events":[' + ",".join(frames) + "]}"
+
+
+presence_batcher = GroupBatcher(interval=settings.WS_BATCH_INTERVAL_MS / 1000)
@@ -177,11 +177,49 @@ WOMPI_BASE_URL = os.environ.get("WOMPI_BASE_URL", default="https://sandbox.wompi
 WOMPI_PRIVATE_KEY = os.environ.get("WOMPI_PRIVATE_KEY")
 WOMPI_INTEGRITY_SECRET = os.environ.get("WOMPI_INTEGRITY_SECRET")
 WOMPI_PUBLIC_KEY = os.environ.get("WOMPI_PUBLIC_KEY")
+WOMPI_EVENTS_SECRET = os.environ.get("WOMPI_EVENTS_SECRET")
+WOMPI_HTTP_POOL_SIZE = int(os.environ.get("WOMPI_HTTP_POOL_SIZE", 10))
+WOMPI_HTTP_MAX_RETRIES = int(os.environ.get("WOMPI_HTTP_MAX_RETRIES", 3))
+# "requests" (vistas síncronas) o "httpx" (vistas async bajo daphne)
+WOMPI_HTTP_CLIENT = os.environ.get("WOMPI_HTTP_CLIENT", "requests")
+
+# 🔹 Minutos que se retienen los cupos mientras el pago PSE está pendiente
+BOOKING_HOLD_MINUTES = int(os.environ.get("BOOKING_HOLD_MINUTES", 30))
+
+# 🔹 Ventana (ms) para agrupar typing/entradas/salidas en un solo frame (0 = sin agrupar)
+WS_BATCH_INTERVAL_MS = int(os.environ.get("WS_BATCH_INTERVAL_MS", 250))
+
+# 🔹 Presencia en canales: expira sin heartbeat (ping) y las salidas se
+# anuncian tras una gracia para absorber reconexiones
+PRESENCE_TTL_SECONDS = int(os.environ.get("PRESENCE_TTL_SECONDS", 60))
+PRESENCE_DEBOUNCE_SECONDS = int(os.environ.get("PRESENCE_DEBOUNCE_SECONDS", 5))
+
+# 🔹 Reanudación del websocket (`since`): posts por frame y tope antes de pasar a HTTP
+WS_RESUME_PAGE_SIZE = int(os.environ.get("WS_RESUME_PAGE_SIZE", 100))
+WS_RESUME_MAX_POSTS = int(os.environ.get("WS_RESUME_MAX_POSTS", 500))
+
+# 🔹 Feed de inicio: "merge" (UNION ALL por comunidad en lectura) o
+# "timeline" (fan-out en escritura a un ZSET por usuario en Redis)
+COMMUNITY_FEED_STRATEGY = os.environ.get("COMMUNITY_FEED_STRATEGY", "merge")
+COMMUNITY_FEED_TIMELINE_SIZE = int(os.environ.get("COMMUNITY_FEED_TIMELINE_SIZE", 500))
+
+REDIS_URL = config("REDIS_URL")
+
 CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
         "CONFIG": {
-            "hosts": [config("REDIS_URL")],
+            "hosts": [REDIS_URL],
         },
     },
 }
+
+# 🔹 Cache compartido (mismo Redis que channels)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "inira",
+        "TIMEOUT": 300,
+    },
+}